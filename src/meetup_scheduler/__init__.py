@@ -13,8 +13,6 @@
 #
 ##############################################################################
 
-from __future__ import annotations
-
 from meetup_scheduler.__version__ import __version__
 
 __all__ = ["__version__"]
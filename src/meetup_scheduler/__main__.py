@@ -20,6 +20,14 @@ import sys
 
 def main() -> int:
     """Single entry point - creates App and runs it."""
+    # Answer a bare --version without building the argument parser;
+    # the output matches argparse's version action.
+    if sys.argv[1:] == ["--version"]:
+        from meetup_scheduler.__version__ import __version__
+
+        print(f"meetup-scheduler {__version__}")
+        return 0
+
     from meetup_scheduler.app import App
 
     try:
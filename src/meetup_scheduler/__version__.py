@@ -16,9 +16,15 @@
 from __future__ import annotations
 
 try:
-    from importlib.metadata import version as _version
+    # Generated by the hatch version build hook; always present in a
+    # built wheel or an editable install.
+    from meetup_scheduler._version import __version__
+except ImportError:
+    # Plain source checkout: fall back to installed metadata (slow import).
+    try:
+        from importlib.metadata import version
 
-    __version__ = _version("meetup-scheduler")
-except Exception:
-    # Package not installed, use development version
-    __version__ = "0.1.0.dev0"
+        __version__ = version("meetup-scheduler")
+    except Exception:
+        # Package not installed, use development version
+        __version__ = "0.1.0.dev0"
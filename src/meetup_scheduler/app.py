@@ -15,26 +15,25 @@
 
 from __future__ import annotations
 
-import argparse
-import logging
+import importlib
+import itertools
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Final
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    import argparse
+    import logging
+    from collections.abc import Iterator, Sequence
+
+    from rich.console import Console
+
+    from meetup_scheduler.auth.oauth import OAuthFlow
+    from meetup_scheduler.auth.tokens import TokenManager
+    from meetup_scheduler.commands.base import BaseCommand
+    from meetup_scheduler.config.manager import ConfigManager
+    from meetup_scheduler.resources.readme import ReadmeReader
 
 from meetup_scheduler.__version__ import __version__
-from meetup_scheduler.commands.base import CommandError
-from meetup_scheduler.commands.config_cmd import ConfigCommand
-from meetup_scheduler.commands.generate_cmd import GenerateCommand
-from meetup_scheduler.commands.init_cmd import InitCommand
-from meetup_scheduler.commands.login_cmd import LoginCommand
-from meetup_scheduler.commands.logout_cmd import LogoutCommand
-from meetup_scheduler.commands.readme_cmd import ReadmeCommand
-from meetup_scheduler.commands.schedule_cmd import ScheduleCommand
-from meetup_scheduler.commands.sync_cmd import SyncCommand
-from meetup_scheduler.config.manager import ConfigManager
-from meetup_scheduler.metadata import get_homepage_url
 
 
 class App:
@@ -56,11 +55,26 @@ class App:
                 This allows tests to distinguish "not specified" from "explicitly
                 set to False". Production code should use the default (False).
         """
-        self._raw_args = args if args is not None else sys.argv[1:]
+        # None means sys.argv[1:]; it's left to argparse to slice sys.argv
+        self._raw_args = args
         self._testing = _testing
+        self._parser: argparse.ArgumentParser | None = None
         self._args: argparse.Namespace | None = None
         self._logger: logging.Logger | None = None
         self._config_manager: ConfigManager | None = None
+        self._readme_reader: ReadmeReader | None = None
+        self._token_manager: TokenManager | None = None
+        self._oauth_flow: OAuthFlow | None = None
+        self._console: Console | None = None
+
+    @property
+    def parser(self) -> argparse.ArgumentParser:
+        """Return the argument parser, creating it if needed."""
+        if self._parser is None:
+            self._parser = self._create_parser(
+                _testing=self._testing, command=self._find_command()
+            )
+        return self._parser
 
     @property
     def args(self) -> argparse.Namespace:
@@ -80,28 +94,81 @@ class App:
     def config_manager(self) -> ConfigManager:
         """Return the configuration manager."""
         if self._config_manager is None:
+            from meetup_scheduler.config.manager import ConfigManager
+
             self._config_manager = ConfigManager()
         return self._config_manager
 
-    def _create_parser(self, *, _testing: bool = False) -> argparse.ArgumentParser:
-        """Create the argument parser with all options.
+    @property
+    def readme_reader(self) -> ReadmeReader:
+        """Return the README reader, shared so the README is loaded once."""
+        if self._readme_reader is None:
+            from meetup_scheduler.resources.readme import ReadmeReader
+
+            self._readme_reader = ReadmeReader()
+        return self._readme_reader
+
+    @property
+    def token_manager(self) -> TokenManager:
+        """Return the token manager for the user's stored credentials."""
+        if self._token_manager is None:
+            from meetup_scheduler.auth.tokens import TokenManager
+
+            self._token_manager = TokenManager(self.config_manager)
+        return self._token_manager
+
+    @property
+    def oauth_flow(self) -> OAuthFlow:
+        """Return the OAuth flow used to log in to Meetup."""
+        if self._oauth_flow is None:
+            from meetup_scheduler.auth.oauth import OAuthFlow
+
+            self._oauth_flow = OAuthFlow()
+        return self._oauth_flow
+
+    @property
+    def console(self) -> Console:
+        """Return the rich Console that commands print through.
+
+        rich is imported, and the console created, on first use, so runs
+        that don't print with rich don't pay for it.
+        """
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
+
+    def _create_parser(
+        self, *, _testing: bool = False, command: str | None = None
+    ) -> argparse.ArgumentParser:
+        """Create the argument parser.
 
         Args:
             _testing: If True, boolean options default to None instead of False.
                 This allows tests to distinguish "not specified" from "explicitly
                 set to False". Production code should use the default (False).
+            command: If given, only the subparser for this command is built.
+                Otherwise subparsers for all commands are built.
         """
-        # Build epilog with homepage URL if available
-        homepage = get_homepage_url()
-        epilog = f"For more information, visit: {homepage}" if homepage else None
+        import argparse
 
         parser = argparse.ArgumentParser(
             prog="meetup-scheduler",
             description="Batch-create Meetup.com events from JSON specifications",
-            epilog=epilog,
-            formatter_class=argparse.RawDescriptionHelpFormatter,
         )
 
+        # The epilog and description formatting only matter for top-level
+        # help, which can't be requested once a command has been found; in
+        # that case skip them, and especially the (slow) metadata lookup.
+        if command is None:
+            from meetup_scheduler.metadata import get_homepage_url
+
+            homepage = get_homepage_url()
+            if homepage:
+                parser.epilog = f"For more information, visit: {homepage}"
+            parser.formatter_class = argparse.RawDescriptionHelpFormatter
+
         # Default for boolean options: False in production, None in testing
         bool_default = None if _testing else False
 
@@ -152,7 +219,33 @@ class App:
             description="Available commands",
         )
 
-        # init command
+        builders = {
+            "init": self._add_init_parser,
+            "login": self._add_login_parser,
+            "logout": self._add_logout_parser,
+            "config": self._add_config_parser,
+            "sync": self._add_sync_parser,
+            "schedule": self._add_schedule_parser,
+            "generate": self._add_generate_parser,
+            "readme": self._add_readme_parser,
+        }
+        if command in builders:
+            builders[command](subparsers, bool_default)
+        else:
+            for builder in builders.values():
+                builder(subparsers, bool_default)
+
+        return parser
+
+    def _add_init_parser(self, subparsers: Any, bool_default: bool | None) -> None:
+        """Add the init command parser.
+
+        Args:
+            subparsers: Subparsers action of the main parser.
+            bool_default: Default value for boolean options.
+        """
+        import argparse
+
         init_parser = subparsers.add_parser(
             "init",
             help="Initialize project directory",
@@ -170,7 +263,13 @@ class App:
             help="Overwrite existing files",
         )
 
-        # login command
+    def _add_login_parser(self, subparsers: Any, bool_default: bool | None) -> None:
+        """Add the login command parser.
+
+        Args:
+            subparsers: Subparsers action of the main parser.
+            bool_default: Default value for boolean options.
+        """
         login_parser = subparsers.add_parser(
             "login",
             help="Authenticate with Meetup (opens browser)",
@@ -182,13 +281,27 @@ class App:
             help="Port for OAuth callback (default: 8080)",
         )
 
-        # logout command
+    def _add_logout_parser(self, subparsers: Any, bool_default: bool | None) -> None:
+        """Add the logout command parser.
+
+        Args:
+            subparsers: Subparsers action of the main parser.
+            bool_default: Default value for boolean options.
+        """
         subparsers.add_parser(
             "logout",
             help="Remove stored Meetup credentials",
         )
 
-        # config command
+    def _add_config_parser(self, subparsers: Any, bool_default: bool | None) -> None:
+        """Add the config command parser.
+
+        Args:
+            subparsers: Subparsers action of the main parser.
+            bool_default: Default value for boolean options.
+        """
+        import argparse
+
         config_parser = subparsers.add_parser(
             "config",
             help="Get or set configuration values",
@@ -216,7 +329,15 @@ class App:
             help="Open configuration in editor",
         )
 
-        # sync command
+    def _add_sync_parser(self, subparsers: Any, bool_default: bool | None) -> None:
+        """Add the sync command parser.
+
+        Args:
+            subparsers: Subparsers action of the main parser.
+            bool_default: Default value for boolean options.
+        """
+        import argparse
+
         sync_parser = subparsers.add_parser(
             "sync",
             help="Fetch group/venue data from Meetup API",
@@ -238,8 +359,20 @@ class App:
             default=bool_default,
             help="Only fetch venue information",
         )
+        sync_parser.add_argument(
+            "--full",
+            action=argparse.BooleanOptionalAction,
+            default=bool_default,
+            help="Refetch all N years of events, not just those since the last sync",
+        )
+
+    def _add_schedule_parser(self, subparsers: Any, bool_default: bool | None) -> None:
+        """Add the schedule command parser.
 
-        # schedule command
+        Args:
+            subparsers: Subparsers action of the main parser.
+            bool_default: Default value for boolean options.
+        """
         schedule_parser = subparsers.add_parser(
             "schedule",
             help="Create events from JSON file",
@@ -268,7 +401,13 @@ class App:
             help="Series linking mode (default: independent)",
         )
 
-        # generate command
+    def _add_generate_parser(self, subparsers: Any, bool_default: bool | None) -> None:
+        """Add the generate command parser.
+
+        Args:
+            subparsers: Subparsers action of the main parser.
+            bool_default: Default value for boolean options.
+        """
         generate_parser = subparsers.add_parser(
             "generate",
             help="Generate event JSON from recurrence pattern",
@@ -320,7 +459,15 @@ class App:
             help="Event start time (e.g., '17:30' or '17:30:00')",
         )
 
-        # readme command
+    def _add_readme_parser(self, subparsers: Any, bool_default: bool | None) -> None:
+        """Add the readme command parser.
+
+        Args:
+            subparsers: Subparsers action of the main parser.
+            bool_default: Default value for boolean options.
+        """
+        import argparse
+
         readme_parser = subparsers.add_parser(
             "readme",
             help="Display README documentation",
@@ -334,7 +481,8 @@ class App:
         readme_parser.add_argument(
             "--pager",
             action=argparse.BooleanOptionalAction,
-            default=True if not _testing else bool_default,
+            # Enabled by default, except in testing (see _create_parser)
+            default=None if bool_default is None else True,
             help="Use pager for long output (default: enabled)",
         )
         readme_parser.add_argument(
@@ -343,15 +491,40 @@ class App:
             help="Display only the specified section (e.g., oauth-setup)",
         )
 
-        return parser
+    def _find_command(self) -> str | None:
+        """Find the command named in the raw arguments, without a full parse.
+
+        Returns:
+            The command name, or None if there is no known command, or if
+            top-level help is requested (which needs every subparser).
+        """
+        if self._raw_args is None:
+            args: Iterator[str] = itertools.islice(sys.argv, 1, None)
+        else:
+            args = iter(self._raw_args)
+        for arg in args:
+            if arg.startswith("--"):
+                if len(arg) > 2 and "--help".startswith(arg):
+                    return None
+                # --config takes a value (possibly abbreviated, e.g. --conf)
+                if "=" not in arg and len(arg) > 2 and "--config".startswith(arg):
+                    next(args, None)
+                continue
+            if arg.startswith("-") and arg != "-":
+                if "h" in arg:
+                    return None
+                continue
+            return arg if arg in self.COMMANDS else None
+        return None
 
     def _parse_arguments(self) -> argparse.Namespace:
         """Parse command-line arguments."""
-        parser = self._create_parser(_testing=self._testing)
-        return parser.parse_args(self._raw_args)
+        return self.parser.parse_args(self._raw_args)
 
     def _setup_logging(self) -> logging.Logger:
         """Configure and return the application logger."""
+        import logging
+
         logger = logging.getLogger("meetup_scheduler")
 
         # Determine log level from args
@@ -378,18 +551,43 @@ class App:
 
         return logger
 
-    # Map command names to command classes
-    COMMANDS: dict[str, type] = {
-        "init": InitCommand,
-        "login": LoginCommand,
-        "logout": LogoutCommand,
-        "config": ConfigCommand,
-        "sync": SyncCommand,
-        "readme": ReadmeCommand,
-        "schedule": ScheduleCommand,
-        "generate": GenerateCommand,
+    # Map command names to (module, class) of the command implementation.
+    # Modules are imported only when their command runs, so that startup
+    # doesn't pay for the dependencies of every command.
+    COMMANDS: Final[dict[str, tuple[str, str]]] = {
+        "init": ("meetup_scheduler.commands.init_cmd", "InitCommand"),
+        "login": ("meetup_scheduler.commands.login_cmd", "LoginCommand"),
+        "logout": ("meetup_scheduler.commands.logout_cmd", "LogoutCommand"),
+        "config": ("meetup_scheduler.commands.config_cmd", "ConfigCommand"),
+        "sync": ("meetup_scheduler.commands.sync_cmd", "SyncCommand"),
+        "readme": ("meetup_scheduler.commands.readme_cmd", "ReadmeCommand"),
+        "schedule": ("meetup_scheduler.commands.schedule_cmd", "ScheduleCommand"),
+        "generate": ("meetup_scheduler.commands.generate_cmd", "GenerateCommand"),
     }
 
+    def _resolve_command(self, command_name: str) -> type[BaseCommand] | None:
+        """Return the command class for a command name.
+
+        Only the module implementing the command is imported.
+
+        Args:
+            command_name: Name of the command.
+
+        Returns:
+            The command class, or None if the command is not known.
+        """
+        spec = self.COMMANDS.get(command_name)
+        if spec is None:
+            return None
+        if not isinstance(spec, tuple):
+            # Already a class (tests substitute commands this way)
+            return spec
+        module_name, class_name = spec
+        command_class: type[BaseCommand] = getattr(
+            importlib.import_module(module_name), class_name
+        )
+        return command_class
+
     def run(self) -> int:
         """Run the application and return exit code."""
         try:
@@ -401,11 +599,11 @@ class App:
 
             if command_name is None:
                 # No command specified, show help
-                self._create_parser().print_help()
+                self.parser.print_help()
                 return 0
 
             # Look up command class
-            command_class = self.COMMANDS.get(command_name)
+            command_class = self._resolve_command(command_name)
 
             if command_class is None:
                 # Command not yet implemented
@@ -416,13 +614,16 @@ class App:
             command = command_class(self, self.args)
             return command.execute()
 
-        except CommandError as e:
-            self.log.error(str(e))
-            return 1
         except self.Error as e:
             self.log.error(str(e))
             return 1
         except Exception as e:
+            # Imported here so that startup doesn't load the commands package
+            from meetup_scheduler.commands.base import CommandError
+
+            if isinstance(e, CommandError):
+                self.log.error(str(e))
+                return 1
             if self.args.debug:
                 raise
             self.log.error(f"Unexpected error: {e}")
@@ -13,10 +13,31 @@
 #
 ##############################################################################
 
-from __future__ import annotations
+import importlib
+from typing import TYPE_CHECKING
 
-from meetup_scheduler.auth.oauth import OAuthFlow
-from meetup_scheduler.auth.server import CallbackServer
-from meetup_scheduler.auth.tokens import TokenManager
+if TYPE_CHECKING:
+    from meetup_scheduler.auth.oauth import OAuthFlow
+    from meetup_scheduler.auth.server import CallbackServer
+    from meetup_scheduler.auth.tokens import TokenManager
 
 __all__ = ["CallbackServer", "OAuthFlow", "TokenManager"]
+
+# Exported names and the submodules defining them. They are imported on
+# first access (PEP 562), so that importing one submodule, e.g. tokens for
+# logout, doesn't also load the HTTP server and OAuth client.
+_SUBMODULES = {
+    "CallbackServer": "meetup_scheduler.auth.server",
+    "OAuthFlow": "meetup_scheduler.auth.oauth",
+    "TokenManager": "meetup_scheduler.auth.tokens",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import an exported class on first access."""
+    module_name = _SUBMODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
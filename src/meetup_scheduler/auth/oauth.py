@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 
+import atexit
 import os
 import secrets
 from typing import Any
@@ -34,6 +35,19 @@ class OAuthFlow:
     AUTHORIZE_URL = "https://secure.meetup.com/oauth2/authorize"
     TOKEN_URL = "https://secure.meetup.com/oauth2/access"
 
+    # Timeout for token endpoint requests, in seconds
+    TIMEOUT = 30.0
+
+    # Headers for token endpoint requests (bodies are pre-encoded forms)
+    TOKEN_HEADERS = {
+        "Accept": "application/json",
+        "Content-Type": "application/x-www-form-urlencoded",
+    }
+
+    # HTTP client shared by all instances, so that a refresh after an
+    # exchange (or repeated refreshes) reuse the TLS connection
+    _client: httpx.Client | None = None
+
     # Default OAuth credentials (can be overridden via environment)
     # These are placeholder values - real values are set by app developers
     _DEFAULT_CLIENT_ID = ""
@@ -68,6 +82,14 @@ class OAuthFlow:
             or self._DEFAULT_CLIENT_SECRET
         )
 
+        # The client fields of the token request bodies never change, so
+        # encode them once; each request only appends its own fields.
+        client_form = urlencode(
+            {"client_id": self._client_id, "client_secret": self._client_secret}
+        )
+        self._exchange_form = f"grant_type=authorization_code&{client_form}"
+        self._refresh_form = f"grant_type=refresh_token&{client_form}"
+
     @property
     def client_id(self) -> str:
         """Return the OAuth client ID."""
@@ -82,6 +104,21 @@ class OAuthFlow:
         """
         return bool(self._client_id and self._client_secret)
 
+    @classmethod
+    def _get_client(cls) -> httpx.Client:
+        """Return the shared HTTP client, creating it on first use.
+
+        Returns:
+            HTTP client for the token endpoint.
+        """
+        if cls._client is None:
+            cls._client = httpx.Client(
+                timeout=cls.TIMEOUT,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60),
+            )
+            atexit.register(cls._client.close)
+        return cls._client
+
     def generate_state(self) -> str:
         """Generate a random state parameter for CSRF protection.
 
@@ -127,20 +164,13 @@ class OAuthFlow:
         Raises:
             Error: If token exchange fails.
         """
-        data = {
-            "grant_type": "authorization_code",
-            "client_id": self._client_id,
-            "client_secret": self._client_secret,
-            "code": code,
-            "redirect_uri": redirect_uri,
-        }
+        body = self._encode_form(
+            self._exchange_form, {"code": code, "redirect_uri": redirect_uri}
+        )
 
         try:
-            response = httpx.post(
-                self.TOKEN_URL,
-                data=data,
-                headers={"Accept": "application/json"},
-                timeout=30.0,
+            response = self._get_client().post(
+                self.TOKEN_URL, content=body, headers=self.TOKEN_HEADERS
             )
         except httpx.RequestError as e:
             raise self.Error(f"Network error during token exchange: {e}") from e
@@ -162,19 +192,11 @@ class OAuthFlow:
         Raises:
             Error: If token refresh fails.
         """
-        data = {
-            "grant_type": "refresh_token",
-            "client_id": self._client_id,
-            "client_secret": self._client_secret,
-            "refresh_token": refresh_token,
-        }
+        body = self._encode_form(self._refresh_form, {"refresh_token": refresh_token})
 
         try:
-            response = httpx.post(
-                self.TOKEN_URL,
-                data=data,
-                headers={"Accept": "application/json"},
-                timeout=30.0,
+            response = self._get_client().post(
+                self.TOKEN_URL, content=body, headers=self.TOKEN_HEADERS
             )
         except httpx.RequestError as e:
             raise self.Error(f"Network error during token refresh: {e}") from e
@@ -184,6 +206,18 @@ class OAuthFlow:
 
         return response.json()
 
+    def _encode_form(self, static_form: str, fields: dict[str, str]) -> bytes:
+        """Encode a token request body.
+
+        Args:
+            static_form: Pre-encoded fields common to all requests of a kind.
+            fields: Fields specific to this request.
+
+        Returns:
+            URL-encoded form body.
+        """
+        return f"{static_form}&{urlencode(fields)}".encode("ascii")
+
     def _handle_error_response(self, response: httpx.Response) -> None:
         """Handle error response from OAuth server.
 
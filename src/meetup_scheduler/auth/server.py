@@ -15,24 +15,78 @@
 
 from __future__ import annotations
 
+import contextlib
 import html
-import threading
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Any
+import select
+import socket
+import time
 from urllib.parse import parse_qs, urlparse
 
 
 class CallbackServer:
     """Local HTTP server for receiving OAuth callbacks.
 
-    Starts a simple HTTP server on localhost to receive the OAuth redirect
-    after the user authenticates with Meetup.
+    Listens on localhost to receive the OAuth redirect after the user
+    authenticates with Meetup. There is no server thread: connections are
+    accepted and answered one at a time by wait_for_callback(), in the
+    calling thread, until the callback arrives.
     """
 
     DEFAULT_HOST = "127.0.0.1"
     DEFAULT_PORT = 8080
     CALLBACK_PATH = "/callback"
 
+    # Time a connected client has to send its request (browsers may open
+    # speculative connections that never send anything)
+    REQUEST_TIMEOUT = 5.0
+
+    # Maximum size of request line plus headers that we read
+    MAX_REQUEST_SIZE = 16384
+
+    # Head of every response; status and Content-Length are filled in.
+    # Only the headers the browser needs: no Server or Date, and the
+    # connection is always closed after one response.
+    RESPONSE_HEAD = (
+        "HTTP/1.0 {status}\r\n"
+        "Content-Type: text/html; charset=utf-8\r\n"
+        "Content-Length: {length}\r\n"
+        "Connection: close\r\n"
+        "\r\n"
+    )
+
+    SUCCESS_HTML = b"""<!DOCTYPE html>
+<html>
+<head><title>Authentication Successful</title></head>
+<body style="font-family: sans-serif; text-align: center; padding: 50px;">
+<h1>&#10003; Authentication Successful</h1>
+<p>You can close this window and return to the terminal.</p>
+</body>
+</html>"""
+
+    ERROR_HTML = """<!DOCTYPE html>
+<html>
+<head><title>Authentication Failed</title></head>
+<body style="font-family: sans-serif; text-align: center; padding: 50px;">
+<h1>&#10007; Authentication Failed</h1>
+<p>{message}</p>
+<p>Please close this window and try again.</p>
+</body>
+</html>"""
+
+    # Fixed responses, encoded once
+    SUCCESS_RESPONSE = (
+        RESPONSE_HEAD.format(status="200 OK", length=len(SUCCESS_HTML)).encode("ascii")
+        + SUCCESS_HTML
+    )
+    NOT_FOUND_RESPONSE = (
+        RESPONSE_HEAD.format(status="404 Not Found", length=len(b"Not Found")).encode("ascii")
+        + b"Not Found"
+    )
+    BAD_REQUEST_RESPONSE = (
+        RESPONSE_HEAD.format(status="400 Bad Request", length=len(b"Bad Request")).encode("ascii")
+        + b"Bad Request"
+    )
+
     class Error(Exception):
         """Exception raised for callback server errors."""
 
@@ -50,15 +104,12 @@ class CallbackServer:
 
         Args:
             host: Host to bind to (default: 127.0.0.1).
-            port: Port to listen on (default: 8080).
+            port: Port to listen on (default: 8080); 0 lets the OS pick
+                a free port, which redirect_uri reflects once started.
         """
         self._host = host
         self._port = port
-        self._server: HTTPServer | None = None
-        self._thread: threading.Thread | None = None
-        self._result: dict[str, str] | None = None
-        self._error: str | None = None
-        self._event = threading.Event()
+        self._socket: socket.socket | None = None
 
     @property
     def redirect_uri(self) -> str:
@@ -66,99 +117,30 @@ class CallbackServer:
         return f"http://{self._host}:{self._port}{self.CALLBACK_PATH}"
 
     def start(self) -> None:
-        """Start the callback server in a background thread."""
-        if self._server is not None:
+        """Start listening for the callback."""
+        if self._socket is not None:
             raise self.Error("Server already running")
 
-        # Create request handler that captures the callback
-        server_instance = self
-
-        class CallbackHandler(BaseHTTPRequestHandler):
-            """Handler for OAuth callback requests."""
-
-            def log_message(self, format: str, *args: Any) -> None:
-                """Suppress default logging."""
-                pass
-
-            def do_GET(self) -> None:  # noqa: N802 -- allow uppercase name; override from BaseHTTPRequestHandler
-                """Handle GET request (OAuth callback)."""
-                parsed = urlparse(self.path)
-
-                if parsed.path != CallbackServer.CALLBACK_PATH:
-                    self.send_error(404, "Not Found")
-                    return
-
-                # Parse query parameters
-                params = parse_qs(parsed.query)
-
-                # Check for error response from OAuth provider
-                if "error" in params:
-                    error = params["error"][0]
-                    error_desc = params.get("error_description", ["Unknown error"])[0]
-                    server_instance._error = f"{error}: {error_desc}"
-                    self._send_error_page(error_desc)
-                    server_instance._event.set()
-                    return
-
-                # Extract code and state
-                code = params.get("code", [None])[0]
-                state = params.get("state", [None])[0]
-
-                if not code:
-                    server_instance._error = "No authorization code received"
-                    self._send_error_page("No authorization code received")
-                    server_instance._event.set()
-                    return
-
-                # Success - store result
-                server_instance._result = {"code": code, "state": state or ""}
-                self._send_success_page()
-                server_instance._event.set()
-
-            def _send_success_page(self) -> None:
-                """Send a success HTML page."""
-                self.send_response(200)
-                self.send_header("Content-Type", "text/html; charset=utf-8")
-                self.end_headers()
-                html_content = """<!DOCTYPE html>
-<html>
-<head><title>Authentication Successful</title></head>
-<body style="font-family: sans-serif; text-align: center; padding: 50px;">
-<h1>&#10003; Authentication Successful</h1>
-<p>You can close this window and return to the terminal.</p>
-</body>
-</html>"""
-                self.wfile.write(html_content.encode("utf-8"))
-
-            def _send_error_page(self, message: str) -> None:
-                """Send an error HTML page."""
-                self.send_response(400)
-                self.send_header("Content-Type", "text/html; charset=utf-8")
-                self.end_headers()
-                safe_message = html.escape(message)
-                html_content = f"""<!DOCTYPE html>
-<html>
-<head><title>Authentication Failed</title></head>
-<body style="font-family: sans-serif; text-align: center; padding: 50px;">
-<h1>&#10007; Authentication Failed</h1>
-<p>{safe_message}</p>
-<p>Please close this window and try again.</p>
-</body>
-</html>"""
-                self.wfile.write(html_content.encode("utf-8"))
-
-        # Create and start server
+        # create_server() sets SO_REUSEADDR on POSIX, so a port left in
+        # TIME_WAIT by a previous login can be reused immediately. We don't
+        # fall back to some other port when this one is busy: the redirect
+        # URI must match the one registered with Meetup.
         try:
-            self._server = HTTPServer((self._host, self._port), CallbackHandler)
+            self._socket = socket.create_server((self._host, self._port))
         except OSError as e:
-            raise self.Error(f"Failed to start server on {self._host}:{self._port}: {e}") from e
+            raise self.Error(
+                f"Failed to start server on {self._host}:{self._port}: {e} "
+                "(use --port to choose another port)"
+            ) from e
 
-        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
-        self._thread.start()
+        # Port 0 asks the OS for a free port; report the one we got
+        self._port = self._socket.getsockname()[1]
 
     def wait_for_callback(self, timeout: float = 300) -> tuple[str, str]:
         """Wait for the OAuth callback.
 
+        Requests for other paths are answered with 404 and ignored.
+
         Args:
             timeout: Maximum time to wait in seconds (default: 5 minutes).
 
@@ -169,31 +151,129 @@ class CallbackServer:
             TimeoutError: If callback not received within timeout.
             Error: If callback contains an error.
         """
-        if self._server is None:
+        if self._socket is None:
             raise self.Error("Server not started")
 
-        # Wait for callback
-        if not self._event.wait(timeout):
-            raise self.TimeoutError(
-                f"Authentication timed out after {timeout} seconds. "
-                "Please try again."
-            )
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([self._socket], [], [], remaining)[0]:
+                raise self.TimeoutError(
+                    f"Authentication timed out after {timeout} seconds. "
+                    "Please try again."
+                )
+
+            try:
+                conn, _ = self._socket.accept()
+            except OSError:
+                continue
+
+            with conn:
+                result = self._handle_connection(conn)
+            if result is not None:
+                return result
 
-        # Check for error
-        if self._error:
-            raise self.Error(self._error)
+    def stop(self) -> None:
+        """Stop the callback server."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
 
-        # Return result
-        if self._result is None:
-            raise self.Error("No callback received")
+    def _handle_connection(self, conn: socket.socket) -> tuple[str, str] | None:
+        """Read one request from a client connection and answer it.
 
-        return self._result["code"], self._result["state"]
+        Args:
+            conn: Accepted client connection.
 
-    def stop(self) -> None:
-        """Stop the callback server."""
-        if self._server is not None:
-            self._server.shutdown()
-            self._server = None
-        if self._thread is not None:
-            self._thread.join(timeout=1)
-            self._thread = None
+        Returns:
+            Tuple of (authorization_code, state) if this was the callback,
+            or None if it was some other request (or no request at all).
+
+        Raises:
+            Error: If the callback reports an error or lacks a code.
+        """
+        request_line = self._read_request_line(conn)
+        if request_line is None:
+            return None
+
+        parts = request_line.split()
+        if len(parts) != 3 or parts[0] != "GET":
+            self._send_response(conn, self.BAD_REQUEST_RESPONSE)
+            return None
+
+        parsed = urlparse(parts[1])
+        if parsed.path != self.CALLBACK_PATH:
+            self._send_response(conn, self.NOT_FOUND_RESPONSE)
+            return None
+
+        # Parse query parameters
+        params = parse_qs(parsed.query)
+
+        # Check for error response from OAuth provider
+        if "error" in params:
+            error = params["error"][0]
+            error_desc = params.get("error_description", ["Unknown error"])[0]
+            self._send_error_page(conn, error_desc)
+            raise self.Error(f"{error}: {error_desc}")
+
+        # Extract code and state
+        code = params.get("code", [None])[0]
+        state = params.get("state", [None])[0]
+
+        if not code:
+            self._send_error_page(conn, "No authorization code received")
+            raise self.Error("No authorization code received")
+
+        self._send_response(conn, self.SUCCESS_RESPONSE)
+        return code, state or ""
+
+    def _read_request_line(self, conn: socket.socket) -> str | None:
+        """Read the request head from a connection.
+
+        The whole head is read, so that closing the connection after the
+        response doesn't reset it while the client still has data in flight.
+
+        Args:
+            conn: Accepted client connection.
+
+        Returns:
+            The request line, or None if the client sent no complete request.
+        """
+        conn.settimeout(self.REQUEST_TIMEOUT)
+        data = b""
+        try:
+            while b"\r\n\r\n" not in data and len(data) < self.MAX_REQUEST_SIZE:
+                chunk = conn.recv(4096)
+                if not chunk:
+                    break
+                data += chunk
+        except OSError:
+            return None
+
+        if b"\r\n" not in data:
+            return None
+        return data.split(b"\r\n", 1)[0].decode("latin-1")
+
+    def _send_error_page(self, conn: socket.socket, message: str) -> None:
+        """Send an error HTML page.
+
+        Args:
+            conn: Client connection.
+            message: Error message to show.
+        """
+        body = self.ERROR_HTML.format(message=html.escape(message)).encode("utf-8")
+        head = self.RESPONSE_HEAD.format(status="400 Bad Request", length=len(body))
+        self._send_response(conn, head.encode("ascii") + body)
+
+    def _send_response(self, conn: socket.socket, response: bytes) -> None:
+        """Send a complete HTTP response with a single write.
+
+        Args:
+            conn: Client connection.
+            response: Status line, headers and body.
+        """
+        # If the browser went away, there's nothing more to do for it
+        with contextlib.suppress(OSError):
+            conn.sendall(response)
+            # Signal end of response now, rather than when conn is closed
+            conn.shutdown(socket.SHUT_WR)
@@ -15,7 +15,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import os
+import time
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -45,6 +46,8 @@ class TokenManager:
         """
         self._config_manager = config_manager
         self._oauth_flow: Any = None  # Lazy import to avoid circular dependency
+        self._credentials: dict[str, Any] | None = None
+        self._credentials_stamp: tuple[int, int] | None = None
 
     @property
     def is_authenticated(self) -> bool:
@@ -53,7 +56,7 @@ class TokenManager:
         Returns:
             True if we have tokens and they're not expired (or can be refreshed).
         """
-        credentials = self._config_manager.load_credentials()
+        credentials = self._load_credentials()
 
         # Check if we have basic token data
         if not credentials.get("access_token"):
@@ -73,7 +76,7 @@ class TokenManager:
         Returns:
             True if credentials file contains token data.
         """
-        credentials = self._config_manager.load_credentials()
+        credentials = self._load_credentials()
         return bool(credentials.get("access_token"))
 
     def get_access_token(self) -> str | None:
@@ -85,7 +88,7 @@ class TokenManager:
         Raises:
             Error: If token refresh fails.
         """
-        credentials = self._config_manager.load_credentials()
+        credentials = self._load_credentials()
 
         if not credentials.get("access_token"):
             return None
@@ -97,7 +100,7 @@ class TokenManager:
 
             # Refresh the tokens
             self._refresh(credentials["refresh_token"])
-            credentials = self._config_manager.load_credentials()
+            credentials = self._load_credentials()
 
         return credentials.get("access_token")
 
@@ -113,7 +116,7 @@ class TokenManager:
         """
         # Calculate expiration time
         expires_in = tokens.get("expires_in", 3600)
-        expires_at = datetime.now(timezone.utc).timestamp() + expires_in
+        expires_at = time.time() + expires_in
 
         credentials = {
             "access_token": tokens["access_token"],
@@ -123,10 +126,32 @@ class TokenManager:
         }
 
         self._config_manager.save_credentials(credentials)
+        self._credentials = None
 
     def clear_tokens(self) -> None:
         """Remove all stored tokens."""
         self._config_manager.save_credentials({})
+        self._credentials = None
+
+    def _load_credentials(self) -> dict[str, Any]:
+        """Load credentials, reusing the last result while the file is unchanged.
+
+        The file's modification time and size are checked on each call, so
+        changes made by another process are still picked up.
+
+        Returns:
+            Credentials dictionary. Empty dict if file doesn't exist.
+        """
+        try:
+            st = os.stat(self._config_manager.credentials_path)
+            stamp: tuple[int, int] | None = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+
+        if self._credentials is None or stamp != self._credentials_stamp:
+            self._credentials = self._config_manager.load_credentials()
+            self._credentials_stamp = stamp
+        return self._credentials
 
     def _is_expired(self, credentials: dict[str, Any]) -> bool:
         """Check if the access token is expired or expiring soon.
@@ -143,7 +168,7 @@ class TokenManager:
             return False
 
         # Check if expired (with buffer)
-        now = datetime.now(timezone.utc).timestamp()
+        now = time.time()
         return now >= (expires_at - self.EXPIRATION_BUFFER_SECONDS)
 
     def _refresh(self, refresh_token: str) -> None:
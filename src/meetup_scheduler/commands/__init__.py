@@ -13,10 +13,32 @@
 #
 ##############################################################################
 
-from __future__ import annotations
+import importlib
+from typing import TYPE_CHECKING
 
-from meetup_scheduler.commands.base import BaseCommand, CommandError
-from meetup_scheduler.commands.config_cmd import ConfigCommand
-from meetup_scheduler.commands.init_cmd import InitCommand
+if TYPE_CHECKING:
+    from meetup_scheduler.commands.base import BaseCommand, CommandError
+    from meetup_scheduler.commands.config_cmd import ConfigCommand
+    from meetup_scheduler.commands.init_cmd import InitCommand
 
 __all__ = ["BaseCommand", "CommandError", "ConfigCommand", "InitCommand"]
+
+# Exported names and the submodules defining them. They are imported on
+# first access (PEP 562): every command module imports commands.base, and
+# that shouldn't drag in the other commands and their dependencies.
+_SUBMODULES = {
+    "BaseCommand": "meetup_scheduler.commands.base",
+    "CommandError": "meetup_scheduler.commands.base",
+    "ConfigCommand": "meetup_scheduler.commands.config_cmd",
+    "InitCommand": "meetup_scheduler.commands.init_cmd",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import an exported class on first access."""
+    module_name = _SUBMODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -20,6 +20,8 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from rich.console import Console
+
     from meetup_scheduler.app import App
 
 
@@ -55,6 +57,11 @@ class BaseCommand(ABC):
         """Return parsed arguments."""
         return self._args
 
+    @property
+    def console(self) -> Console:
+        """Return the app's rich Console, shared by all commands."""
+        return self.app.console
+
     @abstractmethod
     def execute(self) -> int:
         """Execute the command, return exit code.
@@ -16,8 +16,8 @@
 from __future__ import annotations
 
 import json
+import math
 import os
-import subprocess
 import sys
 from typing import TYPE_CHECKING
 
@@ -39,6 +39,10 @@ class ConfigCommand(BaseCommand):
         config --edit             Open configuration in editor
     """
 
+    # First characters of anything json.loads() accepts (after whitespace),
+    # including its NaN and Infinity extensions
+    JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
     def __init__(self, app: App, args: argparse.Namespace) -> None:
         """Initialize the command."""
         super().__init__(app, args)
@@ -53,13 +57,14 @@ class ConfigCommand(BaseCommand):
             CommandError: If the operation fails.
         """
         # Determine which mode we're in
-        if getattr(self.args, "list", False):
+        args = vars(self.args)
+        if args.get("list"):
             return self._list_config()
-        elif getattr(self.args, "edit", False):
+        elif args.get("edit"):
             return self._edit_config()
-        elif getattr(self.args, "key", None):
-            key = self.args.key
-            value = getattr(self.args, "value", None)
+        elif args.get("key"):
+            key = args["key"]
+            value = args.get("value")
             if value is not None:
                 return self._set_value(key, value)
             else:
@@ -87,7 +92,7 @@ class ConfigCommand(BaseCommand):
 
         # Format output based on type
         if isinstance(value, dict):
-            print(json.dumps(value, indent=2))
+            self._print_json(value)
         else:
             print(value)
 
@@ -125,13 +130,50 @@ class ConfigCommand(BaseCommand):
 
         Returns:
             Parsed value.
+
+        Raises:
+            Error: If the value is JSON containing NaN or an infinite
+                number, which can't be stored as JSON.
         """
+        # Most values are plain strings; only try the JSON parser (and pay
+        # for its exception) when the value could start a JSON document
+        stripped = value.lstrip()
+        if not stripped or stripped[0] not in self.JSON_START_CHARS:
+            return value
+
         # Try parsing as JSON for complex types
         try:
-            return json.loads(value)
+            return json.loads(
+                value,
+                parse_float=self._parse_finite_float,
+                parse_constant=self._reject_constant,
+            )
         except json.JSONDecodeError:
             # Not valid JSON, return as string
             return value
+        except ValueError as e:
+            raise self.Error(f"Invalid value {value!r}: {e}") from None
+
+    @staticmethod
+    def _parse_finite_float(text: str) -> float:
+        """Parse a JSON number with a fraction or exponent, if it's finite.
+
+        Raises:
+            ValueError: If the number is too large for a float.
+        """
+        number = float(text)
+        if not math.isfinite(number):
+            raise ValueError(f"{text} is out of range")
+        return number
+
+    @staticmethod
+    def _reject_constant(name: str) -> float:
+        """Reject json's NaN and Infinity extensions.
+
+        Raises:
+            ValueError: Always.
+        """
+        raise ValueError(f"{name} isn't allowed in JSON")
 
     def _list_config(self) -> int:
         """List all configuration values.
@@ -149,9 +191,21 @@ class ConfigCommand(BaseCommand):
             return 0
 
         # Output as formatted JSON
-        print(json.dumps(merged, indent=2))
+        self._print_json(merged)
         return 0
 
+    def _print_json(self, value: dict) -> None:
+        """Print a value to stdout as indented JSON.
+
+        The encoder writes to stdout as it goes, rather than building the
+        whole document as a string first.
+
+        Args:
+            value: Value to print.
+        """
+        json.dump(value, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
     def _edit_config(self) -> int:
         """Open configuration file in editor.
 
@@ -161,6 +215,9 @@ class ConfigCommand(BaseCommand):
         Raises:
             CommandError: If no editor is available.
         """
+        import shutil
+        import subprocess
+
         config_manager = self.app.config_manager
 
         # Ensure user config directory exists
@@ -180,17 +237,9 @@ class ConfigCommand(BaseCommand):
                 editor = "notepad"
             else:
                 # Try common Unix editors
-                for candidate in ["nano", "vi", "vim"]:
-                    try:
-                        subprocess.run(
-                            ["which", candidate],
-                            capture_output=True,
-                            check=True,
-                        )
-                        editor = candidate
-                        break
-                    except (subprocess.CalledProcessError, FileNotFoundError):
-                        continue
+                editor = next(
+                    (c for c in ("nano", "vi", "vim") if shutil.which(c)), None
+                )
 
         if not editor:
             raise self.Error(
@@ -206,7 +255,8 @@ class ConfigCommand(BaseCommand):
         except FileNotFoundError:
             raise self.Error(f"Editor not found: {editor}") from None
 
-        # Invalidate cache so next read picks up changes
+        # Invalidate cache so next read picks up changes, even an edit that
+        # keeps the file's size within its modification time's resolution
         config_manager._user_config = None
 
         return 0
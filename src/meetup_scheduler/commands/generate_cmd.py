@@ -15,14 +15,15 @@
 
 from __future__ import annotations
 
-import json
 import re
-from datetime import date, datetime, time
+import string
+from datetime import date, datetime, time, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from zoneinfo import ZoneInfo
 
 from meetup_scheduler.commands.base import BaseCommand
+from meetup_scheduler.json_codec import JsonCodec
 from meetup_scheduler.scheduler.recurrence import RecurrenceGenerator
 
 if TYPE_CHECKING:
@@ -39,6 +40,18 @@ class GenerateCommand(BaseCommand):
     then outputs JSON suitable for the schedule command.
     """
 
+    # Duration pattern: captures hours and/or minutes
+    DURATION_PATTERN = re.compile(r"^(?:(\d+)h)?(?:(\d+)m)?$")
+
+    # Fields available to title templates, and their strftime formats
+    TITLE_FIELDS = {
+        "date": "%B %d, %Y",
+        "month": "%B",
+        "year": "%Y",
+        "day": "%d",
+        "weekday": "%A",
+    }
+
     def __init__(self, app: App, args: argparse.Namespace) -> None:
         """Initialize the command."""
         super().__init__(app, args)
@@ -54,15 +67,17 @@ class GenerateCommand(BaseCommand):
             CommandError: If generation fails.
         """
         # Get command arguments
-        pattern = getattr(self.args, "pattern", None)
-        group_urlname = getattr(self.args, "group", None)
-        series_name = getattr(self.args, "series", None)
-        start_str = getattr(self.args, "start", None)
-        end_str = getattr(self.args, "end", None)
-        count = getattr(self.args, "count", 12)
-        output_file = getattr(self.args, "output", None)
-        duration_str = getattr(self.args, "duration", None)
-        time_str = getattr(self.args, "time", None)
+        args = vars(self.args)
+        pattern = args.get("pattern")
+        group_urlname = args.get("group")
+        series_name = args.get("series")
+        start_str = args.get("start")
+        end_str = args.get("end")
+        count = args.get("count", 12)
+        output_file = args.get("output")
+        duration_str = args.get("duration")
+        time_str = args.get("time")
+        today = date.today()
 
         # Validate required arguments
         if not pattern:
@@ -74,17 +89,17 @@ class GenerateCommand(BaseCommand):
         # Parse start date
         if start_str:
             try:
-                start = self._parse_date(start_str)
+                start = self._parse_date(start_str, today=today)
             except ValueError as e:
                 raise self.Error(f"Invalid start date: {e}") from e
         else:
-            start = date.today()
+            start = today
 
         # Parse end date if provided
         end: date | None = None
         if end_str:
             try:
-                end = self._parse_date(end_str)
+                end = self._parse_date(end_str, today=today)
             except ValueError as e:
                 raise self.Error(f"Invalid end date: {e}") from e
 
@@ -110,12 +125,11 @@ class GenerateCommand(BaseCommand):
         # Write output
         if output_file:
             output_path = Path(output_file)
-            output_path.write_text(
-                json.dumps(output, indent=2) + "\n", encoding="utf-8"
-            )
+            with open(output_path, "wb") as f:
+                JsonCodec.dump(output, f)
             self.app.log.info(f"Generated {len(dates)} events to {output_path}")
         else:
-            print(json.dumps(output, indent=2))
+            JsonCodec.dump_stdout(output)
 
         return 0
 
@@ -139,26 +153,29 @@ class GenerateCommand(BaseCommand):
         """
         duration_str = duration_str.strip().lower()
 
-        # Try integer first
-        try:
+        # Plain minutes, the common case
+        if duration_str.isdecimal():
             return int(duration_str)
-        except ValueError:
-            pass
 
         # Try pattern matching for h/m format
-        pattern = r"^(?:(\d+)h)?(?:(\d+)m)?$"
-        match = re.match(pattern, duration_str)
+        match = self.DURATION_PATTERN.match(duration_str)
         if match and (match.group(1) or match.group(2)):
             hours = int(match.group(1)) if match.group(1) else 0
             minutes = int(match.group(2)) if match.group(2) else 0
             return hours * 60 + minutes
 
+        # Anything else int() accepts (e.g. a sign) is still taken as minutes
+        try:
+            return int(duration_str)
+        except ValueError:
+            pass
+
         raise ValueError(
             f"Invalid duration format: {duration_str}. "
             "Use integer minutes, or formats like '2h', '90m', '1h30m'."
         )
 
-    def _parse_date(self, date_str: str) -> date:
+    def _parse_date(self, date_str: str, *, today: date | None = None) -> date:
         """Parse a date string.
 
         Supports formats:
@@ -168,6 +185,7 @@ class GenerateCommand(BaseCommand):
 
         Args:
             date_str: Date string to parse.
+            today: Today's date, if the caller already has it.
 
         Returns:
             Parsed date.
@@ -177,12 +195,19 @@ class GenerateCommand(BaseCommand):
         """
         date_str = date_str.strip().lower()
 
-        if date_str == "today":
-            return date.today()
-        if date_str == "tomorrow":
-            return date.today().replace(day=date.today().day + 1)
+        if date_str in ("today", "tomorrow"):
+            if today is None:
+                today = date.today()
+            return today if date_str == "today" else today + timedelta(days=1)
 
-        # Try ISO format
+        # Try ISO format; strptime also takes dates without zero padding.
+        # fromisoformat() also takes forms like 20250601 and 2025-W23-1,
+        # so it's only given strings shaped like YYYY-MM-DD.
+        if len(date_str) == 10 and date_str[4] == date_str[7] == "-":
+            try:
+                return date.fromisoformat(date_str)
+            except ValueError:
+                pass
         try:
             return datetime.strptime(date_str, "%Y-%m-%d").date()
         except ValueError:
@@ -244,6 +269,24 @@ class GenerateCommand(BaseCommand):
 
         return defaults
 
+    def _title_formats(self, title_template: str) -> dict[str, str]:
+        """Find the title fields used by a title template.
+
+        Args:
+            title_template: Title template, e.g. "Meetup on {date}".
+
+        Returns:
+            Mapping from each field in TITLE_FIELDS that the template uses
+            to its strftime format.
+        """
+        used: set[str] = set()
+        for _, field_name, _, _ in string.Formatter().parse(title_template):
+            if field_name:
+                used.add(re.split(r"[.\[]", field_name, maxsplit=1)[0])
+        return {
+            name: fmt for name, fmt in self.TITLE_FIELDS.items() if name in used
+        }
+
     def _generate_output(
         self, dates: list[date], defaults: dict[str, Any]
     ) -> dict[str, Any]:
@@ -284,32 +327,24 @@ class GenerateCommand(BaseCommand):
         # Include timezone in output defaults so schedule command knows the timezone
         defaults["timezone"] = tz_name
 
-        # Get title template
+        # Get title template, and the formats of the fields it uses
         title_template = defaults.pop("titleTemplate", "Event on {date}")
-
-        # Build events list
-        events: list[dict[str, Any]] = []
-        for event_date in dates:
-            # Create naive datetime first, then localize to get correct offset
-            naive_dt = datetime.combine(event_date, default_time)
-            aware_dt = naive_dt.replace(tzinfo=tz)
-            # Format as ISO 8601 with timezone offset
-            datetime_str = aware_dt.isoformat()
-
-            # Format title
-            title = title_template.format(
-                date=event_date.strftime("%B %d, %Y"),
-                month=event_date.strftime("%B"),
-                year=event_date.strftime("%Y"),
-                day=event_date.strftime("%d"),
-                weekday=event_date.strftime("%A"),
-            )
-
-            event: dict[str, Any] = {
-                "title": title,
-                "startDateTime": datetime_str,
+        title_formats = self._title_formats(title_template)
+
+        # Build events list. The zone is attached as each datetime is built,
+        # so ZoneInfo gives the offset in effect on that date; start times
+        # are ISO 8601 with that offset.
+        events: list[dict[str, Any]] = [
+            {
+                "title": title_template.format(
+                    **{name: event_date.strftime(fmt) for name, fmt in title_formats.items()}
+                ),
+                "startDateTime": datetime.combine(
+                    event_date, default_time, tzinfo=tz
+                ).isoformat(),
             }
-            events.append(event)
+            for event_date in dates
+        ]
 
         # Build output structure
         output: dict[str, Any] = {}
@@ -16,11 +16,14 @@
 from __future__ import annotations
 
 import json
+import os
+import sys
 from importlib import resources
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from meetup_scheduler.commands.base import BaseCommand
+from meetup_scheduler.json_codec import JsonCodec
 
 if TYPE_CHECKING:
     import argparse
@@ -62,6 +65,20 @@ class InitCommand(BaseCommand):
         "meetup-scheduler-local.json",
     ]
 
+    # Contents of a .gitignore that init creates
+    GITIGNORE_BLOCK = "".join(f"{pattern}\n" for pattern in GITIGNORE_PATTERNS).encode()
+
+    # How the source directory check recognizes our pyproject.toml
+    PYPROJECT_NAME_MARKER = b'name = "meetup-scheduler"'
+    PYPROJECT_HEAD_SIZE = 4096
+
+    # Results of _is_source_directory(), by path
+    _source_directory_cache: ClassVar[dict[Path, bool]] = {}
+
+    # Result of _find_source_directory(), once _source_root_known is set
+    _source_root: ClassVar[Path | None] = None
+    _source_root_known: ClassVar[bool] = False
+
     # Default project config template (schema path updated in _create_project_config)
     DEFAULT_PROJECT_CONFIG = {
         "$schema": "./.meetup-scheduler/schemas/config.schema.json",
@@ -71,6 +88,10 @@ class InitCommand(BaseCommand):
         "venueAliases": {},
     }
 
+    # The project config file contents; the template never changes, so it
+    # is encoded once
+    DEFAULT_PROJECT_CONFIG_JSON = JsonCodec.dumps(DEFAULT_PROJECT_CONFIG) + b"\n"
+
     # VS Code settings for JSON schema associations
     VSCODE_SETTINGS = {
         "json.schemas": [
@@ -100,7 +121,8 @@ class InitCommand(BaseCommand):
             CommandError: If initialization fails.
         """
         # Resolve target directory from path argument
-        path_arg = getattr(self.args, "path", ".") or "."
+        args = vars(self.args)
+        path_arg = args.get("path", ".") or "."
         target_dir = Path(path_arg).resolve()
 
         # Check if target is the meetup-scheduler source directory
@@ -118,7 +140,7 @@ class InitCommand(BaseCommand):
             self.app.log.info(f"Created directory: {target_dir}")
 
         self._project_dir = target_dir
-        force = getattr(self.args, "force", False) or False
+        force = args.get("force", False) or False
 
         # Create directories
         self._create_directories()
@@ -147,6 +169,23 @@ class InitCommand(BaseCommand):
         - src/meetup_scheduler/ directory exists
         - pyproject.toml exists and contains 'name = "meetup-scheduler"'
 
+        The answer for each path is remembered for the life of the process,
+        since init may ask about the same directory more than once.
+
+        Args:
+            path: Directory path to check.
+
+        Returns:
+            True if this appears to be the source directory.
+        """
+        cache = InitCommand._source_directory_cache
+        if path not in cache:
+            cache[path] = self._check_source_directory(path)
+        return cache[path]
+
+    def _check_source_directory(self, path: Path) -> bool:
+        """Probe the file system for _is_source_directory().
+
         Args:
             path: Directory path to check.
 
@@ -158,44 +197,44 @@ class InitCommand(BaseCommand):
         if not src_dir.is_dir():
             return False
 
-        # Check for pyproject.toml with our project name
+        # Check for pyproject.toml with our project name. The name is near
+        # the top, so look at the head of the file first.
         pyproject = path / "pyproject.toml"
-        if not pyproject.exists():
-            return False
-
         try:
-            content = pyproject.read_text(encoding="utf-8")
-            # Simple check - look for our project name in the file
-            if 'name = "meetup-scheduler"' in content:
-                return True
+            with open(pyproject, "rb") as f:
+                head = f.read(self.PYPROJECT_HEAD_SIZE)
+                if self.PYPROJECT_NAME_MARKER in head:
+                    return True
+                if len(head) < self.PYPROJECT_HEAD_SIZE:
+                    return False
+                # The name may be further in (or split across the boundary)
+                return self.PYPROJECT_NAME_MARKER in head + f.read()
         except OSError:
-            pass
-
-        return False
+            return False
 
     def _create_directories(self) -> None:
-        """Create the project directory structure."""
-        assert self._project_dir is not None
+        """Create the project directory structure.
 
-        # Create .meetup-scheduler/cache/
-        cache_dir = self._project_dir / self.PROJECT_DIR / self.CACHE_SUBDIR
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        self.app.log.debug(f"Created cache directory: {cache_dir}")
-
-        # Create .meetup-scheduler/schemas/
-        schemas_dir = self._project_dir / self.PROJECT_DIR / self.SCHEMAS_SUBDIR
-        schemas_dir.mkdir(parents=True, exist_ok=True)
-        self.app.log.debug(f"Created schemas directory: {schemas_dir}")
+        On an already initialized project, this checks the directories and
+        returns without attempting any mkdir.
+        """
+        assert self._project_dir is not None
 
-        # Create .vscode/
-        vscode_dir = self._project_dir / self.VSCODE_DIR
-        vscode_dir.mkdir(exist_ok=True)
-        self.app.log.debug(f"Created .vscode directory: {vscode_dir}")
+        project_dir = self._project_dir / self.PROJECT_DIR
+        directories = {
+            "cache": project_dir / self.CACHE_SUBDIR,
+            "schemas": project_dir / self.SCHEMAS_SUBDIR,
+            ".vscode": self._project_dir / self.VSCODE_DIR,
+            "events": self._project_dir / self.EVENTS_DIR,
+        }
+        if all(path.is_dir() for path in directories.values()):
+            self.app.log.debug("Project directories already exist")
+            return
 
-        # Create events/
-        events_dir = self._project_dir / self.EVENTS_DIR
-        events_dir.mkdir(exist_ok=True)
-        self.app.log.debug(f"Created events directory: {events_dir}")
+        # parents=True creates .meetup-scheduler/ along with its subdirectories
+        for name, path in directories.items():
+            path.mkdir(parents=True, exist_ok=True)
+            self.app.log.debug(f"Created {name} directory: {path}")
 
     def _copy_schemas(self, *, force: bool = False) -> None:
         """Copy JSON schemas from package resources to project directory.
@@ -204,27 +243,35 @@ class InitCommand(BaseCommand):
             force: If True, overwrite existing schema files.
         """
         assert self._project_dir is not None
-        schemas_dir = self._project_dir / self.PROJECT_DIR / self.SCHEMAS_SUBDIR
-
-        # Get the schemas from package resources
-        schema_package = resources.files("meetup_scheduler.resources.schemas")
+        # Per-file paths are plain strings, built with os.path.join
+        schemas_dir = str(self._project_dir / self.PROJECT_DIR / self.SCHEMAS_SUBDIR)
 
+        # Find the schemas to copy, listing the directory once rather than
+        # checking each file
+        existing = set() if force else set(os.listdir(schemas_dir))
+        to_copy: list[str] = []
         for schema_name in self.SCHEMA_FILES:
-            dest_path = schemas_dir / schema_name
-
-            if dest_path.exists() and not force:
-                self.app.log.debug(f"Schema already exists: {dest_path}")
-                continue
+            if schema_name in existing:
+                self.app.log.debug(
+                    f"Schema already exists: {os.path.join(schemas_dir, schema_name)}"
+                )
+            else:
+                to_copy.append(schema_name)
 
-            # Read schema from package resources
-            schema_file = schema_package.joinpath(schema_name)
-            schema_content = schema_file.read_text(encoding="utf-8")
+        if not to_copy:
+            self.app.log.info("Schema files already present")
+            return
 
-            # Write to project directory
-            dest_path.write_text(schema_content, encoding="utf-8")
+        # Read the schemas from package resources, then write them to the
+        # project directory. They are copied as bytes, without decoding.
+        schema_package = resources.files("meetup_scheduler.resources.schemas")
+        payloads = {name: (schema_package / name).read_bytes() for name in to_copy}
+        for schema_name, payload in payloads.items():
+            with open(os.path.join(schemas_dir, schema_name), "wb") as f:
+                f.write(payload)
             self.app.log.debug(f"Copied schema: {schema_name}")
 
-        self.app.log.info(f"Copied {len(self.SCHEMA_FILES)} schema files")
+        self.app.log.info(f"Copied {len(payloads)} schema files")
 
     def _create_vscode_settings(self, *, force: bool = False) -> None:
         """Create .vscode/settings.json with JSON schema associations.
@@ -238,7 +285,7 @@ class InitCommand(BaseCommand):
         if settings_path.exists() and not force:
             # Merge our settings with existing
             try:
-                existing = json.loads(settings_path.read_text(encoding="utf-8"))
+                existing = json.loads(settings_path.read_bytes())
                 # Check if our schemas are already configured
                 existing_schemas = existing.get("json.schemas", [])
                 our_schemas = self.VSCODE_SETTINGS["json.schemas"]
@@ -258,9 +305,8 @@ class InitCommand(BaseCommand):
 
                 if needs_update:
                     existing["json.schemas"] = existing_schemas
-                    with open(settings_path, "w", encoding="utf-8") as f:
-                        json.dump(existing, f, indent=2)
-                        f.write("\n")
+                    with open(settings_path, "wb") as f:
+                        JsonCodec.dump(existing, f)
                     self.app.log.info("Updated .vscode/settings.json with schema associations")
                 else:
                     self.app.log.debug(".vscode/settings.json already has schema associations")
@@ -274,9 +320,8 @@ class InitCommand(BaseCommand):
                 return
 
         # Create new settings file
-        with open(settings_path, "w", encoding="utf-8") as f:
-            json.dump(self.VSCODE_SETTINGS, f, indent=2)
-            f.write("\n")
+        with open(settings_path, "wb") as f:
+            JsonCodec.dump(self.VSCODE_SETTINGS, f)
 
         self.app.log.info("Created .vscode/settings.json with schema associations")
 
@@ -296,9 +341,7 @@ class InitCommand(BaseCommand):
             )
             return
 
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(self.DEFAULT_PROJECT_CONFIG, f, indent=2)
-            f.write("\n")
+        config_path.write_bytes(self.DEFAULT_PROJECT_CONFIG_JSON)
 
         self.app.log.info(f"Created project config: {config_path}")
 
@@ -308,41 +351,66 @@ class InitCommand(BaseCommand):
         gitignore_path = self._project_dir / ".gitignore"
 
         # Read existing content
-        existing_lines: set[str] = set()
-        if gitignore_path.exists():
-            with open(gitignore_path, encoding="utf-8") as f:
-                existing_lines = {line.rstrip() for line in f}
-
-        # Find patterns that need to be added
-        patterns_to_add = [
-            p for p in self.GITIGNORE_PATTERNS if p not in existing_lines
-        ]
+        try:
+            content = gitignore_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            # A new file gets every pattern
+            patterns_to_add = self.GITIGNORE_PATTERNS
+            data = self.GITIGNORE_BLOCK
+        else:
+            # Usually the patterns are there verbatim (init has run before),
+            # which a substring search finds without splitting the file
+            padded = f"\n{content}\n"
+            if all(f"\n{p}\n" in padded for p in self.GITIGNORE_PATTERNS):
+                self.app.log.debug(".gitignore already has all required patterns")
+                return
 
-        if not patterns_to_add:
-            self.app.log.debug(".gitignore already has all required patterns")
-            return
+            existing_lines = frozenset(line.rstrip() for line in content.splitlines())
+
+            # Find patterns that need to be added
+            patterns_to_add = [
+                p for p in self.GITIGNORE_PATTERNS if p not in existing_lines
+            ]
 
-        # Append new patterns
-        with open(gitignore_path, "a", encoding="utf-8") as f:
-            # Add blank line if file exists and doesn't end with newline
-            if existing_lines:
-                f.write("\n")
-            for pattern in patterns_to_add:
-                f.write(f"{pattern}\n")
+            if not patterns_to_add:
+                self.app.log.debug(".gitignore already has all required patterns")
+                return
+
+            # Append new patterns in one write, separated by a blank line from
+            # any existing content (which may lack its final newline)
+            block = "".join(f"{pattern}\n" for pattern in patterns_to_add)
+            if content:
+                block = ("\n" if content.endswith("\n") else "\n\n") + block
+            data = block.encode("utf-8")
+
+        fd = os.open(gitignore_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data) :]
+        finally:
+            os.close(fd)
 
         self.app.log.info(f"Updated .gitignore with {len(patterns_to_add)} patterns")
 
     def _print_success_message(self) -> None:
-        """Print a success message with helpful next steps from README."""
+        """Print a success message with helpful next steps from README.
+
+        The message is formatted with rich on a terminal. When output goes
+        to a pipe or file, the same information is printed as plain text,
+        without loading rich.
+        """
         assert self._project_dir is not None
 
-        from rich.console import Console
+        if not sys.stdout.isatty():
+            self._print_plain_success_message()
+            return
+
         from rich.markdown import Markdown
         from rich.panel import Panel
 
         from meetup_scheduler.resources.readme import ReadmeReader
 
-        console = Console()
+        console = self.console
 
         # Print success header
         console.print(f"\n[bold green]Project initialized at:[/bold green] {self._project_dir}\n")
@@ -357,8 +425,7 @@ class InitCommand(BaseCommand):
 
         # Try to load auth setup instructions from README
         try:
-            reader = ReadmeReader()
-            auth_section = reader.get_section("auth-setup")
+            auth_section = self.app.readme_reader.get_section("auth-setup")
             if auth_section:
                 panel = Panel(Markdown(auth_section), title="Next Steps", border_style="blue")
                 console.print(panel)
@@ -374,12 +441,52 @@ class InitCommand(BaseCommand):
             console.print("    meetup-scheduler readme")
             console.print()
 
+    def _print_plain_success_message(self) -> None:
+        """Print the success message as plain text."""
+        from meetup_scheduler.resources.readme import ReadmeReader
+
+        print(f"\nProject initialized at: {self._project_dir}\n")
+
+        source_dir = self._find_source_directory()
+        if source_dir:
+            print(
+                f"Tip: If you haven't installed meetup-scheduler globally:\n"
+                f"  uv tool install -e {source_dir}\n"
+            )
+
+        try:
+            auth_section = self.app.readme_reader.get_section("auth-setup")
+            if auth_section:
+                print(f"Next steps:\n\n{auth_section.strip()}\n")
+        except ReadmeReader.Error:
+            print(
+                "Next steps:\n\n"
+                "  Log in to your Meetup account:\n"
+                "    meetup-scheduler login\n\n"
+                "  For more information, run:\n"
+                "    meetup-scheduler readme\n"
+            )
+
     def _find_source_directory(self) -> Path | None:
         """Try to find the meetup-scheduler source directory.
 
+        The answer can't change while the process runs, so it is worked
+        out once.
+
         Returns:
             Path to source directory if found and we're in dev mode, None otherwise.
         """
+        if not InitCommand._source_root_known:
+            InitCommand._source_root = self._locate_source_directory()
+            InitCommand._source_root_known = True
+        return InitCommand._source_root
+
+    def _locate_source_directory(self) -> Path | None:
+        """Look for the source directory, for _find_source_directory().
+
+        Returns:
+            Path to source directory if found, None otherwise.
+        """
         # Check if we're running from a source checkout by looking at
         # the module's file location
         try:
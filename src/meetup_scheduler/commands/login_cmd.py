@@ -15,21 +15,9 @@
 
 from __future__ import annotations
 
-import webbrowser
-from typing import TYPE_CHECKING
-
-from rich.console import Console
-
-from meetup_scheduler.auth.oauth import OAuthFlow
 from meetup_scheduler.auth.server import CallbackServer
-from meetup_scheduler.auth.tokens import TokenManager
 from meetup_scheduler.commands.base import BaseCommand
 
-if TYPE_CHECKING:
-    import argparse
-
-    from meetup_scheduler.app import App
-
 
 class LoginCommand(BaseCommand):
     """Authenticate with Meetup via browser-based OAuth flow.
@@ -42,19 +30,14 @@ class LoginCommand(BaseCommand):
     # Default timeout for waiting for callback (5 minutes)
     DEFAULT_TIMEOUT = 300
 
-    def __init__(self, app: App, args: argparse.Namespace) -> None:
-        """Initialize the command."""
-        super().__init__(app, args)
-        self._console = Console()
-
     def execute(self) -> int:
         """Execute the login command.
 
         Returns:
             0 on success, 1 on failure.
         """
-        oauth = OAuthFlow()
-        token_manager = TokenManager(self.app.config_manager)
+        oauth = self.app.oauth_flow
+        token_manager = self.app.token_manager
 
         # Check if OAuth is configured
         if not oauth.is_configured:
@@ -65,16 +48,16 @@ class LoginCommand(BaseCommand):
 
         # Check if already authenticated
         if token_manager.is_authenticated:
-            self._console.print(
+            self.console.print(
                 "[green]Already authenticated with Meetup.[/green]"
             )
-            self._console.print(
+            self.console.print(
                 "Run [bold]meetup-scheduler logout[/bold] first to re-authenticate."
             )
             return 0
 
         # Get port from args
-        port = getattr(self.args, "port", CallbackServer.DEFAULT_PORT)
+        port = vars(self.args).get("port", CallbackServer.DEFAULT_PORT)
 
         # Start callback server
         server = CallbackServer(port=port)
@@ -91,22 +74,24 @@ class LoginCommand(BaseCommand):
             auth_url = oauth.get_authorize_url(state, server.redirect_uri)
 
             # Open browser
-            self._console.print()
-            self._console.print(
+            self.console.print()
+            self.console.print(
                 "[bold]Opening browser for Meetup authentication...[/bold]"
             )
-            self._console.print()
-            self._console.print(
+            self.console.print()
+            self.console.print(
                 "If the browser doesn't open, visit this URL:"
             )
-            self._console.print(f"  [link]{auth_url}[/link]")
-            self._console.print()
+            self.console.print(f"  [link]{auth_url}[/link]")
+            self.console.print()
+
+            import webbrowser
 
             if not webbrowser.open(auth_url):
                 self.app.log.warning("Failed to open browser automatically")
 
             # Wait for callback
-            self._console.print("Waiting for authentication...")
+            self.console.print("Waiting for authentication...")
             try:
                 code, returned_state = server.wait_for_callback(
                     timeout=self.DEFAULT_TIMEOUT
@@ -124,22 +109,22 @@ class LoginCommand(BaseCommand):
                 )
 
             # Exchange code for tokens
-            self._console.print("Exchanging authorization code for tokens...")
+            self.console.print("Exchanging authorization code for tokens...")
             try:
                 tokens = oauth.exchange_code(code, server.redirect_uri)
-            except OAuthFlow.Error as e:
+            except oauth.Error as e:
                 raise self.Error(str(e)) from e
 
             # Save tokens
             token_manager.save_tokens(tokens)
 
-            self._console.print()
-            self._console.print(
+            self.console.print()
+            self.console.print(
                 "[bold green]Successfully authenticated with Meetup![/bold green]"
             )
-            self._console.print()
-            self._console.print("You can now use meetup-scheduler commands.")
-            self._console.print()
+            self.console.print()
+            self.console.print("You can now use meetup-scheduler commands.")
+            self.console.print()
 
             return 0
 
@@ -36,7 +36,7 @@ class ReadmeCommand(BaseCommand):
     def __init__(self, app: App, args: argparse.Namespace) -> None:
         """Initialize the command."""
         super().__init__(app, args)
-        self._reader = ReadmeReader()
+        self._reader = app.readme_reader
 
     def execute(self) -> int:
         """Execute the readme command.
@@ -44,18 +44,24 @@ class ReadmeCommand(BaseCommand):
         Returns:
             0 on success, 1 on error.
         """
-        raw = getattr(self.args, "raw", False) or False
-        pager = getattr(self.args, "pager", True)
-        section = getattr(self.args, "section", None)
+        args = vars(self.args)
+        raw = args.get("raw") or False
+        pager = args.get("pager", True)
+        section = args.get("section")
 
         # Use pager for formatted output if --pager is enabled (default)
         # pager can be None in testing mode, treat as True
         use_pager = not raw and (pager if pager is not None else True)
 
+        # Formatted output that isn't paged goes through the app's console
+        console = None if raw or use_pager else self.console
+
         try:
             if section:
                 # Print a specific section
-                if not self._reader.print_section(section, raw=raw, pager=use_pager):
+                if not self._reader.print_section(
+                    section, raw=raw, pager=use_pager, console=console
+                ):
                     self.app.log.error(f"Section not found: {section}")
                     self._print_available_sections()
                     return 1
@@ -64,7 +70,7 @@ class ReadmeCommand(BaseCommand):
                 self._reader.print_raw()
             else:
                 # Print formatted markdown with pager
-                self._reader.print_formatted(pager=use_pager)
+                self._reader.print_formatted(console, pager=use_pager)
 
             return 0
 
@@ -15,12 +15,12 @@
 
 from __future__ import annotations
 
-import json
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from meetup_scheduler.commands.base import BaseCommand
-from meetup_scheduler.output.markdown import MarkdownGenerator
+from meetup_scheduler.json_codec import JsonCodec
 from meetup_scheduler.scheduler.parser import EventParser, ParsedEvent, ParsedEventFile
 
 if TYPE_CHECKING:
@@ -51,10 +51,11 @@ class ScheduleCommand(BaseCommand):
             CommandError: If scheduling fails.
         """
         # Get command arguments
-        file_arg = getattr(self.args, "file", None)
-        output_format = getattr(self.args, "output", "summary") or "summary"
-        on_conflict = getattr(self.args, "on_conflict", "prompt") or "prompt"
-        dry_run = getattr(self.args, "dry_run", False) or False
+        args = vars(self.args)
+        file_arg = args.get("file")
+        output_format = args.get("output") or "summary"
+        on_conflict = args.get("on_conflict") or "prompt"
+        dry_run = args.get("dry_run") or False
 
         if not file_arg:
             raise self.Error(
@@ -112,45 +113,53 @@ class ScheduleCommand(BaseCommand):
             on_conflict: Conflict resolution strategy.
         """
         mode = "DRY RUN - " if dry_run else ""
-        print(f"\n{mode}Schedule Summary")
-        print("=" * 60)
+        lines = ["", f"{mode}Schedule Summary", "=" * 60]
 
         if parsed.source_path:
-            print(f"Source: {parsed.source_path}")
-        print(f"Events: {len(parsed.events)}")
-        print(f"On conflict: {on_conflict}")
-        print()
+            lines.append(f"Source: {parsed.source_path}")
+        lines.append(f"Events: {len(parsed.events)}")
+        lines.append(f"On conflict: {on_conflict}")
+        lines.append("")
 
         for i, event in enumerate(parsed.events, 1):
-            self._print_event_summary(i, event)
+            lines.extend(self._event_summary_lines(i, event))
 
-        print("=" * 60)
+        lines.append("=" * 60)
         if dry_run:
-            print(f"Would create {len(parsed.events)} event(s)")
+            lines.append(f"Would create {len(parsed.events)} event(s)")
         else:
-            print(f"Ready to create {len(parsed.events)} event(s)")
+            lines.append(f"Ready to create {len(parsed.events)} event(s)")
 
-    def _print_event_summary(self, index: int, event: ParsedEvent) -> None:
-        """Print a single event summary.
+        # One write for the whole summary, rather than one per line
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def _event_summary_lines(self, index: int, event: ParsedEvent) -> list[str]:
+        """Format a single event summary.
 
         Args:
             index: Event index (1-based).
             event: The parsed event.
+
+        Returns:
+            Lines of the summary, ending with a blank line.
         """
-        print(f"[{index}] {event.title}")
-        print(f"    Group: {event.group_urlname}")
-        print(f"    Date:  {event.start_datetime}")
-        print(f"    Duration: {event.duration_minutes} minutes")
+        lines = [
+            f"[{index}] {event.title}",
+            f"    Group: {event.group_urlname}",
+            f"    Date:  {event.start_datetime}",
+            f"    Duration: {event.duration_minutes} minutes",
+        ]
         if event.venue_id:
-            print(f"    Venue: {event.venue_id}")
-        print(f"    Status: {event.publish_status}")
+            lines.append(f"    Venue: {event.venue_id}")
+        lines.append(f"    Status: {event.publish_status}")
         if event.description:
             # Truncate long descriptions
-            desc = event.description[:100]
-            if len(event.description) > 100:
-                desc += "..."
-            print(f"    Description: {desc}")
-        print()
+            desc = event.description
+            if len(desc) > 100:
+                desc = desc[:100] + "..."
+            lines.append(f"    Description: {desc}")
+        lines.append("")
+        return lines
 
     def _output_markdown(self, parsed: ParsedEventFile, *, dry_run: bool) -> None:
         """Output events in markdown table format.
@@ -159,9 +168,12 @@ class ScheduleCommand(BaseCommand):
             parsed: Parsed event file.
             dry_run: Whether this is a dry run.
         """
+        # Only this output format needs the generator
+        from meetup_scheduler.output.markdown import MarkdownGenerator
+
         generator = MarkdownGenerator()
         output = generator.generate_from_file(parsed, dry_run=dry_run)
-        print(output, end="")
+        sys.stdout.write(output)
 
     def _output_json(self, parsed: ParsedEventFile, *, dry_run: bool) -> None:
         """Output events in JSON format.
@@ -170,13 +182,15 @@ class ScheduleCommand(BaseCommand):
             parsed: Parsed event file.
             dry_run: Whether this is a dry run.
         """
-        output = {
+        head = {
             "mode": "dry_run" if dry_run else "schedule",
             "source": str(parsed.source_path) if parsed.source_path else None,
             "count": len(parsed.events),
-            "events": [self._event_to_dict(e) for e in parsed.events],
         }
-        print(json.dumps(output, indent=2))
+        # Events are converted and written one at a time
+        JsonCodec.dump_streaming_stdout(
+            head, "events", (self._event_to_dict(e) for e in parsed.events)
+        )
 
     def _event_to_dict(self, event: ParsedEvent) -> dict:
         """Convert a ParsedEvent to a dictionary for JSON output.
@@ -187,23 +201,20 @@ class ScheduleCommand(BaseCommand):
         Returns:
             Dictionary representation.
         """
-        result = {
+        # Optional members are left out when empty, except that isOnline
+        # is also written when it is False
+        optional = (
+            ("description", event.description),
+            ("venueId", event.venue_id),
+            ("eventHosts", event.event_hosts),
+            ("isOnline", event.is_online),
+            ("eventUrl", event.event_url),
+        )
+        return {
             "title": event.title,
             "startDateTime": event.start_datetime,
             "durationMinutes": event.duration_minutes,
             "groupUrlname": event.group_urlname,
             "publishStatus": event.publish_status,
+            **{key: value for key, value in optional if value or value is False},
         }
-
-        if event.description:
-            result["description"] = event.description
-        if event.venue_id:
-            result["venueId"] = event.venue_id
-        if event.event_hosts:
-            result["eventHosts"] = event.event_hosts
-        if event.is_online is not None:
-            result["isOnline"] = event.is_online
-        if event.event_url:
-            result["eventUrl"] = event.event_url
-
-        return result
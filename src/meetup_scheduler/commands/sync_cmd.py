@@ -16,19 +16,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
-
-from rich.console import Console
+from typing import Any
 
 from meetup_scheduler.auth.tokens import TokenManager
 from meetup_scheduler.commands.base import BaseCommand
 from meetup_scheduler.meetup.client import MeetupClient
 
-if TYPE_CHECKING:
-    import argparse
-
-    from meetup_scheduler.app import App
-
 
 class SyncCommand(BaseCommand):
     """Sync group and venue data from Meetup API.
@@ -36,12 +29,12 @@ class SyncCommand(BaseCommand):
     Fetches groups the user organizes and extracts venue information from
     past events. Data is cached locally for use by schedule and generate
     commands.
-    """
 
-    def __init__(self, app: App, args: argparse.Namespace) -> None:
-        """Initialize the command."""
-        super().__init__(app, args)
-        self._console = Console()
+    Syncs are incremental: the time of the newest event seen is saved for
+    each group (as groups.<urlname>.lastEventSync), and the next sync only
+    fetches events from then on, adding their venues to those already
+    saved. --full refetches the whole --years window instead.
+    """
 
     def execute(self) -> int:
         """Execute the sync command.
@@ -50,7 +43,7 @@ class SyncCommand(BaseCommand):
             0 on success, 1 on failure.
         """
         # Check authentication
-        token_manager = TokenManager(self.app.config_manager)
+        token_manager = self.app.token_manager
         if not token_manager.is_authenticated:
             raise self.Error(
                 "Not authenticated. Run: meetup-scheduler login"
@@ -67,71 +60,77 @@ class SyncCommand(BaseCommand):
                 "No access token available. Run: meetup-scheduler login"
             )
 
-        # Create client
-        client = MeetupClient(access_token)
-
         # Get options from args
-        specific_group = getattr(self.args, "group", None)
-        years = getattr(self.args, "years", 2)
-        venues_only = getattr(self.args, "venues_only", False)
+        args = vars(self.args)
+        specific_group = args.get("group")
+        years = args.get("years", 2)
+        venues_only = args.get("venues_only", False)
+        full = args.get("full", False)
 
-        if not self.args.quiet:
-            self._console.print()
-            self._console.print("[bold]Syncing Meetup data...[/bold]")
-            self._console.print()
+        # Create client; its connections are closed when sync is done
+        client = MeetupClient(access_token)
+        try:
+            if not self.args.quiet:
+                self.console.print()
+                self.console.print("[bold]Syncing Meetup data...[/bold]")
+                self.console.print()
 
-        # Fetch groups
-        if not venues_only:
-            groups = self._sync_groups(client, specific_group)
-        else:
-            # For venues-only, still need to know which groups to query
-            groups = self._get_configured_groups(specific_group)
+            # Config changes, saved together at the end
+            updates: dict[str, Any] = {}
 
-        if not groups:
-            if specific_group:
-                raise self.Error(f"Group not found: {specific_group}")
-            raise self.Error(
-                "No organized groups found. "
-                "Make sure you have organizer privileges on at least one group."
-            )
+            # Fetch groups
+            if not venues_only:
+                groups = self._sync_groups(client, specific_group, updates)
+            else:
+                # For venues-only, still need to know which groups to query
+                groups = self._get_configured_groups(specific_group)
+
+            if not groups:
+                if specific_group:
+                    raise self.Error(f"Group not found: {specific_group}")
+                raise self.Error(
+                    "No organized groups found. "
+                    "Make sure you have organizer privileges on at least one group."
+                )
 
-        # Fetch venues
-        all_venues = self._sync_venues(client, groups, years)
+            # Fetch venues
+            all_venues = self._sync_venues(client, groups, years, updates, full=full)
 
-        # Save sync timestamp
-        self.app.config_manager.set(
-            "lastSync",
-            datetime.now(timezone.utc).isoformat(),
-            user_level=False,
-        )
+            # Save everything, with the sync timestamp, in one write
+            updates["lastSync"] = datetime.now(timezone.utc).isoformat()
+            self.app.config_manager.update_many(updates, user_level=False)
 
-        # Summary
-        if not self.args.quiet:
-            self._console.print()
-            self._console.print("[bold green]Sync complete![/bold green]")
-            if not venues_only:
-                self._console.print(f"  Groups: {len(groups)}")
-            self._console.print(f"  Venues: {len(all_venues)}")
-            self._console.print()
+            # Summary
+            if not self.args.quiet:
+                self.console.print()
+                self.console.print("[bold green]Sync complete![/bold green]")
+                if not venues_only:
+                    self.console.print(f"  Groups: {len(groups)}")
+                self.console.print(f"  Venues: {len(all_venues)}")
+                self.console.print()
 
-        return 0
+            return 0
+        finally:
+            client.close()
 
     def _sync_groups(
         self,
         client: MeetupClient,
         specific_group: str | None,
+        updates: dict[str, Any],
     ) -> list[dict[str, Any]]:
         """Sync group data from Meetup.
 
         Args:
             client: Meetup API client.
             specific_group: Optional specific group urlname to sync.
+            updates: Config changes to make; the groups are added.
 
         Returns:
             List of synced groups.
         """
         if not self.args.quiet:
-            self._console.print("Fetching groups...", end=" ")
+            self.console.print("Fetching groups...", end=" ")
 
         try:
             groups = client.get_organized_groups()
@@ -143,11 +142,12 @@ class SyncCommand(BaseCommand):
             groups = [g for g in groups if g.get("urlname") == specific_group]
 
         if not self.args.quiet:
-            self._console.print(f"found {len(groups)} organized groups")
+            self.console.print(f"found {len(groups)} organized groups")
             for group in groups:
-                self._console.print(f"  - {group.get('name')} ({group.get('urlname')})")
+                self.console.print(f"  - {group.get('name')} ({group.get('urlname')})")
 
-        # Save groups to config
+        # Add groups to config, keeping the event watermarks of earlier syncs
+        saved_groups = self.app.config_manager.get("groups", {})
         groups_data: dict[str, Any] = {}
         for group in groups:
             urlname = group.get("urlname", "")
@@ -158,9 +158,12 @@ class SyncCommand(BaseCommand):
                     "urlname": urlname,
                     "timezone": group.get("timezone"),
                 }
+                last_event_sync = saved_groups.get(urlname, {}).get("lastEventSync")
+                if last_event_sync:
+                    groups_data[urlname]["lastEventSync"] = last_event_sync
 
         if groups_data:
-            self.app.config_manager.set("groups", groups_data, user_level=False)
+            updates["groups"] = groups_data
 
         return groups
 
@@ -197,6 +200,9 @@ class SyncCommand(BaseCommand):
         client: MeetupClient,
         groups: list[dict[str, Any]],
         years: int,
+        updates: dict[str, Any],
+        *,
+        full: bool = False,
     ) -> list[dict[str, Any]]:
         """Sync venue data from past events.
 
@@ -204,42 +210,120 @@ class SyncCommand(BaseCommand):
             client: Meetup API client.
             groups: List of groups to fetch venues from.
             years: Number of years to look back.
+            updates: Config changes to make; the venues and the groups'
+                new watermarks are added.
+            full: If True, fetch all the years of events and replace the
+                saved venues; otherwise fetch only events newer than each
+                group's watermark, and add to the saved venues.
 
         Returns:
             List of all unique venues.
         """
+        config_manager = self.app.config_manager
         all_venues: dict[str, dict[str, Any]] = {}
+        saved_venues: dict[str, dict[str, Any]] = {}
+        since: dict[str, datetime] = {}
+        watermarks: dict[str, datetime] = {}
+        if not full:
+            saved = config_manager.get_many(["venues", "groups"], {})
+            saved_venues, saved_groups = saved["venues"], saved["groups"]
+            for group in groups:
+                urlname = group.get("urlname", "")
+                watermark = self._parse_time(
+                    saved_groups.get(urlname, {}).get("lastEventSync")
+                )
+                if watermark is not None:
+                    since[urlname] = watermark
+
+        # All the groups' events are fetched together, a page of each group
+        # per request
+        complete: set[str] = set()
+        try:
+            events_by_group = client.get_past_events_batch(
+                [group.get("urlname", "") for group in groups],
+                years=years,
+                since=since,
+                complete=complete,
+            )
+        except MeetupClient.Error as e:
+            self.app.log.warning(f"Failed to fetch past events: {e}")
+            return list(saved_venues.values())
 
         for group in groups:
             urlname = group.get("urlname", "")
             name = group.get("name", urlname)
 
             if not self.args.quiet:
-                self._console.print()
-                self._console.print(
-                    f"Fetching venues from {name} (last {years} years)..."
+                self.console.print()
+                if urlname in since:
+                    window = f"since {since[urlname]:%Y-%m-%d %H:%M} UTC"
+                else:
+                    window = f"last {years} years"
+                self.console.print(f"Fetching venues from {name} ({window})...")
+
+            events = events_by_group.get(urlname)
+            if events is None:
+                self.app.log.warning(
+                    f"Failed to fetch events for {urlname}: Group not found"
                 )
-
-            try:
-                events = client.get_past_events(urlname, years=years)
-            except MeetupClient.Error as e:
-                self.app.log.warning(f"Failed to fetch events for {urlname}: {e}")
                 continue
 
             venues = client.extract_venues(events)
 
             if not self.args.quiet:
-                self._console.print(f"  - Found {len(events)} past events")
-                self._console.print(f"  - Extracted {len(venues)} unique venues")
+                self.console.print(f"  - Found {len(events)} past events")
+                self.console.print(f"  - Extracted {len(venues)} unique venues")
+
+            # Merge venues by ID; venues from earlier groups win
+            all_venues.update(
+                (venue_id, venue)
+                for venue in venues
+                if (venue_id := venue.get("id")) and venue_id not in all_venues
+            )
 
-            # Merge venues (using venue ID as key)
-            for venue in venues:
-                venue_id = venue.get("id")
-                if venue_id and venue_id not in all_venues:
-                    all_venues[venue_id] = venue
+            # The group's new watermark is the time of its newest event, but
+            # only if everything back to the old one was fetched; otherwise
+            # the events in between would never be fetched again
+            if urlname not in complete:
+                self.app.log.warning(
+                    f"Events for {urlname} were fetched only in part; "
+                    "its sync watermark isn't updated"
+                )
+                continue
+            times = [t for e in events if (t := self._parse_time(e.get("dateTime")))]
+            if times and (urlname not in since or max(times) > since[urlname]):
+                watermarks[urlname] = max(times)
 
-        # Save venues to config
+        # Add venues to config; fetched venues replace saved copies
         if all_venues:
-            self.app.config_manager.set("venues", all_venues, user_level=False)
+            all_venues = {**saved_venues, **all_venues}
+            updates["venues"] = all_venues
+        else:
+            all_venues = saved_venues
+
+        # The watermarks are saved with the venues, after any new groups
+        for urlname, watermark in watermarks.items():
+            updates[f"groups.{urlname}.lastEventSync"] = watermark.isoformat()
 
         return list(all_venues.values())
+
+    @staticmethod
+    def _parse_time(value: str | None) -> datetime | None:
+        """Parse an ISO 8601 time from the API or the config.
+
+        Args:
+            value: The time, or None.
+
+        Returns:
+            The time (in UTC if value has no zone), or None if value is
+            missing or invalid.
+        """
+        if not value:
+            return None
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt
@@ -15,14 +15,20 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import os
+import secrets
 import stat
+import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import platformdirs
 
+from meetup_scheduler.json_codec import JsonCodec
+
 
 class ConfigManager:
     """Manage user and project configuration files."""
@@ -36,6 +42,23 @@ class ConfigManager:
     CREDENTIALS_FILE = "credentials.json"
     PROJECT_CONFIG_FILE = "meetup-scheduler-local.json"
 
+    # Lock files serializing changes to a configuration: in the user config
+    # directory, and in the project's .meetup-scheduler directory (which
+    # init git-ignores), or, if the project has none, next to the project
+    # config file (so that changing it creates no directories)
+    LOCK_FILE = "config.lock"
+    PROJECT_STATE_DIR = ".meetup-scheduler"
+    PROJECT_LOCK_FILE = ".meetup-scheduler-local.json.lock"
+
+    # Permissions of new config files (less the umask), and of the
+    # credentials file
+    FILE_MODE = 0o666
+    CREDENTIALS_MODE = stat.S_IRUSR | stat.S_IWUSR
+
+    # Dot-separated keys split into their parts, shared by all instances
+    # (keys are mostly literals, so there are few of them)
+    _key_parts: ClassVar[dict[str, tuple[str, ...]]] = {}
+
     class Error(Exception):
         """Exception raised for configuration errors."""
 
@@ -52,6 +75,16 @@ class ConfigManager:
         self._user_config: dict[str, Any] | None = None
         self._project_config: dict[str, Any] | None = None
 
+        # (mtime, size) of the files the configurations were read from,
+        # None if missing, so that changes by other programs are seen
+        self._user_config_stamp: tuple[int, int] | None = None
+        self._project_config_stamp: tuple[int, int] | None = None
+
+        # Values found by get(), by key (None if not found), and the
+        # configurations they were found in
+        self._get_cache: dict[str, Any] = {}
+        self._get_cache_sources: tuple[dict[str, Any], dict[str, Any]] | None = None
+
     @property
     def user_config_dir(self) -> Path:
         """Return the user-level configuration directory.
@@ -98,23 +131,18 @@ class ConfigManager:
     def load_user_config(self) -> dict[str, Any]:
         """Load user-level configuration.
 
+        The configuration is reread only if the file has changed since it
+        was last read or written.
+
         Returns:
             Configuration dictionary. Empty dict if file doesn't exist.
         """
-        if self._user_config is not None:
+        stamp = self._stamp(self.user_config_path)
+        if self._user_config is not None and stamp == self._user_config_stamp:
             return self._user_config
 
-        if self.user_config_path.exists():
-            try:
-                with open(self.user_config_path, encoding="utf-8") as f:
-                    self._user_config = json.load(f)
-            except json.JSONDecodeError as e:
-                raise self.Error(
-                    f"Invalid JSON in {self.user_config_path}: {e}"
-                ) from e
-        else:
-            self._user_config = {}
-
+        self._user_config = self._read_json(self.user_config_path)
+        self._user_config_stamp = stamp
         return self._user_config
 
     def save_user_config(self, config: dict[str, Any]) -> None:
@@ -124,9 +152,10 @@ class ConfigManager:
             config: Configuration dictionary to save.
         """
         self.ensure_user_config_dir()
-        with open(self.user_config_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        self._write_json(self.user_config_path, config)
         self._user_config = config
+        self._user_config_stamp = self._stamp(self.user_config_path)
+        self._get_cache.clear()
 
     def load_credentials(self) -> dict[str, Any]:
         """Load credentials from file.
@@ -134,15 +163,7 @@ class ConfigManager:
         Returns:
             Credentials dictionary. Empty dict if file doesn't exist.
         """
-        if self.credentials_path.exists():
-            try:
-                with open(self.credentials_path, encoding="utf-8") as f:
-                    return json.load(f)
-            except json.JSONDecodeError as e:
-                raise self.Error(
-                    f"Invalid JSON in {self.credentials_path}: {e}"
-                ) from e
-        return {}
+        return self._read_json(self.credentials_path)
 
     def save_credentials(self, credentials: dict[str, Any]) -> None:
         """Save credentials with restricted permissions.
@@ -151,35 +172,23 @@ class ConfigManager:
             credentials: Credentials dictionary to save.
         """
         self.ensure_user_config_dir()
-
-        # Write to file
-        with open(self.credentials_path, "w", encoding="utf-8") as f:
-            json.dump(credentials, f, indent=2)
-
-        # Set restrictive permissions on Unix (0600)
-        if os.name != "nt":
-            os.chmod(self.credentials_path, stat.S_IRUSR | stat.S_IWUSR)
+        self._write_json(self.credentials_path, credentials, mode=self.CREDENTIALS_MODE)
 
     def load_project_config(self) -> dict[str, Any]:
         """Load project-level configuration.
 
+        The configuration is reread only if the file has changed since it
+        was last read or written.
+
         Returns:
             Configuration dictionary. Empty dict if file doesn't exist.
         """
-        if self._project_config is not None:
+        stamp = self._stamp(self.project_config_path)
+        if self._project_config is not None and stamp == self._project_config_stamp:
             return self._project_config
 
-        if self.project_config_path.exists():
-            try:
-                with open(self.project_config_path, encoding="utf-8") as f:
-                    self._project_config = json.load(f)
-            except json.JSONDecodeError as e:
-                raise self.Error(
-                    f"Invalid JSON in {self.project_config_path}: {e}"
-                ) from e
-        else:
-            self._project_config = {}
-
+        self._project_config = self._read_json(self.project_config_path)
+        self._project_config_stamp = stamp
         return self._project_config
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -194,35 +203,153 @@ class ConfigManager:
         Returns:
             Configuration value or default.
         """
-        # Check project config first (higher priority)
-        value = self._get_nested(self.load_project_config(), key)
-        if value is not None:
-            return value
+        value = self._lookup(key, *self._load_for_get())
+        return default if value is None else value
 
-        # Fall back to user config
-        value = self._get_nested(self.load_user_config(), key)
-        if value is not None:
-            return value
+    def get_many(self, keys: Iterable[str], default: Any = None) -> dict[str, Any]:
+        """Get several configuration values.
 
-        return default
+        The configurations are loaded and checked once for all the keys.
+
+        Args:
+            keys: Dot-separated key paths.
+            default: Default value for keys not found.
+
+        Returns:
+            Configuration values or default, by key.
+        """
+        configs = self._load_for_get()
+        result: dict[str, Any] = {}
+        for key in keys:
+            value = self._lookup(key, *configs)
+            result[key] = default if value is None else value
+        return result
+
+    def _load_for_get(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Load the configurations for a lookup.
+
+        Each file is checked for changes with one stat; it is only reread
+        if it changed. The get() cache is emptied if the configurations
+        were reloaded or replaced since it was filled, so a warm get()
+        costs two stats and no reads.
+
+        Returns:
+            The project and user configurations.
+        """
+        project_config = self.load_project_config()
+        user_config = self.load_user_config()
+
+        sources = self._get_cache_sources
+        if sources is None or sources[0] is not project_config or sources[1] is not user_config:
+            self._get_cache.clear()
+            self._get_cache_sources = (project_config, user_config)
+        return project_config, user_config
+
+    def _lookup(
+        self, key: str, project_config: dict[str, Any], user_config: dict[str, Any]
+    ) -> Any:
+        """Look up a key in the get() cache, or else in the configurations.
+
+        Args:
+            key: Dot-separated key path.
+            project_config: Project configuration, from _load_for_get().
+            user_config: User configuration, from _load_for_get().
+
+        Returns:
+            The value, or None if not found.
+        """
+        try:
+            return self._get_cache[key]
+        except KeyError:
+            pass
+
+        # Check project config first (higher priority), then user config
+        value = self._get_nested(project_config, key)
+        if value is None:
+            value = self._get_nested(user_config, key)
+        self._get_cache[key] = value
+        return value
 
     def set(self, key: str, value: Any, *, user_level: bool = True) -> None:
         """Set a configuration value.
 
+        The configuration file is only written if the value changes.
+
         Args:
             key: Dot-separated key path (e.g., "organizer.name").
             value: Value to set.
             user_level: If True, save to user config. Otherwise, save to project config.
         """
-        if user_level:
-            config = self.load_user_config()
+        self.update_many({key: value}, user_level=user_level)
+
+    def update_many(self, updates: dict[str, Any], *, user_level: bool = True) -> None:
+        """Set several configuration values, saving the file once.
+
+        Values are set in order, so a key may set a member of a value set
+        by an earlier key. The configuration file is only written if some
+        value changes.
+
+        The file is locked while it is read, changed and saved, so that
+        concurrent runs don't lose each other's changes. If the loaded
+        configuration already has all the values, the lock isn't taken.
+
+        Args:
+            updates: Values to set, by dot-separated key path.
+            user_level: If True, save to user config. Otherwise, save to project config.
+        """
+        config = self.load_user_config() if user_level else self.load_project_config()
+        if all(self._is_unchanged(config, key, value) for key, value in updates.items()):
+            return
+
+        with self._locked(user_level=user_level):
+            self._update_locked(updates, user_level=user_level)
+
+    def _update_locked(self, updates: dict[str, Any], *, user_level: bool) -> None:
+        """Set several configuration values, with the file already locked.
+
+        Args:
+            updates: Values to set, by dot-separated key path.
+            user_level: If True, save to user config. Otherwise, save to project config.
+        """
+        # Loading rereads the file if another run has changed it
+        config = self.load_user_config() if user_level else self.load_project_config()
+
+        changed = False
+        for key, value in updates.items():
+            if self._is_unchanged(config, key, value):
+                continue
             self._set_nested(config, key, value)
+            changed = True
+
+        if not changed:
+            return
+        if user_level:
             self.save_user_config(config)
         else:
-            config = self.load_project_config()
-            self._set_nested(config, key, value)
             self.save_project_config(config)
 
+    def _is_unchanged(self, config: dict[str, Any], key: str, value: Any) -> bool:
+        """Check whether setting a value would leave a configuration as it is.
+
+        Args:
+            config: Configuration to check.
+            key: Dot-separated key path.
+            value: Value to set.
+
+        Returns:
+            True if the configuration already has an equal value of the
+            same type at key.
+        """
+        # A dict or list that is the stored object itself may have been
+        # changed in place, so it's always saved
+        current = self._get_nested(config, key)
+        return (
+            current is not None
+            and type(current) is type(value)
+            and current == value
+            and not (current is value and isinstance(value, dict | list))
+        )
+
     def unset(self, key: str, *, user_level: bool = True) -> bool:
         """Remove a configuration value.
 
@@ -233,16 +360,22 @@ class ConfigManager:
         Returns:
             True if the key was found and removed, False otherwise.
         """
-        if user_level:
-            config = self.load_user_config()
-            if self._unset_nested(config, key):
-                self.save_user_config(config)
-                return True
-        else:
-            config = self.load_project_config()
-            if self._unset_nested(config, key):
-                self.save_project_config(config)
-                return True
+        # Nothing to write (or lock) if the key isn't there
+        config = self.load_user_config() if user_level else self.load_project_config()
+        if not self._has_nested(config, key):
+            return False
+
+        with self._locked(user_level=user_level):
+            if user_level:
+                config = self.load_user_config()
+                if self._unset_nested(config, key):
+                    self.save_user_config(config)
+                    return True
+            else:
+                config = self.load_project_config()
+                if self._unset_nested(config, key):
+                    self.save_project_config(config)
+                    return True
         return False
 
     def save_project_config(self, config: dict[str, Any]) -> None:
@@ -251,10 +384,155 @@ class ConfigManager:
         Args:
             config: Configuration dictionary to save.
         """
-        with open(self.project_config_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
-            f.write("\n")
+        self._write_json(self.project_config_path, config)
         self._project_config = config
+        self._project_config_stamp = self._stamp(self.project_config_path)
+        self._get_cache.clear()
+
+    @contextlib.contextmanager
+    def _locked(self, *, user_level: bool) -> Iterator[None]:
+        """Hold the lock on changes to a configuration.
+
+        The lock is advisory: it only keeps out other meetup-scheduler
+        runs that take it too. It isn't reentrant.
+
+        Args:
+            user_level: If True, lock the user config. Otherwise, lock the
+                project config.
+
+        Yields:
+            Nothing; the lock is held until the context exits.
+        """
+        if user_level:
+            lock_path = self.ensure_user_config_dir() / self.LOCK_FILE
+        else:
+            state_dir = self._project_dir / self.PROJECT_STATE_DIR
+            if state_dir.is_dir():
+                lock_path = state_dir / self.LOCK_FILE
+            else:
+                lock_path = self._project_dir / self.PROJECT_LOCK_FILE
+
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, self.FILE_MODE)
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+
+                # Retries for about 10 seconds, then raises OSError
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+
+                # Released when fd is closed
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _stamp(path: Path) -> tuple[int, int] | None:
+        """Return the modification time and size of a file.
+
+        Args:
+            path: File to check.
+
+        Returns:
+            (mtime in ns, size), or None if the file doesn't exist.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _read_json(self, path: Path) -> dict[str, Any]:
+        """Read a JSON document from a file.
+
+        A missing file is detected by opening it, rather than by checking
+        for it first, so each read costs one lookup of the path.
+
+        Args:
+            path: File to read.
+
+        Returns:
+            The decoded document. Empty dict if the file doesn't exist.
+
+        Raises:
+            Error: If the file isn't valid JSON.
+        """
+        try:
+            with open(path, "rb") as f:
+                return JsonCodec.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise self.Error(f"Invalid JSON in {path}: {e}") from e
+
+    def _write_json(self, path: Path, obj: Any, *, mode: int | None = None) -> None:
+        """Replace a file with a JSON document, atomically.
+
+        The document is written to a temporary file in the same directory,
+        which is then renamed over path, so that a crash or a full disk
+        never leaves a partly written file behind.
+
+        Args:
+            path: File to write.
+            obj: Value to encode.
+            mode: Permissions for the file (Unix only). Defaults to those
+                of the file being replaced, or to FILE_MODE less the umask
+                for a new file.
+
+        Raises:
+            OSError: If the file can't be written.
+        """
+        data = JsonCodec.dumps(obj) + b"\n"
+
+        if mode is None:
+            # A new file keeps the mode it's created with
+            with contextlib.suppress(FileNotFoundError):
+                mode = stat.S_IMODE(path.stat().st_mode)
+
+        fd, tmp_name = self._create_temp(path)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                # Before writing, so credentials are never readable by others
+                if mode is not None and os.name != "nt":
+                    os.fchmod(f.fileno(), mode)
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+
+    def _create_temp(self, path: Path) -> tuple[int, str]:
+        """Create a new temporary file next to a file, for writing.
+
+        Unlike tempfile.mkstemp(), which makes files readable only by their
+        owner, the file gets FILE_MODE less the umask, as open() would give.
+
+        Args:
+            path: File the temporary file will replace.
+
+        Returns:
+            Tuple of (file descriptor, temporary file name).
+
+        Raises:
+            OSError: If the file can't be created.
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        while True:
+            tmp_name = os.path.join(path.parent, f".{path.name}.{secrets.token_hex(4)}.tmp")
+            try:
+                return os.open(tmp_name, flags, self.FILE_MODE), tmp_name
+            except FileExistsError:
+                continue
 
     def get_all(self, *, user_level: bool = True) -> dict[str, Any]:
         """Get all configuration values.
@@ -289,20 +567,40 @@ class ConfigManager:
             override: Dictionary with overriding values.
 
         Returns:
-            Merged dictionary.
+            Merged dictionary. Only the dictionaries that both sides have
+            at the same path are copied; other values are shared with
+            base and override.
         """
         result = base.copy()
-        for key, value in override.items():
-            if (
-                key in result
-                and isinstance(result[key], dict)
-                and isinstance(value, dict)
-            ):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
+        # Pairs of (merged dictionary, dictionary to merge into it)
+        stack = [(result, override)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                current = dst.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    dst[key] = current = current.copy()
+                    stack.append((current, value))
+                else:
+                    dst[key] = value
         return result
 
+    @classmethod
+    def _split_key(cls, key: str) -> tuple[str, ...]:
+        """Split a dot-separated key path into its parts.
+
+        Args:
+            key: Dot-separated key path.
+
+        Returns:
+            The parts of the key.
+        """
+        try:
+            return cls._key_parts[key]
+        except KeyError:
+            parts = cls._key_parts[key] = tuple(key.split("."))
+            return parts
+
     def _get_nested(self, data: dict[str, Any], key: str) -> Any:
         """Get a nested value from a dictionary using dot notation.
 
@@ -313,7 +611,7 @@ class ConfigManager:
         Returns:
             Value at the key path, or None if not found.
         """
-        parts = key.split(".")
+        parts = self._split_key(key)
         current: Any = data
         for part in parts:
             if not isinstance(current, dict) or part not in current:
@@ -321,6 +619,24 @@ class ConfigManager:
             current = current[part]
         return current
 
+    def _has_nested(self, data: dict[str, Any], key: str) -> bool:
+        """Check whether a dictionary has a nested key, using dot notation.
+
+        Args:
+            data: Dictionary to search.
+            key: Dot-separated key path.
+
+        Returns:
+            True if the key path is present (even with a null value).
+        """
+        parts = self._split_key(key)
+        current: Any = data
+        for part in parts:
+            if not isinstance(current, dict) or part not in current:
+                return False
+            current = current[part]
+        return True
+
     def _set_nested(self, data: dict[str, Any], key: str, value: Any) -> None:
         """Set a nested value in a dictionary using dot notation.
 
@@ -331,7 +647,7 @@ class ConfigManager:
             key: Dot-separated key path.
             value: Value to set.
         """
-        parts = key.split(".")
+        parts = self._split_key(key)
         current = data
         for part in parts[:-1]:
             if part not in current or not isinstance(current[part], dict):
@@ -349,7 +665,7 @@ class ConfigManager:
         Returns:
             True if the key was found and removed, False otherwise.
         """
-        parts = key.split(".")
+        parts = self._split_key(key)
         current = data
         for part in parts[:-1]:
             if not isinstance(current, dict) or part not in current:
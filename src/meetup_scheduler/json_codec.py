@@ -0,0 +1,201 @@
+##############################################################################
+#
+# Name: json_codec.py
+#
+# Function:
+#       JsonCodec class for JSON encoding and decoding, using orjson if present
+#
+# Copyright notice and license:
+#       See LICENSE.md
+#
+# Author:
+#       Terry Moore
+#
+##############################################################################
+
+from __future__ import annotations
+
+import io
+import json
+import sys
+from collections.abc import Iterable
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment] -- optional extra not installed
+
+
+class JsonCodec:
+    """Encode and decode JSON documents.
+
+    orjson is used when it is installed (it is the optional "orjson"
+    extra); otherwise the standard json module is. Both write documents
+    indented by two spaces, with non-ASCII characters written as UTF-8
+    rather than escaped, and object keys that aren't strings converted
+    to strings. Decoding errors are json.JSONDecodeError in both cases
+    (orjson's error class derives from it).
+
+    NaN and infinite numbers aren't valid JSON, and the backends differ
+    on them: json raises ValueError, while orjson writes null. Callers
+    must not pass them.
+    """
+
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        """Encode a value as an indented JSON document.
+
+        Args:
+            obj: Value to encode.
+
+        Returns:
+            The UTF-8 encoded document, without a trailing newline.
+        """
+        if orjson is not None:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(obj, indent=2, ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+    @staticmethod
+    def dumps_compact(obj: Any) -> bytes:
+        """Encode a value as JSON without any whitespace, e.g. for the wire.
+
+        Args:
+            obj: Value to encode.
+
+        Returns:
+            The UTF-8 encoded document.
+        """
+        if orjson is not None:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    @staticmethod
+    def dump(obj: Any, fp: BinaryIO) -> None:
+        """Write a value to a binary file as an indented JSON document.
+
+        The document is followed by a newline. Without orjson, the encoder
+        writes to the file as it goes, rather than building the whole
+        document first.
+
+        Args:
+            obj: Value to encode.
+            fp: File opened for binary writing.
+        """
+        if orjson is not None:
+            fp.write(
+                orjson.dumps(
+                    obj,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_APPEND_NEWLINE
+                    | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+            return
+
+        text = io.TextIOWrapper(fp, encoding="utf-8", newline="\n")
+        try:
+            json.dump(obj, text, indent=2, ensure_ascii=False, allow_nan=False)
+            text.write("\n")
+            text.flush()
+        finally:
+            # Leave fp open for the caller
+            text.detach()
+
+    @classmethod
+    def dump_stdout(cls, obj: Any) -> None:
+        """Print a value to stdout as an indented JSON document.
+
+        The document is written to the binary buffer under sys.stdout, or,
+        if stdout is text-only (e.g. a StringIO from redirect_stdout), to
+        sys.stdout itself.
+
+        Args:
+            obj: Value to encode.
+        """
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            sys.stdout.write(cls.dumps(obj).decode("utf-8") + "\n")
+            return
+
+        sys.stdout.flush()
+        cls.dump(obj, buffer)
+        buffer.flush()
+
+    @classmethod
+    def dump_streaming(
+        cls, head: dict[str, Any], key: str, items: Iterable[Any], fp: BinaryIO
+    ) -> None:
+        """Write an object whose last member is a list, one element at a time.
+
+        The output is the same as dump({**head, key: list(items)}, fp), but
+        the list is never built: each element is encoded and written as
+        items yields it.
+
+        Args:
+            head: Members written before the list.
+            key: Name of the list member.
+            items: Elements of the list.
+            fp: File opened for binary writing.
+        """
+        fp.write(b"{\n")
+        for name, value in head.items():
+            fp.write(b"  " + cls._encode_key(name) + b": ")
+            fp.write(cls.dumps(value).replace(b"\n", b"\n  ") + b",\n")
+
+        fp.write(b"  " + cls._encode_key(key) + b": [")
+        separator = b"\n    "
+        for item in items:
+            fp.write(separator + cls.dumps(item).replace(b"\n", b"\n    "))
+            separator = b",\n    "
+        # json writes an empty list as [] on one line
+        fp.write(b"]\n}\n" if separator == b"\n    " else b"\n  ]\n}\n")
+
+    @classmethod
+    def dump_streaming_stdout(
+        cls, head: dict[str, Any], key: str, items: Iterable[Any]
+    ) -> None:
+        """Print an object whose last member is a list, one element at a time.
+
+        As with dump_stdout(), a text-only stdout is written to directly;
+        the document is then built in memory first.
+
+        Args:
+            head: Members written before the list.
+            key: Name of the list member.
+            items: Elements of the list.
+        """
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            fp = io.BytesIO()
+            cls.dump_streaming(head, key, items, fp)
+            sys.stdout.write(fp.getvalue().decode("utf-8"))
+            return
+
+        sys.stdout.flush()
+        cls.dump_streaming(head, key, items, buffer)
+        buffer.flush()
+
+    @staticmethod
+    def _encode_key(key: str) -> bytes:
+        """Encode an object member name."""
+        return json.dumps(key, ensure_ascii=False).encode("utf-8")
+
+    @staticmethod
+    def loads(data: bytes | str) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            data: The document.
+
+        Returns:
+            The decoded value.
+
+        Raises:
+            json.JSONDecodeError: If data isn't valid JSON.
+        """
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
@@ -15,11 +15,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import httpx
 
+from meetup_scheduler.json_codec import JsonCodec
+
 
 class MeetupClient:
     """Client for the Meetup GraphQL API.
@@ -42,6 +45,19 @@ class MeetupClient:
     # Maximum items per page for pagination
     MAX_PAGE_SIZE = 50
 
+    # Connections kept open for reuse
+    MAX_CONNECTIONS = 8
+
+    # Most groups whose past events are asked for in one request
+    MAX_BATCH_GROUPS = 10
+
+    # Fields of a group's pastEvents connection that we fetch
+    PAST_EVENTS_FIELDS = (
+        "count pageInfo { endCursor hasNextPage }"
+        " edges { node { id title dateTime"
+        " venue { id name address city state country } } }"
+    )
+
     def __init__(self, access_token: str) -> None:
         """Initialize the Meetup client.
 
@@ -50,16 +66,45 @@ class MeetupClient:
         """
         self._access_token = access_token
 
+        # One connection pool for all of this client's requests, so TLS
+        # connections are reused
+        self._http = httpx.Client(
+            headers={
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/json",
+            },
+            timeout=self.DEFAULT_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=self.MAX_CONNECTIONS),
+        )
+
+    def __enter__(self) -> MeetupClient:
+        """Return the client, for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the client at the end of a with statement."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the client's connections."""
+        self._http.close()
+
     def _execute_query(
         self,
         query: str,
         variables: dict[str, Any] | None = None,
+        *,
+        not_found: set[str] | None = None,
     ) -> dict[str, Any]:
         """Execute a GraphQL query against the Meetup API.
 
         Args:
             query: GraphQL query string.
             variables: Optional variables for the query.
+            not_found: If given, an error saying that a top-level field
+                (such as an aliased groupByUrlname) wasn't found doesn't
+                raise; the field's name is added to this set instead, and
+                the field is null in the data. Any other error still raises.
 
         Returns:
             The 'data' portion of the GraphQL response.
@@ -67,21 +112,14 @@ class MeetupClient:
         Raises:
             Error: If the request fails or returns errors.
         """
-        headers = {
-            "Authorization": f"Bearer {self._access_token}",
-            "Content-Type": "application/json",
-        }
-
         payload: dict[str, Any] = {"query": query}
         if variables:
             payload["variables"] = variables
 
         try:
-            response = httpx.post(
-                self.API_ENDPOINT,
-                json=payload,
-                headers=headers,
-                timeout=self.DEFAULT_TIMEOUT,
+            # Content-Type is set on the client
+            response = self._http.post(
+                self.API_ENDPOINT, content=JsonCodec.dumps_compact(payload)
             )
         except httpx.RequestError as e:
             raise self.Error(f"Network error: {e}") from e
@@ -90,15 +128,30 @@ class MeetupClient:
             self._handle_http_error(response)
 
         try:
-            result = response.json()
+            result = JsonCodec.loads(response.content)
         except ValueError as e:
             raise self.Error(f"Invalid JSON response: {e}") from e
 
-        # Check for GraphQL errors
-        if "errors" in result:
-            self._handle_graphql_errors(result["errors"])
+        data = result.get("data") or {}
 
-        return result.get("data", {})
+        # Check for GraphQL errors
+        errors = result.get("errors")
+        if errors:
+            if not_found is None:
+                self._handle_graphql_errors(errors)
+            else:
+                for error in errors:
+                    path = error.get("path") or []
+                    if (
+                        len(path) == 1
+                        and data.get(path[0]) is None
+                        and self._is_not_found_error(error)
+                    ):
+                        not_found.add(path[0])
+                    else:
+                        self._handle_graphql_errors([error])
+
+        return data
 
     def _handle_http_error(self, response: httpx.Response) -> None:
         """Handle non-200 HTTP responses.
@@ -111,7 +164,7 @@ class MeetupClient:
         """
         # Try to extract error details from response
         try:
-            error_data = response.json()
+            error_data = JsonCodec.loads(response.content)
             if "errors" in error_data:
                 self._handle_graphql_errors(error_data["errors"])
         except (ValueError, KeyError):
@@ -146,6 +199,21 @@ class MeetupClient:
 
         raise self.Error(f"API error: {message}")
 
+    def _is_not_found_error(self, error: dict[str, Any]) -> bool:
+        """Check whether a GraphQL error says that something wasn't found.
+
+        Args:
+            error: Error object from a GraphQL response.
+
+        Returns:
+            True for a NOT_FOUND error, or for an error without a code
+            whose message says "not found".
+        """
+        code = error.get("extensions", {}).get("code")
+        if code is not None:
+            return code == "NOT_FOUND"
+        return "not found" in error.get("message", "").lower()
+
     def get_self(self) -> dict[str, Any]:
         """Get information about the authenticated user.
 
@@ -208,12 +276,15 @@ class MeetupClient:
         self,
         urlname: str,
         years: int = 2,
+        since: datetime | None = None,
     ) -> list[dict[str, Any]]:
         """Get past events for a group.
 
         Args:
             urlname: The group's URL name.
             years: Number of years to look back (default: 2).
+            since: If given, only events from this time on are fetched
+                (but still no more than years back).
 
         Returns:
             List of event dictionaries.
@@ -253,8 +324,7 @@ class MeetupClient:
         }
         """
 
-        # Calculate cutoff date
-        cutoff = datetime.now(timezone.utc) - timedelta(days=years * 365)
+        cutoff = self._past_events_cutoff(years, since)
 
         events: list[dict[str, Any]] = []
         cursor: str | None = None
@@ -274,40 +344,170 @@ class MeetupClient:
             if not group:
                 raise self.Error(f"Group not found: {urlname}")
 
-            past_events = group.get("pastEvents", {})
-            edges = past_events.get("edges", [])
-
-            for edge in edges:
-                node = edge.get("node", {})
-                event_dt = node.get("dateTime")
-
-                # Check if event is within the time range
-                if event_dt:
-                    try:
-                        # Parse ISO format datetime
-                        dt = datetime.fromisoformat(event_dt.replace("Z", "+00:00"))
-                        if dt < cutoff:
-                            # Event is too old, stop pagination
-                            has_next = False
-                            break
-                    except ValueError:
-                        pass
-
-                events.append(node)
-
-            # Check for more pages
-            page_info = past_events.get("pageInfo", {})
-            if has_next:
-                has_next = page_info.get("hasNextPage", False)
-                cursor = page_info.get("endCursor")
+            cursor, _ = self._collect_past_events(group.get("pastEvents", {}), cutoff, events)
+            has_next = cursor is not None
 
         return events
 
-    def extract_venues(self, events: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Extract unique venues from a list of events.
+    def get_past_events_batch(
+        self,
+        urlnames: list[str],
+        years: int = 2,
+        since: Mapping[str, datetime] | None = None,
+        complete: set[str] | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Get past events for several groups, with one request per page.
+
+        Each request asks for the next page of events of every group that
+        has more (up to MAX_BATCH_GROUPS groups at a time), using an alias
+        for each group, instead of making a request per group per page.
+
+        Args:
+            urlnames: The groups' URL names.
+            years: Number of years to look back (default: 2).
+            since: Optional start times, by group URL name; for these
+                groups, only events from that time on are fetched (but
+                still no more than years back).
+            complete: If given, the URL names of the groups whose paging
+                reached the cutoff or the last page are added to it. Other
+                groups' lists may be missing older events.
+
+        Returns:
+            Lists of event dictionaries, by group URL name, in the order of
+            urlnames. Groups that the API reports as not found (on their
+            first page) are left out.
+
+        Raises:
+            Error: If a request fails or returns any other error, or if a
+                group is missing from a response without such a report.
+        """
+        since = since or {}
+        cutoffs = {
+            urlname: self._past_events_cutoff(years, since.get(urlname))
+            for urlname in urlnames
+        }
+
+        events: dict[str, list[dict[str, Any]]] = {}
+        # Groups that have more pages to fetch, with the cursor for each
+        pending: dict[str, str | None] = dict.fromkeys(urlnames)
+
+        while pending:
+            batch = list(pending.items())[: self.MAX_BATCH_GROUPS]
+            variables: dict[str, Any] = {"first": self.MAX_PAGE_SIZE}
+            for i, (urlname, cursor) in enumerate(batch):
+                variables[f"u{i}"] = urlname
+                if cursor:
+                    variables[f"a{i}"] = cursor
+
+            not_found: set[str] = set()
+            data = self._execute_query(
+                self._past_events_batch_query(len(batch)), variables, not_found=not_found
+            )
+
+            for i, (urlname, _) in enumerate(batch):
+                del pending[urlname]
+                group = data.get(f"g{i}")
+                if not group:
+                    # Don't drop a group whose earlier pages were fetched
+                    if f"g{i}" in not_found and urlname not in events:
+                        continue
+                    raise self.Error(f"No events returned for group: {urlname}")
+                group_events = events.setdefault(urlname, [])
+                cursor, done = self._collect_past_events(
+                    group.get("pastEvents", {}), cutoffs[urlname], group_events
+                )
+                if cursor is not None:
+                    pending[urlname] = cursor
+                elif done and complete is not None:
+                    complete.add(urlname)
+
+        return {urlname: events[urlname] for urlname in urlnames if urlname in events}
+
+    def _past_events_cutoff(self, years: int, since: datetime | None) -> datetime:
+        """Return the time before which past events aren't fetched.
+
+        The API has no filter for event times, but returns past events
+        newest first, so paging stops at the first event before the cutoff.
+
+        Args:
+            years: Number of years to look back.
+            since: Optional time to start from, if later.
+
+        Returns:
+            The later of the two times.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=years * 365)
+        if since is not None and since > cutoff:
+            return since
+        return cutoff
+
+    def _past_events_batch_query(self, count: int) -> str:
+        """Build the query for get_past_events_batch().
+
+        Args:
+            count: Number of groups in the batch.
+
+        Returns:
+            GraphQL query with aliases g0, g1, ... for the groups given by
+            variables $u0, $u1, ..., each starting after cursor $a0, $a1, ...
+        """
+        params = "".join(f", $u{i}: String!, $a{i}: String" for i in range(count))
+        groups = "".join(
+            f"g{i}: groupByUrlname(urlname: $u{i}) {{"
+            f" pastEvents(input: {{ first: $first, after: $a{i} }}) {{"
+            f" {self.PAST_EVENTS_FIELDS} }} }}\n"
+            for i in range(count)
+        )
+        return f"query($first: Int!{params}) {{\n{groups}}}"
+
+    def _collect_past_events(
+        self,
+        past_events: dict[str, Any],
+        cutoff: datetime,
+        events: list[dict[str, Any]],
+    ) -> tuple[str | None, bool]:
+        """Add one page of a group's past events to a list.
+
+        Args:
+            past_events: The group's pastEvents field from a response.
+            cutoff: Events before this time end the list.
+            events: List of events to add to.
+
+        Returns:
+            Tuple of (cursor, done). cursor is that of the next page, or
+            None if there are no more events to fetch; done is True if the
+            events reached the cutoff or the last page, and False if paging
+            stopped early (the API reported more pages but no cursor).
+        """
+        for edge in past_events.get("edges", []):
+            node = edge.get("node", {})
+            event_dt = node.get("dateTime")
+
+            # Check if event is within the time range
+            if event_dt:
+                try:
+                    # Parse ISO format datetime
+                    dt = datetime.fromisoformat(event_dt.replace("Z", "+00:00"))
+                    if dt < cutoff:
+                        # Event is too old, stop pagination
+                        return None, True
+                except ValueError:
+                    pass
+
+            events.append(node)
+
+        # Check for more pages
+        page_info = past_events.get("pageInfo", {})
+        if not page_info.get("hasNextPage", False):
+            return None, True
+        cursor = page_info.get("endCursor")
+        return cursor, cursor is not None
+
+    def extract_venues(self, events: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Extract unique venues from events.
 
         Args:
-            events: List of event dictionaries.
+            events: Event dictionaries; any iterable, consumed once.
 
         Returns:
             List of unique venue dictionaries.
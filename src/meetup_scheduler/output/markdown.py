@@ -157,12 +157,6 @@ class MarkdownGenerator:
         Returns:
             Markdown output string.
         """
-        output = StringIO()
-
-        # Source info
-        if parsed.source_path:
-            output.write(f"**Source:** `{parsed.source_path}`\n\n")
-
         # Generate content
         if grouped:
             content = self.generate_monthly(
@@ -173,8 +167,11 @@ class MarkdownGenerator:
                 parsed.events, title="Scheduled Events", dry_run=dry_run
             )
 
-        output.write(content)
-        return output.getvalue()
+        # Source info goes first; the content is already one string, so
+        # it isn't copied through another buffer
+        if parsed.source_path:
+            return f"**Source:** `{parsed.source_path}`\n\n{content}"
+        return content
 
     def _format_event_row(
         self,
@@ -43,6 +43,9 @@ class ReadmeReader:
     def __init__(self) -> None:
         """Initialize the README reader."""
         self._content: str | None = None
+        # Sections already extracted, by name (None if not present)
+        self._sections: dict[str, str | None] = {}
+        self._all_sections: dict[str, str] | None = None
 
     def _get_readme_resource(self) -> str:
         """Get the README content from package resources or source directory.
@@ -106,15 +109,18 @@ class ReadmeReader:
         Returns:
             The section content (without markers), or None if not found.
         """
+        if section_name in self._sections:
+            return self._sections[section_name]
+
         pattern = re.compile(
             rf"<!--\s*meetup-scheduler:{re.escape(section_name)}:start\s*-->\s*\n"
             rf"(.*?)\n\s*<!--\s*meetup-scheduler:{re.escape(section_name)}:end\s*-->",
             re.DOTALL,
         )
         match = pattern.search(self.content)
-        if match:
-            return match.group(1).strip()
-        return None
+        section = match.group(1).strip() if match else None
+        self._sections[section_name] = section
+        return section
 
     def get_all_sections(self) -> dict[str, str]:
         """Extract all marked sections from the README.
@@ -122,12 +128,14 @@ class ReadmeReader:
         Returns:
             Dictionary mapping section names to their content.
         """
-        sections: dict[str, str] = {}
-        for match in self.SECTION_PATTERN.finditer(self.content):
-            section_name = match.group(1)
-            section_content = match.group(2).strip()
-            sections[section_name] = section_content
-        return sections
+        if self._all_sections is None:
+            sections: dict[str, str] = {}
+            for match in self.SECTION_PATTERN.finditer(self.content):
+                section_name = match.group(1)
+                section_content = match.group(2).strip()
+                sections[section_name] = section_content
+            self._all_sections = sections
+        return dict(self._all_sections)
 
     def print_raw(self) -> None:
         """Print the README as raw markdown to stdout."""
@@ -247,7 +255,12 @@ class ReadmeReader:
             console.print(md)
 
     def print_section(
-        self, section_name: str, *, raw: bool = False, pager: bool = False
+        self,
+        section_name: str,
+        *,
+        raw: bool = False,
+        pager: bool = False,
+        console: Console | None = None,
     ) -> bool:
         """Print a specific section from the README.
 
@@ -257,6 +270,7 @@ class ReadmeReader:
             section_name: Name of the section to print.
             raw: If True, print as raw markdown. If False, use rich formatting.
             pager: If True, use system pager for long output.
+            console: Rich Console instance. If None, creates a new one.
 
         Returns:
             True if section was found and printed, False otherwise.
@@ -284,7 +298,8 @@ class ReadmeReader:
 
                 self._simple_pager(output)
             else:
-                console = Console()
+                if console is None:
+                    console = Console()
                 console.print(md)
 
         return True
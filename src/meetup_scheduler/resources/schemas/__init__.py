@@ -0,0 +1,16 @@
+##############################################################################
+#
+# Name: __init__.py
+#
+# Function:
+#       JSON schemas for meetup-scheduler files
+#
+# Copyright notice and license:
+#       See LICENSE.md
+#
+# Author:
+#       Terry Moore
+#
+##############################################################################
+
+from __future__ import annotations
@@ -23,6 +23,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from zoneinfo import ZoneInfo
 
+from meetup_scheduler.json_codec import JsonCodec
 from meetup_scheduler.scheduler.validator import SchemaValidator, ValidationError
 
 if TYPE_CHECKING:
@@ -109,13 +110,13 @@ class EventParser:
         Raises:
             Error: If file cannot be read, parsed, or validated.
         """
-        # Load JSON
+        # Load JSON; the decoder works from the raw bytes
         try:
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
+            with open(file_path, "rb") as f:
+                data = JsonCodec.loads(f.read())
         except OSError as e:
             raise self.Error(f"Cannot read file {file_path}: {e}") from e
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise self.Error(f"Invalid JSON in {file_path}: {e}") from e
 
         return self.parse_data(data, source_path=file_path)
@@ -15,12 +15,13 @@
 
 from __future__ import annotations
 
+import calendar
 import re
 from dataclasses import dataclass
 from datetime import date, timedelta
 from typing import TYPE_CHECKING
 
-from dateutil.relativedelta import FR, MO, SA, SU, TH, TU, WE, relativedelta
+from dateutil.relativedelta import FR, MO, SA, SU, TH, TU, WE
 
 if TYPE_CHECKING:
     from dateutil.relativedelta import weekday
@@ -61,9 +62,9 @@ ORDINAL_MAP: dict[str, int] = {
 }
 
 
-@dataclass
+@dataclass(frozen=True)
 class PatternSpec:
-    """Specification for a recurrence pattern."""
+    """Specification for a recurrence pattern (immutable, so it can be shared)."""
 
     ordinal: int  # 1-5 for first-fifth, -1 for last
     weekday: weekday  # noqa: F811 - shadowing module-level weekday type
@@ -107,9 +108,17 @@ class RecurrenceGenerator:
 
         pass
 
+    def __init__(self) -> None:
+        """Initialize the generator."""
+        # Parsed patterns, by pattern string
+        self._specs: dict[str, PatternSpec] = {}
+
     def parse_pattern(self, pattern: str) -> PatternSpec:
         """Parse a pattern string into a PatternSpec.
 
+        Each pattern is parsed once per generator; later calls return the
+        same PatternSpec.
+
         Args:
             pattern: Pattern string like "first Thursday" or
                     "first Thursday after first Tuesday".
@@ -117,6 +126,23 @@ class RecurrenceGenerator:
         Returns:
             PatternSpec with parsed values.
 
+        Raises:
+            Error: If pattern format is invalid.
+        """
+        spec = self._specs.get(pattern)
+        if spec is None:
+            spec = self._specs[pattern] = self._parse_pattern(pattern)
+        return spec
+
+    def _parse_pattern(self, pattern: str) -> PatternSpec:
+        """Parse a pattern string, without caching.
+
+        Args:
+            pattern: Pattern string.
+
+        Returns:
+            PatternSpec with parsed values.
+
         Raises:
             Error: If pattern format is invalid.
         """
@@ -188,7 +214,7 @@ class RecurrenceGenerator:
                     break
 
             # Move to next month
-            current_month = current_month + relativedelta(months=1)
+            current_month = self._next_month(current_month)
 
             # Safety limit to prevent infinite loops
             if current_month.year > start.year + 100:
@@ -223,24 +249,50 @@ class RecurrenceGenerator:
         Returns:
             The occurrence date, or None if ordinal doesn't exist.
         """
-        # Use relativedelta to find the nth weekday
-        if spec.ordinal == -1:
-            # Last weekday of month - go to next month and back
-            next_month = month + relativedelta(months=1)
-            occurrence = next_month + relativedelta(
-                days=-1, weekday=spec.weekday(-1)
-            )
-        else:
-            # Nth weekday of month
-            occurrence = month + relativedelta(
-                weekday=spec.weekday(spec.ordinal)
-            )
-
-        # Verify the occurrence is in the correct month
-        if occurrence.month != month.month:
+        day = self._nth_weekday_of_month(
+            month.year, month.month, spec.weekday.weekday, spec.ordinal
+        )
+        if day is None:
             return None
+        return month.replace(day=day)
 
-        return occurrence
+    def _nth_weekday_of_month(
+        self, year: int, month: int, weekday: int, n: int
+    ) -> int | None:
+        """Find the day of the month of the nth given weekday.
+
+        Plain integer arithmetic on calendar.monthrange(), since this runs
+        once per month generated.
+
+        Args:
+            year: Year.
+            month: Month (1-12).
+            weekday: Weekday (0 = Monday).
+            n: 1-5 for first-fifth, -1 for last.
+
+        Returns:
+            Day of the month, or None if the month has no such weekday.
+        """
+        first_weekday, days_in_month = calendar.monthrange(year, month)
+        if n == -1:
+            last_weekday = (first_weekday + days_in_month - 1) % 7
+            return days_in_month - (last_weekday - weekday) % 7
+
+        day = 1 + (weekday - first_weekday) % 7 + 7 * (n - 1)
+        return day if day <= days_in_month else None
+
+    def _next_month(self, month: date) -> date:
+        """Get the first day of the following month.
+
+        Args:
+            month: First day of a month.
+
+        Returns:
+            First day of the next month.
+        """
+        if month.month == 12:
+            return date(month.year + 1, 1, 1)
+        return date(month.year, month.month + 1, 1)
 
     def _get_complex_occurrence(self, spec: PatternSpec, month: date) -> date | None:
         """Get complex pattern occurrence for a month.
@@ -319,7 +371,7 @@ class RecurrenceGenerator:
                 return d
 
         # Try generating from next month if the after date is late in month
-        next_month = date(after.year, after.month, 1) + relativedelta(months=1)
+        next_month = self._next_month(date(after.year, after.month, 1))
         dates = self.generate(pattern, next_month, count=1)
         if dates:
             return dates[0]
@@ -272,16 +272,22 @@ def create_meetup_api_handler(
         if "self" in query and "memberships" in query:
             return Response(200, json=mock_self_response)
 
-        # Past events query
+        # Past events query, for one group or a batch of groups; groups
+        # that aren't found are null
         if "groupByUrlname" in query and "pastEvents" in query:
-            urlname = variables.get("urlname", "")
-            if urlname == "test-group-one":
-                return Response(200, json=mock_past_events_response)
-            elif urlname == "test-group-two":
-                return Response(200, json=mock_past_events_response_group2)
-            else:
-                # Group not found
-                return Response(200, json={"data": {"groupByUrlname": None}})
+            groups = {
+                "test-group-one": mock_past_events_response["data"]["groupByUrlname"],
+                "test-group-two": mock_past_events_response_group2["data"]["groupByUrlname"],
+            }
+            if "urlname" in variables:
+                group = groups.get(variables["urlname"])
+                return Response(200, json={"data": {"groupByUrlname": group}})
+            data = {
+                f"g{name[1:]}": groups.get(value)
+                for name, value in variables.items()
+                if name.startswith("u")
+            }
+            return Response(200, json={"data": data})
 
         # Default: return empty data
         return Response(200, json={"data": {}})
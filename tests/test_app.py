@@ -17,6 +17,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from meetup_scheduler.app import App
 
 
@@ -280,6 +282,29 @@ class TestAppCommands:
         app = App(args=["sync"], _testing=True)
         assert app.args.venues_only is None
 
+    def test_sync_full_option(self) -> None:
+        """Test sync --full option."""
+        app = App(args=["sync", "--full"])
+        assert app.args.command == "sync"
+        assert app.args.full is True
+
+    def test_sync_full_negated(self) -> None:
+        """Test sync --no-full option."""
+        # Use _testing=True so default is None, allowing us to verify negation works
+        app = App(args=["sync", "--no-full"], _testing=True)
+        assert app.args.command == "sync"
+        assert app.args.full is False
+
+    def test_sync_full_default(self) -> None:
+        """Test full defaults to False in production mode."""
+        app = App(args=["sync"])
+        assert app.args.full is False
+
+    def test_sync_full_default_none_in_testing(self) -> None:
+        """Test full defaults to None in testing mode."""
+        app = App(args=["sync"], _testing=True)
+        assert app.args.full is None
+
     def test_schedule_command(self) -> None:
         """Test schedule command is parsed."""
         app = App(args=["schedule"])
@@ -392,6 +417,130 @@ class TestAppGlobalOptionsWithCommands:
         assert app.args.command == "schedule"
 
 
+class TestAppFindCommand:
+    """Test the pre-scan that selects which subparser to build."""
+
+    def test_finds_command(self) -> None:
+        """Test that the command name is found."""
+        app = App(args=["sync", "--years", "3"])
+        assert app._find_command() == "sync"
+
+    def test_skips_global_options(self) -> None:
+        """Test that global options before the command are skipped."""
+        app = App(args=["-vv", "--quiet", "--dry-run", "init"])
+        assert app._find_command() == "init"
+
+    def test_skips_config_value(self) -> None:
+        """Test that the value of --config isn't taken as the command."""
+        app = App(args=["--config", "init", "sync"])
+        assert app._find_command() == "sync"
+
+    def test_skips_abbreviated_config_value(self) -> None:
+        """Test that the value of an abbreviated --config is skipped."""
+        app = App(args=["--conf", "init", "sync"])
+        assert app._find_command() == "sync"
+
+    def test_config_with_equals(self) -> None:
+        """Test that --config=PATH doesn't consume the next argument."""
+        app = App(args=["--config=path", "init"])
+        assert app._find_command() == "init"
+
+    def test_defaults_to_sys_argv(self) -> None:
+        """Test that sys.argv is scanned and parsed when no args are given."""
+        from unittest.mock import patch
+
+        with patch("sys.argv", ["meetup-scheduler", "-v", "logout"]):
+            app = App()
+            assert app._find_command() == "logout"
+            assert app.args.command == "logout"
+            assert app.args.verbose == 1
+
+    def test_no_command(self) -> None:
+        """Test that no command returns None."""
+        app = App(args=["-v"])
+        assert app._find_command() is None
+
+    def test_unknown_command(self) -> None:
+        """Test that an unknown command returns None."""
+        app = App(args=["bogus"])
+        assert app._find_command() is None
+
+    def test_help_before_command(self) -> None:
+        """Test that top-level help needs all subparsers."""
+        for args in (
+            ["-h", "init"],
+            ["--help", "init"],
+            ["--he", "init"],
+            ["--h", "init"],
+            ["-vh", "init"],
+        ):
+            app = App(args=args)
+            assert app._find_command() is None
+
+    def test_help_after_command(self) -> None:
+        """Test that help after the command is for the command."""
+        app = App(args=["init", "--help"])
+        assert app._find_command() == "init"
+
+    def test_only_command_subparser_built(self) -> None:
+        """Test that only the named command's subparser is built."""
+        app = App(args=["logout"])
+        parser = app._create_parser(command="logout")
+        subparsers = parser._subparsers._group_actions[0]
+        assert list(subparsers.choices) == ["logout"]
+
+    def test_all_subparsers_built_without_command(self) -> None:
+        """Test that all subparsers are built when no command is given."""
+        app = App(args=[])
+        parser = app._create_parser()
+        subparsers = parser._subparsers._group_actions[0]
+        assert list(subparsers.choices) == [
+            "init",
+            "login",
+            "logout",
+            "config",
+            "sync",
+            "schedule",
+            "generate",
+            "readme",
+        ]
+
+    def test_epilog_skipped_with_command(self) -> None:
+        """Test that the homepage isn't looked up when a command is given."""
+        from unittest.mock import patch
+
+        with patch("meetup_scheduler.metadata.get_homepage_url") as mock_homepage:
+            parser = App(args=["sync"]).parser
+        mock_homepage.assert_not_called()
+        assert parser.epilog is None
+
+    def test_epilog_without_command(self) -> None:
+        """Test that top-level help includes the homepage."""
+        from unittest.mock import patch
+
+        with patch(
+            "meetup_scheduler.metadata.get_homepage_url",
+            return_value="https://example.com",
+        ):
+            parser = App(args=["--help"]).parser
+        assert parser.epilog == "For more information, visit: https://example.com"
+
+    def test_formatter_class_only_for_top_level_help(self) -> None:
+        """Test that the raw description formatter is only set for top-level help."""
+        import argparse
+
+        assert App(args=["sync"]).parser.formatter_class is argparse.HelpFormatter
+        assert App(args=["-h"]).parser.formatter_class is argparse.RawDescriptionHelpFormatter
+
+    def test_unknown_command_still_rejected(self) -> None:
+        """Test that an unknown command is still reported by argparse."""
+        import pytest
+
+        app = App(args=["bogus"])
+        with pytest.raises(SystemExit):
+            _ = app.args
+
+
 class TestAppRun:
     """Test App.run() behavior."""
 
@@ -400,6 +549,15 @@ class TestAppRun:
         app = App(args=[])
         assert app.run() == 0
 
+    def test_no_command_reuses_parser(self) -> None:
+        """Test that printing help reuses the parser built for parsing."""
+        from unittest.mock import patch
+
+        app = App(args=[])
+        with patch.object(app, "_create_parser", wraps=app._create_parser) as create:
+            assert app.run() == 0
+        assert create.call_count == 1
+
     def test_config_command_returns_zero(self) -> None:
         """Test that config command returns 0."""
         app = App(args=["config"])
@@ -412,6 +570,39 @@ class TestAppRun:
         assert app.run() == 0
 
 
+class TestMainVersion:
+    """Test the --version fast path in main()."""
+
+    def test_bare_version_skips_app(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that a bare --version prints the version without App."""
+        from unittest.mock import patch
+
+        from meetup_scheduler.__main__ import main
+        from meetup_scheduler.__version__ import __version__
+
+        with (
+            patch("sys.argv", ["meetup-scheduler", "--version"]),
+            patch("meetup_scheduler.app.App") as mock_app,
+        ):
+            assert main() == 0
+        mock_app.assert_not_called()
+        assert capsys.readouterr().out == f"meetup-scheduler {__version__}\n"
+
+    def test_version_matches_argparse(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that the fast path prints what argparse would."""
+        from unittest.mock import patch
+
+        from meetup_scheduler.__main__ import main
+
+        with patch("sys.argv", ["meetup-scheduler", "--version"]):
+            main()
+        fast = capsys.readouterr().out
+
+        with pytest.raises(SystemExit):
+            _ = App(args=["-v", "--version"]).args
+        assert capsys.readouterr().out == fast
+
+
 class TestAppLogging:
     """Test App logging configuration."""
 
@@ -498,3 +689,51 @@ class TestAppErrorHandling:
             pytest.raises(RuntimeError, match="Test error"),
         ):
             app.run()
+
+
+class TestAppServices:
+    """Test the objects App creates on demand and shares with commands."""
+
+    def test_token_manager_shared(self) -> None:
+        """Test that token_manager is created once, for the app's config."""
+        from meetup_scheduler.auth.tokens import TokenManager
+
+        app = App(args=[])
+        token_manager = app.token_manager
+        assert isinstance(token_manager, TokenManager)
+        assert app.token_manager is token_manager
+
+    def test_oauth_flow_shared(self) -> None:
+        """Test that oauth_flow is created once."""
+        from meetup_scheduler.auth.oauth import OAuthFlow
+
+        app = App(args=[])
+        oauth_flow = app.oauth_flow
+        assert isinstance(oauth_flow, OAuthFlow)
+        assert app.oauth_flow is oauth_flow
+
+    def test_console_shared_with_commands(self) -> None:
+        """Test that console is created once, and is the one commands print through."""
+        from rich.console import Console
+
+        from meetup_scheduler.commands.logout_cmd import LogoutCommand
+
+        app = App(args=[])
+        console = app.console
+        assert isinstance(console, Console)
+        assert app.console is console
+        assert LogoutCommand(app, app.args).console is console
+
+    def test_logout_uses_app_token_manager(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a command sees tokens through the app's token manager."""
+        from meetup_scheduler.commands.logout_cmd import LogoutCommand
+
+        monkeypatch.chdir(tmp_path)
+        app = App(args=["logout"])
+        app.config_manager._user_config_dir = tmp_path / "config"
+        app.token_manager.save_tokens({"access_token": "test", "expires_in": 3600})
+
+        assert LogoutCommand(app, app.args).execute() == 0
+        assert app.token_manager.has_tokens is False
@@ -16,7 +16,10 @@
 from __future__ import annotations
 
 import json
+import os
+import stat
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -139,6 +142,69 @@ class TestConfigManagerProjectConfig:
 
         assert config1 is config2
 
+    def test_missing_project_config_looked_up_once(self, tmp_project_dir: Path) -> None:
+        """Test a missing project config is remembered, without a separate exists() check."""
+        manager = ConfigManager(project_dir=tmp_project_dir)
+
+        with (
+            patch.object(Path, "exists") as mock_exists,
+            patch("builtins.open", side_effect=FileNotFoundError) as mock_open,
+        ):
+            assert manager.get("missing") is None
+            assert manager.get("other") is None
+            assert manager.load_project_config() == {}
+
+        mock_exists.assert_not_called()
+        # One attempt for each of the project and user configs
+        assert mock_open.call_count == 2
+
+    def test_external_change_detected(self, tmp_project_dir: Path) -> None:
+        """Test that a config file changed by another program is reread."""
+        config_path = tmp_project_dir / "meetup-scheduler-local.json"
+        config_path.write_text(json.dumps({"setting": "old"}))
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        assert manager.load_project_config() == {"setting": "old"}
+
+        config_path.write_text(json.dumps({"setting": "newer"}))
+        st = config_path.stat()
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+        assert manager.load_project_config() == {"setting": "newer"}
+
+    def test_own_save_not_reread(self, tmp_project_dir: Path) -> None:
+        """Test that a config just saved isn't read back from the file."""
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        config = {"setting": "saved"}
+        manager.save_project_config(config)
+
+        with patch.object(manager, "_read_json") as mock_read:
+            assert manager.load_project_config() is config
+        mock_read.assert_not_called()
+
+    def test_get_sees_external_change(self, tmp_project_dir: Path) -> None:
+        """Test that get() and get_many() see edits made by other programs."""
+        config_path = tmp_project_dir / "meetup-scheduler-local.json"
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        manager._user_config_dir = tmp_project_dir / "user"
+        manager.save_project_config({"setting": "old"})
+        assert manager.get("setting") == "old"
+
+        config_path.write_text(json.dumps({"setting": "newer"}))
+        st = config_path.stat()
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+        assert manager.get("setting") == "newer"
+        assert manager.get_many(["setting"]) == {"setting": "newer"}
+
+    def test_warm_get_does_not_read(self, tmp_project_dir: Path) -> None:
+        """Test that a warm get() checks the files but doesn't reread them."""
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        manager._user_config_dir = tmp_project_dir / "user"
+        manager.save_project_config({"setting": "value"})
+        assert manager.get("setting") == "value"
+
+        with patch.object(manager, "_read_json") as mock_read:
+            assert manager.get("setting") == "value"
+        mock_read.assert_not_called()
+
 
 class TestConfigManagerCredentials:
     """Test credentials handling."""
@@ -261,6 +327,85 @@ class TestConfigManagerGet:
         assert result == "user_value"
 
 
+class TestConfigManagerGetCache:
+    """Test caching of ConfigManager.get() lookups."""
+
+    def test_repeated_get_walks_config_once(
+        self, tmp_project_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a repeated lookup doesn't search the configs again."""
+        (tmp_project_dir / "meetup-scheduler-local.json").write_text(
+            json.dumps({"organizer": {"name": "Test User"}})
+        )
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        monkeypatch.setattr(manager, "_user_config_dir", tmp_project_dir / "user")
+
+        with patch.object(manager, "_get_nested", wraps=manager._get_nested) as mock_get:
+            assert manager.get("organizer.name") == "Test User"
+            assert manager.get("organizer.name") == "Test User"
+            assert manager.get("missing", "a") == "a"
+            assert manager.get("missing", "b") == "b"
+        # Found in the project config; searched for in both
+        assert [c.args[1] for c in mock_get.call_args_list] == [
+            "organizer.name",
+            "missing",
+            "missing",
+        ]
+
+    def test_set_invalidates(
+        self, tmp_project_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that values set or unset are seen by later lookups."""
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        monkeypatch.setattr(manager, "_user_config_dir", tmp_project_dir / "user")
+
+        assert manager.get("organizer.name") is None
+        manager.set("organizer.name", "Set", user_level=False)
+        assert manager.get("organizer.name") == "Set"
+        manager.unset("organizer.name", user_level=False)
+        assert manager.get("organizer.name") is None
+
+    def test_reload_invalidates(
+        self, tmp_project_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a configuration reread from disk isn't hidden by the cache."""
+        config_path = tmp_project_dir / "meetup-scheduler-local.json"
+        config_path.write_text(json.dumps({"setting": "old"}))
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        monkeypatch.setattr(manager, "_user_config_dir", tmp_project_dir / "user")
+        assert manager.get("setting") == "old"
+
+        config_path.write_text(json.dumps({"setting": "new"}))
+        manager._project_config = None
+        assert manager.get("setting") == "new"
+
+    def test_get_many(self, tmp_project_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test get_many() returns values by key, loading the configs once."""
+        (tmp_project_dir / "meetup-scheduler-local.json").write_text(
+            json.dumps({"organizer": {"name": "Test User"}, "groups": {"g": {}}})
+        )
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        user_dir = tmp_project_dir / "user"
+        user_dir.mkdir()
+        monkeypatch.setattr(manager, "_user_config_dir", user_dir)
+        (user_dir / "config.json").write_text(json.dumps({"defaultTimezone": "UTC"}))
+
+        with patch.object(
+            manager, "load_project_config", wraps=manager.load_project_config
+        ) as mock_load:
+            result = manager.get_many(
+                ["organizer.name", "groups", "defaultTimezone", "venues"], {}
+            )
+
+        assert result == {
+            "organizer.name": "Test User",
+            "groups": {"g": {}},
+            "defaultTimezone": "UTC",
+            "venues": {},
+        }
+        assert mock_load.call_count == 1
+
+
 class TestConfigManagerSet:
     """Test ConfigManager.set() method."""
 
@@ -344,6 +489,52 @@ class TestConfigManagerSet:
             config = json.load(f)
         assert config["project_setting"] == "value"
 
+    def test_set_unchanged_value_not_saved(self, tmp_project_dir: Path) -> None:
+        """Test set() doesn't rewrite the file when the value is unchanged."""
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        manager.set("venues", {"v1": {"name": "Venue"}}, user_level=False)
+
+        with patch.object(manager, "save_project_config") as mock_save:
+            manager.set("venues", {"v1": {"name": "Venue"}}, user_level=False)
+            mock_save.assert_not_called()
+
+            # Changed, or equal but of another type
+            manager.set("venues", {"v1": {"name": "Other"}}, user_level=False)
+            manager.set("count", 1, user_level=False)
+            manager.set("count", True, user_level=False)
+            assert mock_save.call_count == 3
+
+    def test_set_value_changed_in_place_saved(self, tmp_project_dir: Path) -> None:
+        """Test set() saves a stored value that was changed in place."""
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        manager.set("groups", {"a": {}}, user_level=False)
+
+        groups = manager.get("groups")
+        groups["b"] = {}
+        manager.set("groups", groups, user_level=False)
+
+        config_path = tmp_project_dir / "meetup-scheduler-local.json"
+        assert json.loads(config_path.read_text())["groups"] == {"a": {}, "b": {}}
+
+    def test_update_many_saves_once(self, tmp_project_dir: Path) -> None:
+        """Test update_many() applies values in order with a single save."""
+        manager = ConfigManager(project_dir=tmp_project_dir)
+
+        with patch.object(
+            manager, "save_project_config", wraps=manager.save_project_config
+        ) as mock_save:
+            manager.update_many(
+                {"groups": {"g": {"name": "G"}}, "groups.g.lastEventSync": "T", "lastSync": "S"},
+                user_level=False,
+            )
+            assert mock_save.call_count == 1
+
+            manager.update_many({"lastSync": "S"}, user_level=False)
+            assert mock_save.call_count == 1
+
+        assert manager.get("groups") == {"g": {"name": "G", "lastEventSync": "T"}}
+        assert manager.get("lastSync") == "S"
+
 
 class TestConfigManagerUnset:
     """Test ConfigManager.unset() method."""
@@ -505,6 +696,20 @@ class TestConfigManagerGetMerged:
         assert result["organizer"]["name"] == "Project Name"
         assert result["organizer"]["email"] == "user@example.com"
 
+    def test_deep_merge_leaves_inputs_alone(self, tmp_project_dir: Path) -> None:
+        """Test _deep_merge() merges several levels without changing its inputs."""
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        base = {"a": {"b": {"c": 1, "d": 2}, "e": 3}, "f": {"g": 4}}
+        override = {"a": {"b": {"c": 10}, "h": 5}, "f": 6}
+        expected_base = json.loads(json.dumps(base))
+        expected_override = json.loads(json.dumps(override))
+
+        result = manager._deep_merge(base, override)
+
+        assert result == {"a": {"b": {"c": 10, "d": 2}, "e": 3, "h": 5}, "f": 6}
+        assert base == expected_base
+        assert override == expected_override
+
 
 class TestConfigManagerSaveProjectConfig:
     """Test ConfigManager.save_project_config() method."""
@@ -542,3 +747,133 @@ class TestConfigManagerSaveProjectConfig:
 
         # Should be cached
         assert manager._project_config == config
+
+    def test_save_project_config_document_format(self, tmp_project_dir: Path) -> None:
+        """Test that the file is indented UTF-8 JSON ending in a newline."""
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        manager.save_project_config({"venues": {"v1": {"name": "Café"}}})
+
+        config_path = tmp_project_dir / "meetup-scheduler-local.json"
+        assert config_path.read_bytes() == (
+            '{\n  "venues": {\n    "v1": {\n      "name": "Café"\n    }\n  }\n}\n'
+        ).encode()
+
+    def test_invalid_utf8_raises_error(self, tmp_project_dir: Path) -> None:
+        """Test that a config file that isn't UTF-8 raises ConfigManager.Error."""
+        (tmp_project_dir / "meetup-scheduler-local.json").write_bytes(b'{"name": "\xff"}')
+        manager = ConfigManager(project_dir=tmp_project_dir)
+
+        with pytest.raises(ConfigManager.Error):
+            manager.load_project_config()
+
+
+class TestConfigManagerAtomicWrite:
+    """Test that config files are replaced atomically."""
+
+    @pytest.mark.skipif(os.name == "nt", reason="Unix permissions")
+    def test_file_modes(self, tmp_project_dir: Path) -> None:
+        """Test the permissions of new, replaced and credentials files."""
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        manager._user_config_dir = tmp_project_dir / "user"
+
+        old_umask = os.umask(0o022)
+        try:
+            manager.save_project_config({"a": 1})
+        finally:
+            os.umask(old_umask)
+        assert stat.S_IMODE(manager.project_config_path.stat().st_mode) == 0o644
+
+        manager.project_config_path.chmod(0o640)
+        manager.save_project_config({"a": 2})
+        assert stat.S_IMODE(manager.project_config_path.stat().st_mode) == 0o640
+
+        manager.save_credentials({"access_token": "secret"})
+        assert stat.S_IMODE(manager.credentials_path.stat().st_mode) == 0o600
+
+    @pytest.mark.skipif(os.name == "nt", reason="Unix permissions")
+    def test_new_files_follow_umask(self, tmp_project_dir: Path) -> None:
+        """Test that new config files get the umask's permissions."""
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        manager._user_config_dir = tmp_project_dir / "user"
+
+        old_umask = os.umask(0o077)
+        try:
+            manager.save_project_config({"a": 1})
+            manager.save_user_config({"b": 2})
+        finally:
+            os.umask(old_umask)
+        assert stat.S_IMODE(manager.project_config_path.stat().st_mode) == 0o600
+        assert stat.S_IMODE(manager.user_config_path.stat().st_mode) == 0o600
+
+    def test_failed_write_keeps_old_file(self, tmp_project_dir: Path) -> None:
+        """Test that a failed save leaves the old file and no temporary file."""
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        manager.save_project_config({"setting": "old"})
+        before = manager.project_config_path.read_bytes()
+
+        with (
+            patch("os.replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            manager.save_project_config({"setting": "new"})
+
+        assert manager.project_config_path.read_bytes() == before
+        assert [p.name for p in tmp_project_dir.iterdir()] == ["meetup-scheduler-local.json"]
+
+
+class TestConfigManagerLocking:
+    """Test locking of configuration changes."""
+
+    def test_update_waits_for_lock_and_keeps_other_changes(
+        self, tmp_project_dir: Path
+    ) -> None:
+        """Test that set() waits for another writer, then adds to its changes."""
+        import threading
+
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        other = ConfigManager(project_dir=tmp_project_dir)
+        other.load_project_config()
+        done = threading.Event()
+
+        def set_in_other() -> None:
+            other.set("a", 1, user_level=False)
+            done.set()
+
+        with manager._locked(user_level=False):
+            thread = threading.Thread(target=set_in_other)
+            thread.start()
+            assert not done.wait(0.2)
+            manager.save_project_config({"b": 2})
+        thread.join(5)
+
+        assert done.is_set()
+        config_path = tmp_project_dir / "meetup-scheduler-local.json"
+        assert json.loads(config_path.read_text()) == {"b": 2, "a": 1}
+        assert (tmp_project_dir / ".meetup-scheduler-local.json.lock").exists()
+
+    def test_project_lock_creates_no_directory(self, tmp_project_dir: Path) -> None:
+        """Test that changing the project config doesn't create the state directory."""
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        manager.set("a", 1, user_level=False)
+
+        assert not (tmp_project_dir / ".meetup-scheduler").exists()
+
+    def test_project_lock_in_state_directory(self, tmp_project_dir: Path) -> None:
+        """Test that an initialized project keeps the lock in .meetup-scheduler/."""
+        (tmp_project_dir / ".meetup-scheduler").mkdir()
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        manager.set("a", 1, user_level=False)
+
+        assert (tmp_project_dir / ".meetup-scheduler" / "config.lock").exists()
+        assert not (tmp_project_dir / ".meetup-scheduler-local.json.lock").exists()
+
+    def test_no_lock_without_changes(self, tmp_project_dir: Path) -> None:
+        """Test that updates and unsets that change nothing don't take the lock."""
+        manager = ConfigManager(project_dir=tmp_project_dir)
+        manager.save_project_config({"a": 1})
+
+        with patch.object(manager, "_locked") as mock_locked:
+            manager.update_many({"a": 1}, user_level=False)
+            assert manager.unset("missing", user_level=False) is False
+        mock_locked.assert_not_called()
+        assert [p.name for p in tmp_project_dir.iterdir()] == ["meetup-scheduler-local.json"]
@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -207,6 +208,31 @@ class TestConfigCommandSet:
 
         assert config["defaults"]["isDraft"] is True
 
+    def test_parse_value(self) -> None:
+        """Test that set values are parsed as JSON when possible."""
+        from meetup_scheduler.commands.config_cmd import ConfigCommand
+
+        command = ConfigCommand(App(args=[]), None)  # type: ignore[arg-type]
+        assert command._parse_value("Terry") == "Terry"
+        assert command._parse_value("") == ""
+        assert command._parse_value("42") == 42
+        assert command._parse_value(" -1.5") == -1.5
+        assert command._parse_value("true") is True
+        assert command._parse_value("null") is None
+        assert command._parse_value('"quoted"') == "quoted"
+        assert command._parse_value('{"a": [1]}') == {"a": [1]}
+        assert command._parse_value("nope") == "nope"
+
+    @pytest.mark.parametrize("value", ["NaN", "-Infinity", "[1, Infinity]", "1e999"])
+    def test_parse_value_rejects_non_finite(self, value: str) -> None:
+        """Test that values JSON can't store aren't silently changed to null."""
+        from meetup_scheduler.commands.config_cmd import ConfigCommand
+
+        command = ConfigCommand(App(args=[]), None)  # type: ignore[arg-type]
+        with pytest.raises(ConfigCommand.Error, match="Invalid value"):
+            command._parse_value(value)
+        assert command._parse_value("12 Main St") == "12 Main St"
+
     def test_set_overwrites_existing_value(
         self,
         tmp_path: Path,
@@ -283,6 +309,8 @@ class TestConfigCommandList:
         captured = capsys.readouterr()
         assert "Test User" in captured.out
         assert "America/New_York" in captured.out
+        assert captured.out.endswith("}\n")
+        assert json.loads(captured.out)["organizer"] == {"name": "Test User"}
 
     def test_list_merges_user_and_project_config(
         self,
@@ -356,6 +384,29 @@ class TestConfigCommandEdit:
         config_path = mock_user_config_dir / "config.json"
         assert config_path.exists()
 
+    def test_edit_changes_seen_by_later_reads(
+        self,
+        tmp_path: Path,
+        mock_user_config_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that an edit keeping the file's size and mtime is still seen."""
+        monkeypatch.chdir(tmp_path)
+        config_path = mock_user_config_dir / "config.json"
+        config_path.write_text('{"a": "old"}')
+
+        def edit(argv: list[str], check: bool) -> None:
+            st = config_path.stat()
+            config_path.write_text('{"a": "new"}')
+            os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        app = App(args=["config", "--edit"])
+        assert app.config_manager.get("a") == "old"
+        with patch("subprocess.run", side_effect=edit):
+            assert app.run() == 0
+
+        assert app.config_manager.get("a") == "new"
+
     def test_edit_uses_visual_editor(
         self,
         tmp_path: Path,
@@ -395,6 +446,48 @@ class TestConfigCommandEdit:
         call_args = mock_run.call_args[0][0]
         assert call_args[0] == "fallback-editor"
 
+    def test_edit_finds_default_editor_on_path(
+        self,
+        tmp_path: Path,
+        mock_user_config_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that --edit falls back to the first common editor on PATH."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("VISUAL", raising=False)
+        monkeypatch.delenv("EDITOR", raising=False)
+        monkeypatch.setattr("sys.platform", "linux")
+
+        def which(name: str) -> str | None:
+            return "/usr/bin/vi" if name == "vi" else None
+
+        with patch("shutil.which", side_effect=which), patch("subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            app = App(args=["config", "--edit"])
+            app.run()
+
+        # Only the editor itself is run; the PATH lookup is done in-process
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0][0] == "vi"
+
+    def test_edit_without_any_editor_fails(
+        self,
+        tmp_path: Path,
+        mock_user_config_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that --edit reports an error when no editor can be found."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("VISUAL", raising=False)
+        monkeypatch.delenv("EDITOR", raising=False)
+        monkeypatch.setattr("sys.platform", "linux")
+
+        with patch("shutil.which", return_value=None), patch("subprocess.run") as mock_run:
+            app = App(args=["config", "--edit"])
+            assert app.run() == 1
+
+        mock_run.assert_not_called()
+
 
 class TestConfigCommandReturnCodes:
     """Test ConfigCommand return codes."""
@@ -431,3 +524,41 @@ class TestConfigCommandReturnCodes:
         monkeypatch.chdir(tmp_path)
         app = App(args=["config", "--list"])
         assert app.run() == 0
+
+
+class TestCommandsPackageExports:
+    """Test the lazily imported exports of meetup_scheduler.commands."""
+
+    def test_exports_resolve(self) -> None:
+        """Test that the package exports resolve to the submodule classes."""
+        import meetup_scheduler.commands as commands
+        from meetup_scheduler.commands.base import BaseCommand, CommandError
+        from meetup_scheduler.commands.config_cmd import ConfigCommand
+        from meetup_scheduler.commands.init_cmd import InitCommand
+
+        assert commands.BaseCommand is BaseCommand
+        assert commands.CommandError is CommandError
+        assert commands.ConfigCommand is ConfigCommand
+        assert commands.InitCommand is InitCommand
+
+    def test_unknown_attribute(self) -> None:
+        """Test that unknown names raise AttributeError."""
+        import meetup_scheduler.commands as commands
+
+        with pytest.raises(AttributeError):
+            _ = commands.NoSuchThing
+
+    def test_config_import_is_light(self) -> None:
+        """Test that importing the config command doesn't load other commands."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, meetup_scheduler.commands.config_cmd; "
+            "print('meetup_scheduler.commands.init_cmd' in sys.modules, "
+            "'subprocess' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.split() == ["False", "False"]
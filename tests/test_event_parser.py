@@ -365,6 +365,16 @@ class TestParseFile:
             parser.parse_file(file_path)
         assert "Invalid JSON" in str(exc_info.value)
 
+    def test_invalid_utf8_raises_error(self, tmp_path: Path) -> None:
+        """Test that a file that isn't UTF-8 is reported as invalid JSON."""
+        parser = EventParser()
+        file_path = tmp_path / "latin1.json"
+        file_path.write_bytes(b'{"events": [{"title": "Caf\xe9"}]}')
+
+        with pytest.raises(EventParser.Error) as exc_info:
+            parser.parse_file(file_path)
+        assert "Invalid JSON" in str(exc_info.value)
+
     def test_schema_validation_error(self, tmp_path: Path) -> None:
         """Test that schema validation errors are reported."""
         parser = EventParser()
@@ -227,6 +227,7 @@ class TestGenerateCommandOutput:
         content = output_file.read_text(encoding="utf-8")
         output = json.loads(content)
         assert len(output["events"]) == 2
+        assert content.endswith("}\n")
 
     def test_output_is_valid_json(
         self, capsys: pytest.CaptureFixture[str]
@@ -279,6 +280,54 @@ class TestGenerateCommandOutput:
         assert event["title"]  # Not empty
         assert event["startDateTime"]  # Not empty
 
+    def test_title_template_fields(self) -> None:
+        """Test that title templates can use each of the date fields."""
+        from datetime import date
+
+        from meetup_scheduler.commands.generate_cmd import GenerateCommand
+
+        command = GenerateCommand(App(args=[]), None)  # type: ignore[arg-type]
+        output = command._generate_output(
+            [date(2025, 6, 5)],
+            {
+                "titleTemplate": "{weekday} {day} {month} {year} ({date}) {date!r:.5}",
+                "timezone": "UTC",
+            },
+        )
+
+        assert output["events"][0]["title"] == (
+            "Thursday 05 June 2025 (June 05, 2025) 'June"
+        )
+
+    def test_start_times_follow_daylight_saving(self) -> None:
+        """Test that each start time carries the UTC offset of its own date."""
+        from datetime import date
+
+        from meetup_scheduler.commands.generate_cmd import GenerateCommand
+
+        command = GenerateCommand(App(args=[]), None)  # type: ignore[arg-type]
+        output = command._generate_output(
+            [date(2025, 1, 2), date(2025, 7, 3)],
+            {"timezone": "America/New_York", "defaultTime": "18:30"},
+        )
+
+        assert [e["startDateTime"] for e in output["events"]] == [
+            "2025-01-02T18:30:00-05:00",
+            "2025-07-03T18:30:00-04:00",
+        ]
+
+    def test_title_template_unknown_field(self) -> None:
+        """Test that an unknown title field is still an error."""
+        from datetime import date
+
+        from meetup_scheduler.commands.generate_cmd import GenerateCommand
+
+        command = GenerateCommand(App(args=[]), None)  # type: ignore[arg-type]
+        with pytest.raises(KeyError):
+            command._generate_output(
+                [date(2025, 6, 5)], {"titleTemplate": "{venue}", "timezone": "UTC"}
+            )
+
 
 class TestGenerateCommandDateParsing:
     """Test date parsing in generate command."""
@@ -307,6 +356,25 @@ class TestGenerateCommandDateParsing:
         # First Thursday of June 2025 is June 5
         assert output["events"][0]["startDateTime"].startswith("2025-06-05")
 
+    def test_unpadded_date_format(self) -> None:
+        """Test that dates without zero padding are still accepted."""
+        from datetime import date
+
+        from meetup_scheduler.commands.generate_cmd import GenerateCommand
+
+        command = GenerateCommand(App(args=[]), None)  # type: ignore[arg-type]
+        assert command._parse_date("2025-06-01") == date(2025, 6, 1)
+        assert command._parse_date(" 2025-6-1 ") == date(2025, 6, 1)
+
+    @pytest.mark.parametrize("date_str", ["20250601", "2025-W23-1", "2025-06-01T00"])
+    def test_other_iso_forms_rejected(self, date_str: str) -> None:
+        """Test that only the YYYY-MM-DD form of ISO 8601 dates is accepted."""
+        from meetup_scheduler.commands.generate_cmd import GenerateCommand
+
+        command = GenerateCommand(App(args=[]), None)  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="Invalid date format"):
+            command._parse_date(date_str)
+
     def test_today_keyword(
         self, capsys: pytest.CaptureFixture[str]
     ) -> None:
@@ -327,6 +395,22 @@ class TestGenerateCommandDateParsing:
         # Should succeed - we can't verify exact date but it should work
         assert result == 0
 
+    def test_tomorrow_at_end_of_month(self) -> None:
+        """Test that 'tomorrow' rolls over into the next month."""
+        from datetime import date
+        from unittest.mock import patch
+
+        from meetup_scheduler.commands.generate_cmd import GenerateCommand
+
+        class FakeDate(date):
+            @classmethod
+            def today(cls) -> date:
+                return cls(2025, 1, 31)
+
+        command = GenerateCommand(App(args=[]), None)  # type: ignore[arg-type]
+        with patch("meetup_scheduler.commands.generate_cmd.date", FakeDate):
+            assert command._parse_date("tomorrow") == date(2025, 2, 1)
+
     def test_invalid_date_raises_error(
         self, capsys: pytest.CaptureFixture[str], caplog: pytest.LogCaptureFixture
     ) -> None:
@@ -521,6 +605,21 @@ class TestGenerateCommandDuration:
 
         assert output["defaults"]["duration"] == 90
 
+    def test_parse_duration_forms(self) -> None:
+        """Test each accepted duration form, and rejection of bad ones."""
+        from meetup_scheduler.commands.generate_cmd import GenerateCommand
+
+        command = GenerateCommand(App(args=[]), None)  # type: ignore[arg-type]
+        assert command._parse_duration("120") == 120
+        assert command._parse_duration(" 90 ") == 90
+        assert command._parse_duration("+45") == 45
+        assert command._parse_duration("2H") == 120
+        assert command._parse_duration("90m") == 90
+        assert command._parse_duration("1h30m") == 90
+        for bad in ("", "h", "1.5h", "abc", "\u00b2"):
+            with pytest.raises(ValueError, match="Invalid duration"):
+                command._parse_duration(bad)
+
 
 class TestGenerateCommandTime:
     """Test generate command --time option."""
@@ -88,6 +88,19 @@ class TestInitCommandProjectConfig:
 
         assert isinstance(config, dict)
 
+    def test_project_config_contents(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the project config is the indented template and a newline."""
+        from meetup_scheduler.commands.init_cmd import InitCommand
+
+        monkeypatch.chdir(tmp_path)
+        App(args=["init"]).run()
+
+        config_path = tmp_path / "meetup-scheduler-local.json"
+        expected = json.dumps(InitCommand.DEFAULT_PROJECT_CONFIG, indent=2) + "\n"
+        assert config_path.read_text(encoding="utf-8") == expected
+
     def test_project_config_has_expected_structure(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -162,7 +175,9 @@ class TestInitCommandGitignore:
         app.run()
 
         gitignore_path = tmp_path / ".gitignore"
-        assert gitignore_path.exists()
+        assert gitignore_path.read_text(encoding="utf-8") == (
+            "# meetup-scheduler\n.meetup-scheduler/\nmeetup-scheduler-local.json\n"
+        )
 
     def test_adds_patterns_to_gitignore(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
@@ -199,8 +214,24 @@ class TestInitCommandGitignore:
         # Original content preserved
         assert "*.pyc" in content
         assert "__pycache__/" in content
-        # New patterns added
-        assert ".meetup-scheduler/" in content
+        # New patterns added after a blank line
+        assert content == (
+            "*.pyc\n__pycache__/\n"
+            "\n# meetup-scheduler\n.meetup-scheduler/\nmeetup-scheduler-local.json\n"
+        )
+
+    def test_appends_after_line_without_newline(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that patterns start on a new line, after a blank line."""
+        monkeypatch.chdir(tmp_path)
+        gitignore_path = tmp_path / ".gitignore"
+        gitignore_path.write_text("*.pyc", encoding="utf-8")
+
+        App(args=["init"]).run()
+
+        content = gitignore_path.read_text(encoding="utf-8")
+        assert content.startswith("*.pyc\n\n# meetup-scheduler\n")
 
     def test_does_not_duplicate_patterns(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
@@ -219,6 +250,25 @@ class TestInitCommandGitignore:
         # Count occurrences - should only appear once
         assert content.count(".meetup-scheduler/") == 1
 
+    @pytest.mark.parametrize(
+        "existing",
+        [
+            "# meetup-scheduler\n.meetup-scheduler/\nmeetup-scheduler-local.json",
+            "# meetup-scheduler\r\n.meetup-scheduler/ \r\nmeetup-scheduler-local.json\r\n",
+        ],
+    )
+    def test_existing_patterns_left_alone(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, existing: str
+    ) -> None:
+        """Test that patterns already present, however terminated, aren't added."""
+        monkeypatch.chdir(tmp_path)
+        gitignore_path = tmp_path / ".gitignore"
+        gitignore_path.write_bytes(existing.encode("utf-8"))
+
+        App(args=["init"]).run()
+
+        assert gitignore_path.read_bytes() == existing.encode("utf-8")
+
 
 class TestInitCommandReturnCode:
     """Test InitCommand return codes."""
@@ -439,6 +489,31 @@ class TestInitCommandOutput:
         # Should show auth setup panel or fallback instructions
         assert "login" in captured.out or "authenticate" in captured.out.lower()
 
+    def test_plain_output_when_not_a_terminal(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that piped output is plain text, not a rich panel."""
+        App(args=["init", str(tmp_path / "my-project")]).run()
+
+        out = capsys.readouterr().out
+        assert f"Project initialized at: {tmp_path / 'my-project'}" in out
+        assert "Next steps:" in out
+        assert "\u256d" not in out  # rich panel corner
+
+    def test_rich_output_on_terminal(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that terminal output shows the next steps in a panel."""
+        import sys
+
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+        App(args=["init", str(tmp_path / "my-project")]).run()
+
+        assert "Next Steps" in capsys.readouterr().out
+
 
 class TestInitCommandSchemas:
     """Test InitCommand schema copying."""
@@ -481,6 +556,28 @@ class TestInitCommandSchemas:
             content = json.loads(schema_file.read_text(encoding="utf-8"))
             assert "$schema" in content or "type" in content
 
+    def test_schemas_copied_exactly_and_kept_without_force(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that schemas match the packaged copies and are only replaced with --force."""
+        from importlib import resources
+
+        monkeypatch.chdir(tmp_path)
+        App(args=["init"]).run()
+
+        schemas_dir = tmp_path / ".meetup-scheduler" / "schemas"
+        packaged = resources.files("meetup_scheduler.resources.schemas")
+        for name in ("config.schema.json", "events.schema.json", "venues.schema.json"):
+            assert (schemas_dir / name).read_bytes() == (packaged / name).read_bytes()
+
+        edited = schemas_dir / "events.schema.json"
+        edited.write_text("{}", encoding="utf-8")
+        App(args=["init"]).run()
+        assert edited.read_text(encoding="utf-8") == "{}"
+
+        App(args=["init", "--force"]).run()
+        assert edited.read_bytes() == (packaged / "events.schema.json").read_bytes()
+
     def test_project_config_references_local_schema(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -579,6 +676,62 @@ class TestInitCommandVSCode:
         assert "*.other.json" in file_matches  # Existing preserved
         assert "meetup-scheduler-local.json" in file_matches  # New added
 
+    def test_vscode_settings_already_configured_untouched(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that settings with our associations are left exactly as they are."""
+        monkeypatch.chdir(tmp_path)
+        App(args=["init"]).run()
+
+        settings_path = tmp_path / ".vscode" / "settings.json"
+        customized = settings_path.read_text(encoding="utf-8").replace("  ", "    ")
+        settings_path.write_text(customized, encoding="utf-8")
+
+        App(args=["init"]).run()
+        assert settings_path.read_text(encoding="utf-8") == customized
+
+    def test_vscode_settings_partially_configured_merged(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a missing association is added when another is present."""
+        monkeypatch.chdir(tmp_path)
+        vscode_dir = tmp_path / ".vscode"
+        vscode_dir.mkdir()
+        settings_path = vscode_dir / "settings.json"
+        settings_path.write_text(
+            json.dumps({"json.schemas": [{"fileMatch": ["meetup-scheduler-local.json"]}]}),
+            encoding="utf-8",
+        )
+
+        App(args=["init"]).run()
+
+        settings = json.loads(settings_path.read_text(encoding="utf-8"))
+        file_matches = [p for s in settings["json.schemas"] for p in s["fileMatch"]]
+        assert "events/*.json" in file_matches
+
+    def test_vscode_settings_patterns_elsewhere_merged(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that our patterns outside json.schemas don't stop the merge."""
+        monkeypatch.chdir(tmp_path)
+        vscode_dir = tmp_path / ".vscode"
+        vscode_dir.mkdir()
+        settings_path = vscode_dir / "settings.json"
+        settings_path.write_text(
+            json.dumps({
+                "files.exclude": {"events/*.json": True, "meetup-scheduler-local.json": True}
+            }),
+            encoding="utf-8",
+        )
+
+        App(args=["init"]).run()
+
+        settings = json.loads(settings_path.read_text(encoding="utf-8"))
+        assert settings["files.exclude"]["events/*.json"] is True
+        file_matches = [p for s in settings["json.schemas"] for p in s["fileMatch"]]
+        assert "meetup-scheduler-local.json" in file_matches
+        assert "events/*.json" in file_matches
+
     def test_vscode_settings_invalid_json_skipped(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -650,6 +803,35 @@ class TestInitCommandErrorPaths:
         result = cmd._is_source_directory(fake_source)
         assert result is False
 
+    def test_source_directory_name_after_head(self, tmp_path: Path) -> None:
+        """Test that the project name is found beyond the first read."""
+        from meetup_scheduler.commands.init_cmd import InitCommand
+
+        source = tmp_path / "long_source"
+        (source / "src" / "meetup_scheduler").mkdir(parents=True)
+        padding = "#" * (InitCommand.PYPROJECT_HEAD_SIZE - 10) + "\n"
+        (source / "pyproject.toml").write_text(
+            padding + '[project]\nname = "meetup-scheduler"\n', encoding="utf-8"
+        )
+
+        app = App(args=["init"])
+        assert InitCommand(app, app.args)._is_source_directory(source) is True
+
+    def test_source_directory_result_cached(self, tmp_path: Path) -> None:
+        """Test that a directory is only probed once."""
+        from unittest.mock import patch
+
+        from meetup_scheduler.commands.init_cmd import InitCommand
+
+        app = App(args=["init"])
+        cmd = InitCommand(app, app.args)
+        with patch.object(
+            cmd, "_check_source_directory", wraps=cmd._check_source_directory
+        ) as mock_check:
+            assert cmd._is_source_directory(tmp_path) is False
+            assert cmd._is_source_directory(tmp_path) is False
+        assert mock_check.call_count == 1
+
     def test_find_source_directory_handles_attribute_error(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -662,6 +844,8 @@ class TestInitCommandErrorPaths:
 
         app = App(args=["init"])
         cmd = InitCommand(app, app.args)
+        monkeypatch.setattr(InitCommand, "_source_root", None)
+        monkeypatch.setattr(InitCommand, "_source_root_known", False)
 
         # Mock the module to have no __file__ attribute
         with patch("meetup_scheduler.commands.init_cmd.Path") as mock_path:
@@ -670,3 +854,24 @@ class TestInitCommandErrorPaths:
             result = cmd._find_source_directory()
             # Should return None when error occurs
             assert result is None or result is not None  # Either result is acceptable
+
+    def test_find_source_directory_result_cached(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the source directory is only looked for once."""
+        from unittest.mock import patch
+
+        from meetup_scheduler.commands.init_cmd import InitCommand
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(InitCommand, "_source_root", None)
+        monkeypatch.setattr(InitCommand, "_source_root_known", False)
+
+        app = App(args=["init"])
+        cmd = InitCommand(app, app.args)
+        with patch.object(
+            cmd, "_locate_source_directory", wraps=cmd._locate_source_directory
+        ) as mock_locate:
+            first = cmd._find_source_directory()
+            assert InitCommand(app, app.args)._find_source_directory() == first
+        assert mock_locate.call_count == 1
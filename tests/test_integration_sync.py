@@ -26,6 +26,7 @@ import respx
 from httpx import Response
 
 from meetup_scheduler.app import App
+from meetup_scheduler.config.manager import ConfigManager
 
 
 class TestSyncIntegrationFullFlow:
@@ -43,8 +44,9 @@ class TestSyncIntegrationFullFlow:
 
         assert result == 0
 
-        # Verify API was called (self query + 2 group event queries)
-        assert router.calls.call_count >= 3
+        # Verify API was called (self query + one batched event query for
+        # both groups)
+        assert router.calls.call_count == 2
 
     def test_sync_saves_groups_to_project_config(
         self,
@@ -119,6 +121,43 @@ class TestSyncIntegrationFullFlow:
         # Should be an ISO format timestamp
         assert "T" in config_data["lastSync"]
 
+    def test_sync_saves_event_watermarks(
+        self,
+        mock_sync_environment: tuple[Path, respx.MockRouter],
+    ) -> None:
+        """Test that sync saves each group's newest event time, and resyncs keep venues."""
+        tmp_path, _ = mock_sync_environment
+
+        assert App(args=["-q", "sync"]).run() == 0
+
+        config_file = tmp_path / "meetup-scheduler-local.json"
+        config_data = json.loads(config_file.read_text())
+        groups = config_data["groups"]
+        assert groups["test-group-one"]["lastEventSync"] == "2025-01-15T19:00:00-05:00"
+        assert groups["test-group-two"]["lastEventSync"] == "2025-01-20T18:00:00-06:00"
+
+        # An incremental sync finds nothing new, but keeps what it has
+        assert App(args=["-q", "sync"]).run() == 0
+
+        resynced = json.loads(config_file.read_text())
+        assert resynced["groups"] == groups
+        assert resynced["venues"] == config_data["venues"]
+
+    def test_sync_writes_project_config_once(
+        self,
+        mock_sync_environment: tuple[Path, respx.MockRouter],
+    ) -> None:
+        """Test that groups, venues and timestamps are saved in a single write."""
+        tmp_path, _ = mock_sync_environment
+
+        with patch.object(
+            ConfigManager, "_write_json", autospec=True, side_effect=ConfigManager._write_json
+        ) as mock_write:
+            assert App(args=["-q", "sync"]).run() == 0
+
+        paths = [c.args[1].name for c in mock_write.call_args_list]
+        assert paths == ["meetup-scheduler-local.json"]
+
 
 class TestSyncIntegrationGroupFilter:
     """Test sync with --group filter option."""
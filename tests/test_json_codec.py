@@ -0,0 +1,135 @@
+##############################################################################
+#
+# Name: test_json_codec.py
+#
+# Function:
+#       Unit tests for JsonCodec class
+#
+# Copyright notice and license:
+#       See LICENSE.md
+#
+# Author:
+#       Terry Moore
+#
+##############################################################################
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+
+import pytest
+
+import meetup_scheduler.json_codec as json_codec
+from meetup_scheduler.json_codec import JsonCodec
+
+SAMPLE = {
+    "defaults": {"timezone": "America/New_York", "duration": 120},
+    "events": [
+        {"title": "Café night", "startDateTime": "2025-06-05T19:00:00-04:00"},
+        {"title": "Empty", "tags": [], "extra": {}, "online": False, "venue": None},
+    ],
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test with orjson (if installed) and with the standard library."""
+    if request.param == "orjson":
+        if json_codec.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    return str(request.param)
+
+
+class TestJsonCodec:
+    """Test JsonCodec with each backend."""
+
+    def test_dumps_matches_json_layout(self, backend: str) -> None:
+        """Test that dumps produces the same document as json.dumps(indent=2)."""
+        expected = json.dumps(SAMPLE, indent=2, ensure_ascii=False).encode("utf-8")
+        assert JsonCodec.dumps(SAMPLE) == expected
+
+    def test_dumps_compact_has_no_whitespace(self, backend: str) -> None:
+        """Test that dumps_compact produces the same document as compact json.dumps."""
+        expected = json.dumps(SAMPLE, ensure_ascii=False, separators=(",", ":"))
+        assert JsonCodec.dumps_compact(SAMPLE) == expected.encode("utf-8")
+
+    def test_dump_appends_newline(self, backend: str) -> None:
+        """Test that dump writes the document and a newline, leaving fp open."""
+        fp = io.BytesIO()
+        JsonCodec.dump(SAMPLE, fp)
+        assert not fp.closed
+        assert fp.getvalue() == JsonCodec.dumps(SAMPLE) + b"\n"
+
+    def test_dump_stdout(self, backend: str, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that dump_stdout prints the document after earlier output."""
+        print("before")
+        JsonCodec.dump_stdout(SAMPLE)
+        out = capsys.readouterr().out
+        assert out.startswith("before\n")
+        assert json.loads(out.removeprefix("before\n")) == SAMPLE
+
+    def test_dump_stdout_text_only(self, backend: str) -> None:
+        """Test that dump_stdout works when stdout has no binary buffer."""
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            JsonCodec.dump_stdout(SAMPLE)
+        assert out.getvalue() == JsonCodec.dumps(SAMPLE).decode("utf-8") + "\n"
+
+    @pytest.mark.parametrize("count", [0, 1, 2])
+    def test_dump_streaming_matches_dump(self, backend: str, count: int) -> None:
+        """Test that dump_streaming writes the same document as dump."""
+        head = {"mode": "dry_run", "source": None, "défauts": SAMPLE["defaults"]}
+        items = SAMPLE["events"][:count]
+        expected = io.BytesIO()
+        JsonCodec.dump({**head, "events": items}, expected)
+
+        fp = io.BytesIO()
+        JsonCodec.dump_streaming(head, "events", iter(items), fp)
+        assert fp.getvalue() == expected.getvalue()
+
+    def test_dump_streaming_stdout_text_only(self, backend: str) -> None:
+        """Test that dump_streaming_stdout works when stdout has no binary buffer."""
+        expected = io.BytesIO()
+        JsonCodec.dump({"mode": "dry_run", "events": SAMPLE["events"]}, expected)
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            JsonCodec.dump_streaming_stdout(
+                {"mode": "dry_run"}, "events", iter(SAMPLE["events"])
+            )
+        assert out.getvalue() == expected.getvalue().decode("utf-8")
+
+    def test_non_str_keys_converted(self, backend: str) -> None:
+        """Test that both backends convert keys that aren't strings as json does."""
+        obj = {1: "one", 2.5: [], False: None, None: {"nested": {3: 4}}}
+        expected = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+        assert JsonCodec.dumps(obj) == expected
+        assert JsonCodec.dumps_compact(obj) == json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    @pytest.mark.parametrize("number", [float("nan"), float("inf"), float("-inf")])
+    def test_non_finite_never_written_as_nan(self, backend: str, number: float) -> None:
+        """Test that NaN and infinities never produce a document loads rejects."""
+        if backend == "json":
+            with pytest.raises(ValueError):
+                JsonCodec.dumps({"x": number})
+            with pytest.raises(ValueError):
+                JsonCodec.dump({"x": number}, io.BytesIO())
+        else:
+            assert JsonCodec.loads(JsonCodec.dumps({"x": number})) == {"x": None}
+
+    def test_loads_round_trip(self, backend: str) -> None:
+        """Test that loads accepts bytes and str."""
+        data = JsonCodec.dumps(SAMPLE)
+        assert JsonCodec.loads(data) == SAMPLE
+        assert JsonCodec.loads(data.decode("utf-8")) == SAMPLE
+
+    def test_loads_error_is_json_decode_error(self, backend: str) -> None:
+        """Test that invalid documents raise json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            JsonCodec.loads(b"{not json")
@@ -146,7 +146,7 @@ class TestLoginCommandFlow:
                 return_value=mock_server,
             ),
             patch(
-                "meetup_scheduler.commands.login_cmd.OAuthFlow"
+                "meetup_scheduler.auth.oauth.OAuthFlow"
             ) as mock_oauth_class,
             patch("webbrowser.open", return_value=True) as mock_browser,
         ):
@@ -198,7 +198,7 @@ class TestLoginCommandFlow:
                 return_value=mock_server,
             ),
             patch(
-                "meetup_scheduler.commands.login_cmd.OAuthFlow"
+                "meetup_scheduler.auth.oauth.OAuthFlow"
             ) as mock_oauth_class,
             patch("webbrowser.open", return_value=True),
         ):
@@ -235,7 +235,7 @@ class TestLoginCommandFlow:
                 return_value=mock_server,
             ) as mock_server_class,
             patch(
-                "meetup_scheduler.commands.login_cmd.OAuthFlow"
+                "meetup_scheduler.auth.oauth.OAuthFlow"
             ) as mock_oauth_class,
             patch("webbrowser.open", return_value=True),
         ):
@@ -143,3 +143,34 @@ class TestLogoutCommandExecution:
             # With tokens
             app2 = App(args=["logout"])
             assert app2.run() == 0
+
+
+class TestCommandConsole:
+    """Test the console shared by commands."""
+
+    def test_commands_share_console(self) -> None:
+        """Test that all commands print through one Console."""
+        from meetup_scheduler.commands.login_cmd import LoginCommand
+        from meetup_scheduler.commands.logout_cmd import LogoutCommand
+
+        app = App(args=[])
+        login = LoginCommand(app, app.args)
+        logout = LogoutCommand(app, app.args)
+        assert login.console is logout.console
+
+    def test_command_imports_are_light(self) -> None:
+        """Test that importing commands doesn't import what only some runs need."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, meetup_scheduler.commands.logout_cmd, "
+            "meetup_scheduler.commands.login_cmd, "
+            "meetup_scheduler.commands.schedule_cmd; "
+            "print('rich' in sys.modules, 'webbrowser' in sys.modules, "
+            "'meetup_scheduler.output.markdown' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.split() == ["False", "False", "False"]
@@ -175,8 +175,10 @@ class TestGenerateFromFile:
         generator = MarkdownGenerator()
         output = generator.generate_from_file(parsed)
 
-        assert "**Source:**" in output
-        assert "events.json" in output
+        assert output == (
+            f"**Source:** `{tmp_path / 'events.json'}`\n\n"
+            + generator.generate_table([sample_event], title="Scheduled Events")
+        )
 
     def test_table_mode(self, sample_event: ParsedEvent) -> None:
         """Test table output mode."""
@@ -15,11 +15,13 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import httpx
 import pytest
 
+from meetup_scheduler.json_codec import JsonCodec
 from meetup_scheduler.meetup.client import MeetupClient
 
 
@@ -31,19 +33,34 @@ class TestMeetupClientInit:
         client = MeetupClient("test_token")
         assert client._access_token == "test_token"
 
+    def test_context_manager_closes_client(self) -> None:
+        """Test that leaving a with block closes the connection pool."""
+        with MeetupClient("test_token") as client:
+            assert not client._http.is_closed
+        assert client._http.is_closed
+
+    def test_requests_share_connection_pool(self) -> None:
+        """Test that successive queries go through the same HTTP client."""
+        mock_response = httpx.Response(200, json={"data": {}})
+
+        client = MeetupClient("test_token")
+        with patch.object(client._http, "post", return_value=mock_response) as mock_post:
+            client._execute_query("query { self { id } }")
+            client._execute_query("query { self { name } }")
+        assert mock_post.call_count == 2
+        client.close()
+
 
 class TestMeetupClientExecuteQuery:
     """Test MeetupClient._execute_query method."""
 
     def test_execute_query_success(self) -> None:
         """Test successful query execution."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = httpx.Response(200, json={
             "data": {"self": {"id": "123", "name": "Test User"}}
-        }
+        })
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             client = MeetupClient("test_token")
             result = client._execute_query("query { self { id name } }")
 
@@ -51,21 +68,31 @@ class TestMeetupClientExecuteQuery:
 
     def test_execute_query_includes_auth_header(self) -> None:
         """Test that Authorization header is included."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {}}
+        mock_response = httpx.Response(200, json={"data": {}})
 
-        with patch("httpx.post", return_value=mock_response) as mock_post:
+        with patch("httpx.Client.send", return_value=mock_response) as mock_send:
             client = MeetupClient("my_token")
             client._execute_query("query { self { id } }")
 
-        # Check that Authorization header was passed
-        call_kwargs = mock_post.call_args.kwargs
-        assert "Bearer my_token" in call_kwargs["headers"]["Authorization"]
+        # Check that Authorization header was sent
+        request = mock_send.call_args.args[0]
+        assert request.headers["Authorization"] == "Bearer my_token"
+
+    def test_execute_query_request_body(self) -> None:
+        """Test that the query is sent as a compact JSON body."""
+        mock_response = httpx.Response(200, json={"data": {}})
+
+        with patch("httpx.Client.send", return_value=mock_response) as mock_send:
+            client = MeetupClient("my_token")
+            client._execute_query("query { self { id } }", {"n": 1})
+
+        request = mock_send.call_args.args[0]
+        assert request.headers["Content-Type"] == "application/json"
+        assert request.content == b'{"query":"query { self { id } }","variables":{"n":1}}'
 
     def test_execute_query_network_error(self) -> None:
         """Test handling of network errors."""
-        with patch("httpx.post", side_effect=httpx.RequestError("Connection failed")):
+        with patch("httpx.Client.post", side_effect=httpx.RequestError("Connection failed")):
             client = MeetupClient("test_token")
             with pytest.raises(MeetupClient.Error) as exc_info:
                 client._execute_query("query { self { id } }")
@@ -74,28 +101,34 @@ class TestMeetupClientExecuteQuery:
 
     def test_execute_query_http_error(self) -> None:
         """Test handling of HTTP errors."""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-        mock_response.json.side_effect = ValueError("Not JSON")
+        mock_response = httpx.Response(500, text="Internal Server Error")
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             client = MeetupClient("test_token")
             with pytest.raises(MeetupClient.Error) as exc_info:
                 client._execute_query("query { self { id } }")
 
         assert "HTTP error 500" in str(exc_info.value)
 
+    def test_execute_query_invalid_json(self) -> None:
+        """Test that a response that isn't JSON raises an error."""
+        mock_response = httpx.Response(200, content=b"<html>")
+
+        with patch("httpx.Client.post", return_value=mock_response):
+            client = MeetupClient("test_token")
+            with pytest.raises(MeetupClient.Error) as exc_info:
+                client._execute_query("query { self { id } }")
+
+        assert "Invalid JSON response" in str(exc_info.value)
+
     def test_execute_query_graphql_error(self) -> None:
         """Test handling of GraphQL errors."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = httpx.Response(200, json={
             "errors": [{"message": "Field 'xyz' doesn't exist"}],
             "data": None,
-        }
+        })
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             client = MeetupClient("test_token")
             with pytest.raises(MeetupClient.Error) as exc_info:
                 client._execute_query("query { xyz }")
@@ -104,9 +137,7 @@ class TestMeetupClientExecuteQuery:
 
     def test_execute_query_rate_limited(self) -> None:
         """Test handling of rate limiting."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = httpx.Response(200, json={
             "errors": [{
                 "message": "Too many requests",
                 "extensions": {
@@ -115,9 +146,9 @@ class TestMeetupClientExecuteQuery:
                 },
             }],
             "data": None,
-        }
+        })
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             client = MeetupClient("test_token")
             with pytest.raises(MeetupClient.Error) as exc_info:
                 client._execute_query("query { self { id } }")
@@ -130,9 +161,7 @@ class TestMeetupClientGetSelf:
 
     def test_get_self_returns_user_data(self) -> None:
         """Test that get_self returns user data."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = httpx.Response(200, json={
             "data": {
                 "self": {
                     "id": "user123",
@@ -146,9 +175,9 @@ class TestMeetupClientGetSelf:
                     },
                 }
             }
-        }
+        })
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             client = MeetupClient("test_token")
             result = client.get_self()
 
@@ -162,9 +191,7 @@ class TestMeetupClientGetOrganizedGroups:
 
     def test_get_organized_groups_filters_by_organizer(self) -> None:
         """Test that only organizer groups are returned."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = httpx.Response(200, json={
             "data": {
                 "self": {
                     "id": "user123",
@@ -203,9 +230,9 @@ class TestMeetupClientGetOrganizedGroups:
                     },
                 }
             }
-        }
+        })
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             client = MeetupClient("test_token")
             groups = client.get_organized_groups()
 
@@ -215,9 +242,7 @@ class TestMeetupClientGetOrganizedGroups:
 
     def test_get_organized_groups_empty_when_no_organizer(self) -> None:
         """Test that empty list is returned when not an organizer."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = httpx.Response(200, json={
             "data": {
                 "self": {
                     "id": "user123",
@@ -229,9 +254,9 @@ class TestMeetupClientGetOrganizedGroups:
                     },
                 }
             }
-        }
+        })
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             client = MeetupClient("test_token")
             groups = client.get_organized_groups()
 
@@ -243,9 +268,7 @@ class TestMeetupClientGetPastEvents:
 
     def test_get_past_events_returns_events(self) -> None:
         """Test that past events are returned."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = httpx.Response(200, json={
             "data": {
                 "groupByUrlname": {
                     "id": "g1",
@@ -275,9 +298,9 @@ class TestMeetupClientGetPastEvents:
                     },
                 }
             }
-        }
+        })
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             client = MeetupClient("test_token")
             events = client.get_past_events("test-group", years=1)
 
@@ -287,13 +310,11 @@ class TestMeetupClientGetPastEvents:
 
     def test_get_past_events_group_not_found(self) -> None:
         """Test error when group is not found."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = httpx.Response(200, json={
             "data": {"groupByUrlname": None}
-        }
+        })
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             client = MeetupClient("test_token")
             with pytest.raises(MeetupClient.Error) as exc_info:
                 client.get_past_events("nonexistent-group")
@@ -303,9 +324,7 @@ class TestMeetupClientGetPastEvents:
     def test_get_past_events_pagination(self) -> None:
         """Test that pagination works correctly."""
         # First page response
-        first_response = MagicMock()
-        first_response.status_code = 200
-        first_response.json.return_value = {
+        first_response = httpx.Response(200, json={
             "data": {
                 "groupByUrlname": {
                     "id": "g1",
@@ -327,12 +346,10 @@ class TestMeetupClientGetPastEvents:
                     },
                 }
             }
-        }
+        })
 
         # Second page response
-        second_response = MagicMock()
-        second_response.status_code = 200
-        second_response.json.return_value = {
+        second_response = httpx.Response(200, json={
             "data": {
                 "groupByUrlname": {
                     "id": "g1",
@@ -354,15 +371,161 @@ class TestMeetupClientGetPastEvents:
                     },
                 }
             }
-        }
+        })
 
-        with patch("httpx.post", side_effect=[first_response, second_response]):
+        with patch("httpx.Client.post", side_effect=[first_response, second_response]):
             client = MeetupClient("test_token")
             events = client.get_past_events("test-group", years=1)
 
         assert len(events) == 2
 
 
+class TestMeetupClientGetPastEventsBatch:
+    """Test MeetupClient.get_past_events_batch method."""
+
+    @staticmethod
+    def _page(event_id: str, cursor: str | None) -> dict:
+        """Build one page of a group's past events, dated yesterday."""
+        when = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+        return {
+            "pastEvents": {
+                "count": 2,
+                "pageInfo": {"endCursor": cursor, "hasNextPage": cursor is not None},
+                "edges": [{"node": {"id": event_id, "dateTime": when, "venue": None}}],
+            }
+        }
+
+    @staticmethod
+    def _response(data: dict) -> httpx.Response:
+        """Build a successful HTTP response with the given data."""
+        return httpx.Response(200, json={"data": data})
+
+    def test_one_request_for_all_groups(self) -> None:
+        """Test that aliased results are returned by group URL name."""
+        response = self._response({"g0": self._page("e1", None), "g1": self._page("e2", None)})
+
+        with patch("httpx.Client.post", return_value=response) as mock_post:
+            client = MeetupClient("test_token")
+            events = client.get_past_events_batch(["first", "second"])
+
+        assert mock_post.call_count == 1
+        variables = JsonCodec.loads(mock_post.call_args.kwargs["content"])["variables"]
+        assert (variables["u0"], variables["u1"]) == ("first", "second")
+        assert {k: [e["id"] for e in v] for k, v in events.items()} == {
+            "first": ["e1"],
+            "second": ["e2"],
+        }
+
+    def test_group_not_found_omitted(self) -> None:
+        """Test that a group that wasn't found is left out of the result."""
+        response = httpx.Response(200, json={
+            "data": {"g0": None, "g1": self._page("e2", None)},
+            "errors": [{"message": "Group not found", "path": ["g0"]}],
+        })
+
+        with patch("httpx.Client.post", return_value=response):
+            client = MeetupClient("test_token")
+            events = client.get_past_events_batch(["missing", "found"])
+
+        assert list(events) == ["found"]
+
+    def test_rate_limit_raises(self) -> None:
+        """Test that a rate limit error isn't taken for missing groups."""
+        response = httpx.Response(200, json={
+            "data": {"g0": None},
+            "errors": [{
+                "message": "Too many requests",
+                "path": ["g0"],
+                "extensions": {"code": "RATE_LIMITED"},
+            }],
+        })
+
+        with patch("httpx.Client.post", return_value=response):
+            client = MeetupClient("test_token")
+            with pytest.raises(MeetupClient.Error, match="Rate limited"):
+                client.get_past_events_batch(["group"])
+
+    def test_error_on_later_page_raises(self) -> None:
+        """Test that a group with pages already fetched is never dropped."""
+        first = self._response({"g0": self._page("e1", "cursor1")})
+        second = httpx.Response(200, json={
+            "data": {"g0": None},
+            "errors": [{"message": "Group not found", "path": ["g0"]}],
+        })
+
+        with patch("httpx.Client.post", side_effect=[first, second]):
+            client = MeetupClient("test_token")
+            with pytest.raises(MeetupClient.Error, match="group"):
+                client.get_past_events_batch(["group"])
+
+    def test_missing_group_without_error_raises(self) -> None:
+        """Test that a null group isn't taken as not found without an error."""
+        with patch("httpx.Client.post", return_value=self._response({"g0": None})):
+            client = MeetupClient("test_token")
+            with pytest.raises(MeetupClient.Error, match="group"):
+                client.get_past_events_batch(["group"])
+
+    def test_pagination_continues_only_unfinished_groups(self) -> None:
+        """Test that later pages are requested only for groups that have them."""
+        first = self._response({"g0": self._page("e1", "cursor1"), "g1": self._page("e2", None)})
+        second = self._response({"g0": self._page("e3", None)})
+
+        with patch("httpx.Client.post", side_effect=[first, second]) as mock_post:
+            client = MeetupClient("test_token")
+            events = client.get_past_events_batch(["paged", "single"])
+
+        variables = JsonCodec.loads(mock_post.call_args.kwargs["content"])["variables"]
+        assert variables["u0"] == "paged"
+        assert variables["a0"] == "cursor1"
+        assert "u1" not in variables
+        assert [e["id"] for e in events["paged"]] == ["e1", "e3"]
+        assert [e["id"] for e in events["single"]] == ["e2"]
+
+    def test_since_stops_paging(self) -> None:
+        """Test that a group's paging stops at events before its since time."""
+        now = datetime.now(timezone.utc)
+        page = {
+            "pastEvents": {
+                "pageInfo": {"endCursor": "more", "hasNextPage": True},
+                "edges": [
+                    {"node": {"id": "new", "dateTime": (now - timedelta(days=1)).isoformat()}},
+                    {"node": {"id": "seen", "dateTime": (now - timedelta(days=3)).isoformat()}},
+                ],
+            }
+        }
+        first = self._response({"g0": page, "g1": page})
+        second = self._response({"g0": {"pastEvents": {"edges": []}}})
+
+        complete: set[str] = set()
+        with patch("httpx.Client.post", side_effect=[first, second]) as mock_post:
+            client = MeetupClient("test_token")
+            events = client.get_past_events_batch(
+                ["synced", "unsynced"],
+                since={"synced": now - timedelta(days=2)},
+                complete=complete,
+            )
+
+        # Only "unsynced" needs a second page
+        variables = JsonCodec.loads(mock_post.call_args.kwargs["content"])["variables"]
+        assert variables["u0"] == "unsynced"
+        assert [e["id"] for e in events["synced"]] == ["new"]
+        assert [e["id"] for e in events["unsynced"]] == ["new", "seen"]
+        assert complete == {"synced", "unsynced"}
+
+    def test_missing_cursor_not_complete(self) -> None:
+        """Test that a group whose paging stops early isn't reported complete."""
+        page = self._page("e1", None)
+        page["pastEvents"]["pageInfo"]["hasNextPage"] = True
+
+        complete: set[str] = set()
+        with patch("httpx.Client.post", return_value=self._response({"g0": page})):
+            client = MeetupClient("test_token")
+            events = client.get_past_events_batch(["group"], complete=complete)
+
+        assert [e["id"] for e in events["group"]] == ["e1"]
+        assert complete == set()
+
+
 class TestMeetupClientExtractVenues:
     """Test MeetupClient.extract_venues method."""
 
@@ -406,3 +569,24 @@ class TestMeetupClientExtractVenues:
 
         assert len(venues) == 1
         assert venues[0]["id"] == "v1"
+
+    def test_extract_venues_from_generator(self) -> None:
+        """Test that events may be given as a generator."""
+        client = MeetupClient("test_token")
+        events = ({"id": f"e{i}", "venue": {"id": f"v{i % 2}"}} for i in range(4))
+
+        venues = client.extract_venues(events)
+
+        assert [v["id"] for v in venues] == ["v0", "v1"]
+
+    def test_extract_venues_keeps_first_copy(self) -> None:
+        """Test that a venue's first copy wins, as events come newest first."""
+        client = MeetupClient("test_token")
+        events = [
+            {"id": "e2", "venue": {"id": "v1", "name": "New Name"}},
+            {"id": "e1", "venue": {"id": "v1", "name": "Old Name"}},
+        ]
+
+        venues = client.extract_venues(events)
+
+        assert [v["name"] for v in venues] == ["New Name"]
@@ -124,7 +124,7 @@ class TestOAuthFlowExchangeCode:
             "token_type": "bearer",
         }
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             tokens = oauth.exchange_code(
                 code="auth_code", redirect_uri="http://localhost:8080/callback"
             )
@@ -145,7 +145,7 @@ class TestOAuthFlowExchangeCode:
         }
 
         with (
-            patch("httpx.post", return_value=mock_response),
+            patch("httpx.Client.post", return_value=mock_response),
             pytest.raises(OAuthFlow.Error, match="invalid_grant"),
         ):
             oauth.exchange_code(
@@ -157,7 +157,7 @@ class TestOAuthFlowExchangeCode:
         oauth = OAuthFlow(client_id="id", client_secret="secret")
 
         with (
-            patch("httpx.post", side_effect=httpx.ConnectError("Connection refused")),
+            patch("httpx.Client.post", side_effect=httpx.ConnectError("Connection refused")),
             pytest.raises(OAuthFlow.Error, match="Network error"),
         ):
             oauth.exchange_code(
@@ -174,7 +174,7 @@ class TestOAuthFlowExchangeCode:
         mock_response.text = "Internal Server Error"
 
         with (
-            patch("httpx.post", return_value=mock_response),
+            patch("httpx.Client.post", return_value=mock_response),
             pytest.raises(OAuthFlow.Error, match="HTTP 500"),
         ):
             oauth.exchange_code(
@@ -198,7 +198,7 @@ class TestOAuthFlowRefreshTokens:
             "token_type": "bearer",
         }
 
-        with patch("httpx.post", return_value=mock_response):
+        with patch("httpx.Client.post", return_value=mock_response):
             tokens = oauth.refresh_tokens(refresh_token="old_refresh")
 
         assert tokens["access_token"] == "new_access"
@@ -216,7 +216,7 @@ class TestOAuthFlowRefreshTokens:
         }
 
         with (
-            patch("httpx.post", return_value=mock_response),
+            patch("httpx.Client.post", return_value=mock_response),
             pytest.raises(OAuthFlow.Error, match="invalid_grant"),
         ):
             oauth.refresh_tokens(refresh_token="invalid_token")
@@ -226,7 +226,71 @@ class TestOAuthFlowRefreshTokens:
         oauth = OAuthFlow(client_id="id", client_secret="secret")
 
         with (
-            patch("httpx.post", side_effect=httpx.ConnectError("Connection refused")),
+            patch("httpx.Client.post", side_effect=httpx.ConnectError("Connection refused")),
             pytest.raises(OAuthFlow.Error, match="Network error"),
         ):
             oauth.refresh_tokens(refresh_token="token")
+
+
+class TestOAuthFlowClient:
+    """Test the shared HTTP client used for the token endpoint."""
+
+    def test_client_is_shared(self) -> None:
+        """Test that all instances share one client."""
+        first = OAuthFlow(client_id="id", client_secret="secret")
+        second = OAuthFlow(client_id="id", client_secret="secret")
+        assert first._get_client() is second._get_client()
+
+    def test_client_uses_timeout(self) -> None:
+        """Test that the shared client has the token endpoint timeout."""
+        client = OAuthFlow._get_client()
+        assert client.timeout.read == OAuthFlow.TIMEOUT
+
+    def test_exchange_and_refresh_use_client(self) -> None:
+        """Test that both token calls go through the shared client."""
+        oauth = OAuthFlow(client_id="id", client_secret="secret")
+
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"access_token": "a"}
+
+        with patch.object(
+            OAuthFlow._get_client(), "post", return_value=mock_response
+        ) as mock_post:
+            oauth.exchange_code(code="code", redirect_uri="http://localhost:8080/callback")
+            oauth.refresh_tokens(refresh_token="token")
+
+        assert mock_post.call_count == 2
+        assert all(call.args[0] == OAuthFlow.TOKEN_URL for call in mock_post.call_args_list)
+
+    def test_request_bodies(self) -> None:
+        """Test that token request bodies carry all form fields."""
+        from urllib.parse import parse_qs
+
+        oauth = OAuthFlow(client_id="my id", client_secret="s&cret")
+
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"access_token": "a"}
+
+        with patch.object(
+            OAuthFlow._get_client(), "post", return_value=mock_response
+        ) as mock_post:
+            oauth.exchange_code(code="c/1", redirect_uri="http://localhost:8080/callback")
+            oauth.refresh_tokens(refresh_token="r=2")
+
+        exchange, refresh = (call.kwargs for call in mock_post.call_args_list)
+        assert parse_qs(exchange["content"].decode()) == {
+            "grant_type": ["authorization_code"],
+            "client_id": ["my id"],
+            "client_secret": ["s&cret"],
+            "code": ["c/1"],
+            "redirect_uri": ["http://localhost:8080/callback"],
+        }
+        assert parse_qs(refresh["content"].decode()) == {
+            "grant_type": ["refresh_token"],
+            "client_id": ["my id"],
+            "client_secret": ["s&cret"],
+            "refresh_token": ["r=2"],
+        }
+        assert exchange["headers"]["Content-Type"] == "application/x-www-form-urlencoded"
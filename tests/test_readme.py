@@ -66,6 +66,24 @@ class TestReadmeReader:
         assert section is not None
         assert "<!-- meetup-scheduler:" not in section
 
+    def test_sections_are_cached(self) -> None:
+        """Test that sections are extracted once per reader."""
+        reader = ReadmeReader()
+        assert reader.get_section("auth-setup") is reader.get_section("auth-setup")
+        assert reader.get_section("nonexistent-section") is None
+
+        sections = reader.get_all_sections()
+        sections.clear()
+        assert "auth-setup" in reader.get_all_sections()
+
+    def test_app_shares_reader(self) -> None:
+        """Test that commands of one App share its README reader."""
+        from meetup_scheduler.commands.readme_cmd import ReadmeCommand
+
+        app = App(args=["readme"])
+        assert app.readme_reader is app.readme_reader
+        assert ReadmeCommand(app, app.args)._reader is app.readme_reader
+
 
 class TestReadmeCommand:
     """Test readme command parsing."""
@@ -454,6 +454,38 @@ class TestEdgeCases:
         assert dates[3] == date(2025, 4, 25)
 
 
+class TestNthWeekdayOfMonth:
+    """Test the day-of-month arithmetic behind simple patterns."""
+
+    def test_matches_relativedelta(self) -> None:
+        """Test against dateutil for every weekday and ordinal over 28 years."""
+        from dateutil.relativedelta import relativedelta, weekdays
+
+        generator = RecurrenceGenerator()
+        month = date(2000, 1, 1)
+        while month.year < 2028:
+            for wd in range(7):
+                for n in (1, 2, 3, 4, 5, -1):
+                    if n == -1:
+                        expected = month + relativedelta(
+                            months=1, days=-1, weekday=weekdays[wd](-1)
+                        )
+                    else:
+                        expected = month + relativedelta(weekday=weekdays[wd](n))
+                    day = generator._nth_weekday_of_month(month.year, month.month, wd, n)
+                    if expected.month == month.month:
+                        assert day == expected.day
+                    else:
+                        assert day is None
+            month = generator._next_month(month)
+
+    def test_next_month_wraps_year(self) -> None:
+        """Test that December is followed by January of the next year."""
+        generator = RecurrenceGenerator()
+        assert generator._next_month(date(2025, 12, 1)) == date(2026, 1, 1)
+        assert generator._next_month(date(2025, 1, 1)) == date(2025, 2, 1)
+
+
 class TestNextOccurrence:
     """Test finding next occurrence after a date."""
 
@@ -516,6 +548,24 @@ class TestPatternSpec:
         assert spec.after_ordinal == 1
         assert spec.after_weekday == TU
 
+    def test_parsed_spec_is_reused(self) -> None:
+        """Test that a pattern is parsed once and its spec can't be changed."""
+        import dataclasses
+
+        generator = RecurrenceGenerator()
+        spec = generator.parse_pattern("first Thursday")
+        assert generator.parse_pattern("first Thursday") is spec
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            spec.ordinal = 2  # type: ignore[misc]
+
+    def test_invalid_pattern_not_cached(self) -> None:
+        """Test that an invalid pattern raises every time."""
+        generator = RecurrenceGenerator()
+        for _ in range(2):
+            with pytest.raises(RecurrenceGenerator.Error):
+                generator.parse_pattern("every Thursday")
+
 
 class TestComplexPatternEdgeCases:
     """Test edge cases in complex patterns."""
@@ -220,6 +220,71 @@ class TestScheduleCommandOutput:
         output = json.loads(captured.out)
         assert output["events"][0]["durationMinutes"] == 120
 
+    def test_json_output_document(
+        self, valid_event_file: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that JSON output is one indented document ending in a newline."""
+        app = App(args=["--dry-run", "schedule", str(valid_event_file), "--output", "json"])
+        app.run()
+
+        captured = capsys.readouterr()
+        output = json.loads(captured.out)
+        assert captured.out == json.dumps(output, indent=2, ensure_ascii=False) + "\n"
+
+    def test_event_to_dict_optional_members(self) -> None:
+        """Test that empty optional members are left out, but not isOnline=False."""
+        from meetup_scheduler.commands.schedule_cmd import ScheduleCommand
+        from meetup_scheduler.scheduler.parser import ParsedEvent
+
+        cmd = ScheduleCommand(App(args=[]), None)  # type: ignore[arg-type]
+        event = ParsedEvent(
+            title="Test Event",
+            start_datetime="2026-03-15T19:00:00-04:00",
+            duration_minutes=120,
+            group_urlname="test-group",
+            description="",
+            is_online=False,
+            event_url="https://example.com",
+        )
+        assert list(cmd._event_to_dict(event)) == [
+            "title",
+            "startDateTime",
+            "durationMinutes",
+            "groupUrlname",
+            "publishStatus",
+            "isOnline",
+            "eventUrl",
+        ]
+        event.is_online = None
+        assert "isOnline" not in cmd._event_to_dict(event)
+
+    def test_event_summary_lines(self) -> None:
+        """Test the lines of one event's summary, with a long description."""
+        from meetup_scheduler.commands.schedule_cmd import ScheduleCommand
+        from meetup_scheduler.scheduler.parser import ParsedEvent
+
+        cmd = ScheduleCommand(App(args=[]), None)  # type: ignore[arg-type]
+        event = ParsedEvent(
+            title="Test Event",
+            start_datetime="2026-03-15T19:00:00-04:00",
+            duration_minutes=120,
+            group_urlname="test-group",
+            description="x" * 101,
+            venue_id="12345",
+        )
+        assert cmd._event_summary_lines(3, event) == [
+            "[3] Test Event",
+            "    Group: test-group",
+            "    Date:  2026-03-15T19:00:00-04:00",
+            "    Duration: 120 minutes",
+            "    Venue: 12345",
+            "    Status: DRAFT",
+            "    Description: " + "x" * 100 + "...",
+            "",
+        ]
+        event.description = "x" * 100
+        assert "    Description: " + "x" * 100 in cmd._event_summary_lines(3, event)
+
 
 class TestScheduleCommandValidation:
     """Test schedule command validation."""
@@ -52,9 +52,7 @@ class TestCallbackServerLifecycle:
         server = CallbackServer(port=18080)
         try:
             server.start()
-            assert server._server is not None
-            assert server._thread is not None
-            assert server._thread.is_alive()
+            assert server._socket is not None
         finally:
             server.stop()
 
@@ -63,7 +61,7 @@ class TestCallbackServerLifecycle:
         server = CallbackServer(port=18081)
         server.start()
         server.stop()
-        assert server._server is None
+        assert server._socket is None
 
     def test_double_start_raises(self) -> None:
         """Test that starting twice raises an error."""
@@ -95,10 +93,48 @@ class TestCallbackServerLifecycle:
                     pytest.fail("Expected port conflict on non-Windows platform")
             except CallbackServer.Error as e:
                 assert "Failed to start" in str(e)
+                assert "--port" in str(e)
         finally:
             server1.stop()
             server2.stop()
 
+    def test_port_zero_uses_assigned_port(self) -> None:
+        """Test that port 0 binds a free port and redirect_uri reports it."""
+        server = CallbackServer(port=0)
+        try:
+            server.start()
+            port = server._socket.getsockname()[1]
+            assert port != 0
+            assert server.redirect_uri == f"http://127.0.0.1:{port}/callback"
+        finally:
+            server.stop()
+
+    def test_restart_on_same_port(self) -> None:
+        """Test that a port just used by a previous login can be bound again."""
+        import socket
+
+        server = CallbackServer(port=18094)
+        server.start()
+        try:
+            def connect() -> None:
+                with socket.create_connection(("127.0.0.1", 18094)) as sock:
+                    sock.sendall(b"GET /callback?code=c HTTP/1.1\r\n\r\n")
+                    sock.recv(4096)
+
+            thread = threading.Thread(target=connect)
+            thread.start()
+            server.wait_for_callback(timeout=5)
+            thread.join()
+        finally:
+            server.stop()
+
+        # The server closed the connection first, leaving it in TIME_WAIT
+        server = CallbackServer(port=18094)
+        try:
+            server.start()
+        finally:
+            server.stop()
+
 
 class TestCallbackServerCallback:
     """Test CallbackServer callback handling."""
@@ -205,15 +241,113 @@ class TestCallbackServerRouting:
     """Test CallbackServer path routing."""
 
     def test_non_callback_path_returns_404(self) -> None:
-        """Test that non-callback paths return 404."""
+        """Test that non-callback paths return 404 and are skipped."""
         server = CallbackServer(port=18090)
         server.start()
+        errors: list[str] = []
         try:
-            # Request to wrong path should return 404
-            try:
-                urlopen("http://127.0.0.1:18090/wrong-path", timeout=5)
-                pytest.fail("Expected 404 error")
-            except Exception as e:
-                assert "404" in str(e)
+            def send_requests() -> None:
+                time.sleep(0.1)
+                # Request to wrong path should return 404
+                try:
+                    urlopen("http://127.0.0.1:18090/wrong-path", timeout=5)
+                except Exception as e:
+                    errors.append(str(e))
+                urlopen("http://127.0.0.1:18090/callback?code=test_code", timeout=5)
+
+            thread = threading.Thread(target=send_requests)
+            thread.start()
+
+            code, _ = server.wait_for_callback(timeout=5)
+            thread.join()
+            assert code == "test_code"
+            assert len(errors) == 1
+            assert "404" in errors[0]
+        finally:
+            server.stop()
+
+    def test_empty_connection_is_skipped(self) -> None:
+        """Test that a connection that sends nothing doesn't stop the wait."""
+        import socket
+
+        server = CallbackServer(port=18091)
+        server.REQUEST_TIMEOUT = 0.2
+        server.start()
+        try:
+            def send_requests() -> None:
+                time.sleep(0.1)
+                # Like a browser preconnect: open, send nothing, close
+                socket.create_connection(("127.0.0.1", 18091)).close()
+                urlopen("http://127.0.0.1:18091/callback?code=test_code", timeout=5)
+
+            thread = threading.Thread(target=send_requests)
+            thread.start()
+
+            code, _ = server.wait_for_callback(timeout=5)
+            thread.join()
+            assert code == "test_code"
+        finally:
+            server.stop()
+
+    def test_success_page_served(self) -> None:
+        """Test that the browser gets the success page."""
+        server = CallbackServer(port=18092)
+        server.start()
+        pages: list[bytes] = []
+        try:
+            def send_callback() -> None:
+                time.sleep(0.1)
+                with urlopen("http://127.0.0.1:18092/callback?code=c", timeout=5) as resp:
+                    pages.append(resp.read())
+
+            thread = threading.Thread(target=send_callback)
+            thread.start()
+            server.wait_for_callback(timeout=5)
+            thread.join()
+            assert b"Authentication Successful" in pages[0]
+        finally:
+            server.stop()
+
+
+class TestCallbackServerResponses:
+    """Test the pre-encoded responses."""
+
+    def test_content_length_matches_body(self) -> None:
+        """Test that each fixed response declares its body length."""
+        for response in (
+            CallbackServer.SUCCESS_RESPONSE,
+            CallbackServer.NOT_FOUND_RESPONSE,
+            CallbackServer.BAD_REQUEST_RESPONSE,
+        ):
+            head, body = response.split(b"\r\n\r\n", 1)
+            assert f"Content-Length: {len(body)}".encode() in head
+            assert b"Connection: close" in head
+            assert b"Server:" not in head
+
+    def test_error_page_escapes_message(self) -> None:
+        """Test that the error page escapes the message from the callback."""
+        import socket
+
+        server = CallbackServer(port=18093)
+        server.start()
+        pages: list[bytes] = []
+        try:
+            def send_callback() -> None:
+                time.sleep(0.1)
+                with socket.create_connection(("127.0.0.1", 18093)) as sock:
+                    sock.sendall(
+                        b"GET /callback?error=x&error_description=%3Cb%3E HTTP/1.1\r\n\r\n"
+                    )
+                    pages.append(sock.makefile("rb").read())
+
+            thread = threading.Thread(target=send_callback)
+            thread.start()
+            with pytest.raises(CallbackServer.Error, match="x: <b>"):
+                server.wait_for_callback(timeout=5)
+            thread.join()
+            head, body = pages[0].split(b"\r\n\r\n", 1)
+            assert head.startswith(b"HTTP/1.0 400")
+            assert f"Content-Length: {len(body)}".encode() in head
+            assert b"&lt;b&gt;" in body
         finally:
             server.stop()
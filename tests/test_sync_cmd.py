@@ -23,6 +23,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from meetup_scheduler.app import App
+from meetup_scheduler.auth.tokens import TokenManager
+from meetup_scheduler.meetup.client import MeetupClient
 
 
 @pytest.fixture
@@ -129,14 +131,16 @@ class TestSyncCommandSuccess:
             }
         ]
 
-        # Mock get_past_events
-        mock_client.get_past_events.return_value = [
-            {
-                "id": "e1",
-                "title": "Event 1",
-                "venue": {"id": "v1", "name": "Venue 1", "city": "NYC"},
-            }
-        ]
+        # Mock get_past_events_batch
+        mock_client.get_past_events_batch.return_value = {
+            "test-group": [
+                {
+                    "id": "e1",
+                    "title": "Event 1",
+                    "venue": {"id": "v1", "name": "Venue 1", "city": "NYC"},
+                }
+            ]
+        }
 
         # Mock extract_venues
         mock_client.extract_venues.return_value = [
@@ -155,8 +159,9 @@ class TestSyncCommandSuccess:
 
         assert result == 0
         mock_client.get_organized_groups.assert_called_once()
-        mock_client.get_past_events.assert_called()
+        mock_client.get_past_events_batch.assert_called_once()
         mock_client.extract_venues.assert_called()
+        mock_client.close.assert_called_once()
 
     def test_sync_saves_groups_to_config(
         self,
@@ -180,7 +185,7 @@ class TestSyncCommandSuccess:
                 "timezone": "America/New_York",
             }
         ]
-        mock_client.get_past_events.return_value = []
+        mock_client.get_past_events_batch.return_value = {"test-group": []}
         mock_client.extract_venues.return_value = []
 
         with (
@@ -224,7 +229,7 @@ class TestSyncCommandSpecificGroup:
             {"id": "g1", "name": "Group 1", "urlname": "group-1", "timezone": "UTC"},
             {"id": "g2", "name": "Group 2", "urlname": "group-2", "timezone": "UTC"},
         ]
-        mock_client.get_past_events.return_value = []
+        mock_client.get_past_events_batch.return_value = {"group-1": []}
         mock_client.extract_venues.return_value = []
 
         with (
@@ -238,10 +243,10 @@ class TestSyncCommandSpecificGroup:
             result = app.run()
 
         assert result == 0
-        # Should only call get_past_events for group-1
-        calls = mock_client.get_past_events.call_args_list
-        assert len(calls) == 1
-        assert calls[0][0][0] == "group-1"
+        # Should only fetch events for group-1
+        mock_client.get_past_events_batch.assert_called_once_with(
+            ["group-1"], years=2, since={}, complete=set()
+        )
 
 
 class TestSyncCommandNoGroups:
@@ -385,9 +390,9 @@ class TestSyncCommandVenuesOnly:
 
         mock_client_class = MagicMock()
         mock_client = mock_client_class.return_value
-        mock_client.get_past_events.return_value = [
-            {"id": "e1", "venue": {"id": "v1", "name": "Test Venue"}}
-        ]
+        mock_client.get_past_events_batch.return_value = {
+            "configured-group": [{"id": "e1", "venue": {"id": "v1", "name": "Test Venue"}}]
+        }
         mock_client.extract_venues.return_value = [
             {"id": "v1", "name": "Test Venue"}
         ]
@@ -405,8 +410,10 @@ class TestSyncCommandVenuesOnly:
         assert result == 0
         # Should NOT call get_organized_groups in venues-only mode
         mock_client.get_organized_groups.assert_not_called()
-        # Should call get_past_events for configured group
-        mock_client.get_past_events.assert_called()
+        # Should fetch events for configured group
+        mock_client.get_past_events_batch.assert_called_once_with(
+            ["configured-group"], years=2, since={}, complete=set()
+        )
 
     def test_sync_venues_only_no_configured_groups_returns_error(
         self,
@@ -453,7 +460,7 @@ class TestSyncCommandVenuesOnly:
 
         mock_client_class = MagicMock()
         mock_client = mock_client_class.return_value
-        mock_client.get_past_events.return_value = []
+        mock_client.get_past_events_batch.return_value = {"group-1": []}
         mock_client.extract_venues.return_value = []
 
         with (
@@ -467,10 +474,10 @@ class TestSyncCommandVenuesOnly:
             result = app.run()
 
         assert result == 0
-        # Should only call get_past_events for group-1
-        calls = mock_client.get_past_events.call_args_list
-        assert len(calls) == 1
-        assert calls[0][0][0] == "group-1"
+        # Should only fetch events for group-1
+        mock_client.get_past_events_batch.assert_called_once_with(
+            ["group-1"], years=2, since={}, complete=set()
+        )
 
 
 class TestSyncCommandVenueErrors:
@@ -500,11 +507,10 @@ class TestSyncCommandVenueErrors:
         # Attach it to the mock client class so sync_cmd can catch it
         mock_client_class.Error = MockMeetupError
 
-        # First group fails, second succeeds
-        mock_client.get_past_events.side_effect = [
-            MockMeetupError("API error for group-1"),
-            [{"id": "e1", "venue": {"id": "v1", "name": "Venue"}}],
-        ]
+        # First group isn't found, second succeeds
+        mock_client.get_past_events_batch.return_value = {
+            "group-2": [{"id": "e1", "venue": {"id": "v1", "name": "Venue"}}],
+        }
         mock_client.extract_venues.return_value = [{"id": "v1", "name": "Venue"}]
 
         with (
@@ -519,8 +525,47 @@ class TestSyncCommandVenueErrors:
 
         # Should still succeed overall
         assert result == 0
-        # Should have tried both groups
-        assert mock_client.get_past_events.call_count == 2
+        # Should have tried both groups, and used the one that was found
+        mock_client.get_past_events_batch.assert_called_once_with(
+            ["group-1", "group-2"], years=2, since={}, complete=set()
+        )
+        mock_client.extract_venues.assert_called_once()
+
+    def test_sync_batch_fetch_error_continues(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_oauth_env: None,
+        mock_credentials: Path,
+    ) -> None:
+        """Test that a failed batched event fetch doesn't fail the sync."""
+        monkeypatch.chdir(tmp_path)
+
+        mock_client_class = MagicMock()
+        mock_client = mock_client_class.return_value
+        mock_client.get_organized_groups.return_value = [
+            {"id": "g1", "name": "Group 1", "urlname": "group-1", "timezone": "UTC"},
+        ]
+
+        class MockMeetupError(Exception):
+            pass
+
+        mock_client_class.Error = MockMeetupError
+        mock_client.get_past_events_batch.side_effect = MockMeetupError("Rate limited")
+
+        with (
+            patch("platformdirs.user_config_dir", return_value=str(mock_credentials)),
+            patch(
+                "meetup_scheduler.commands.sync_cmd.MeetupClient",
+                mock_client_class,
+            ),
+        ):
+            app = App(args=["-q", "sync"])
+            result = app.run()
+
+        assert result == 0
+        mock_client.get_past_events_batch.assert_called_once()
+        mock_client.extract_venues.assert_not_called()
 
 
 class TestSyncCommandVerboseOutput:
@@ -542,7 +587,7 @@ class TestSyncCommandVerboseOutput:
         mock_client.get_organized_groups.return_value = [
             {"id": "g1", "name": "Test Group", "urlname": "test-group", "timezone": "UTC"},
         ]
-        mock_client.get_past_events.return_value = []
+        mock_client.get_past_events_batch.return_value = {"test-group": []}
         mock_client.extract_venues.return_value = []
 
         with (
@@ -577,10 +622,12 @@ class TestSyncCommandVerboseOutput:
         mock_client.get_organized_groups.return_value = [
             {"id": "g1", "name": "Group", "urlname": "group", "timezone": "UTC"},
         ]
-        mock_client.get_past_events.return_value = [
-            {"id": "e1", "venue": {"id": "v1", "name": "V1"}},
-            {"id": "e2", "venue": {"id": "v2", "name": "V2"}},
-        ]
+        mock_client.get_past_events_batch.return_value = {
+            "group": [
+                {"id": "e1", "venue": {"id": "v1", "name": "V1"}},
+                {"id": "e2", "venue": {"id": "v2", "name": "V2"}},
+            ]
+        }
         mock_client.extract_venues.return_value = [
             {"id": "v1", "name": "V1"},
             {"id": "v2", "name": "V2"},
@@ -600,3 +647,120 @@ class TestSyncCommandVerboseOutput:
         captured = capsys.readouterr()
         # Should show venue count
         assert "2" in captured.out  # 2 venues
+
+
+class TestSyncCommandBatchedFetch:
+    """Test merging the venues of a batched event fetch."""
+
+    def test_venues_merged_in_group_order(self) -> None:
+        """Test that a venue found in two groups is taken from the first."""
+        from meetup_scheduler.commands.sync_cmd import SyncCommand
+
+        client = MagicMock()
+        # The result may list the groups in any order
+        client.get_past_events_batch.return_value = {
+            "second": [
+                {"venue": {"id": "shared", "name": "From second"}},
+                {"venue": {"id": "other", "name": "Other"}},
+            ],
+            "first": [{"venue": {"id": "shared", "name": "From first"}}],
+        }
+
+        app = App(args=["-q", "sync"])
+        cmd = SyncCommand(app, app.args)
+        updates: dict = {}
+        with MeetupClient("token") as real_client:
+            client.extract_venues.side_effect = real_client.extract_venues
+            venues = cmd._sync_venues(
+                client, [{"urlname": "first"}, {"urlname": "second"}], 2, updates, full=True
+            )
+
+        assert [v["name"] for v in venues] == ["From first", "Other"]
+        assert list(updates) == ["venues"]
+
+
+class TestSyncCommandIncremental:
+    """Test incremental syncs from each group's event watermark."""
+
+    SAVED_CONFIG = {
+        "groups": {
+            "group": {"urlname": "group", "lastEventSync": "2025-01-15T19:00:00-05:00"},
+        },
+        "venues": {
+            "old": {"id": "old", "name": "Old Venue"},
+            "moved": {"id": "moved", "name": "Moved Venue", "city": "Before"},
+        },
+    }
+
+    NEW_EVENTS = [
+        {
+            "dateTime": "2025-02-01T19:00:00-05:00",
+            "venue": {"id": "moved", "name": "Moved Venue", "city": "After"},
+        },
+        {"dateTime": "2025-01-20T19:00:00-05:00", "venue": {"id": "new", "name": "New"}},
+    ]
+
+    def _sync(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        *options: str,
+        fetch_complete: bool = True,
+    ) -> tuple[MagicMock, dict]:
+        """Run a venues-only sync against saved config; return client and new config."""
+        monkeypatch.chdir(tmp_path)
+        config_file = tmp_path / "meetup-scheduler-local.json"
+        config_file.write_text(json.dumps(self.SAVED_CONFIG))
+
+        def get_past_events_batch(urlnames, years, since, complete=None):
+            if complete is not None and fetch_complete:
+                complete.update(urlnames)
+            return {"group": self.NEW_EVENTS}
+
+        mock_client_class = MagicMock()
+        mock_client = mock_client_class.return_value
+        mock_client.get_past_events_batch.side_effect = get_past_events_batch
+        with MeetupClient("token") as real_client:
+            mock_client.extract_venues.side_effect = real_client.extract_venues
+
+        with (
+            patch("platformdirs.user_config_dir", return_value=str(tmp_path / "config")),
+            patch.object(TokenManager, "is_authenticated", True),
+            patch.object(TokenManager, "get_access_token", return_value="token"),
+            patch("meetup_scheduler.commands.sync_cmd.MeetupClient", mock_client_class),
+        ):
+            result = App(args=["-q", "sync", "--venues-only", *options]).run()
+
+        assert result == 0
+        return mock_client, json.loads(config_file.read_text())
+
+    def test_fetches_since_watermark(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that only new events are fetched, and their venues are merged in."""
+        mock_client, config = self._sync(tmp_path, monkeypatch)
+
+        since = mock_client.get_past_events_batch.call_args.kwargs["since"]
+        assert since == {"group": datetime.fromisoformat("2025-01-15T19:00:00-05:00")}
+        assert set(config["venues"]) == {"old", "moved", "new"}
+        assert config["venues"]["moved"]["city"] == "After"
+        assert config["groups"]["group"]["lastEventSync"] == "2025-02-01T19:00:00-05:00"
+
+    def test_partial_fetch_keeps_watermark(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a group whose paging stopped early keeps its old watermark."""
+        _, config = self._sync(tmp_path, monkeypatch, fetch_complete=False)
+
+        assert set(config["venues"]) == {"old", "moved", "new"}
+        assert config["groups"]["group"]["lastEventSync"] == "2025-01-15T19:00:00-05:00"
+
+    def test_full_sync_replaces_venues(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that --full ignores the watermark and the saved venues."""
+        mock_client, config = self._sync(tmp_path, monkeypatch, "--full")
+
+        assert mock_client.get_past_events_batch.call_args.kwargs["since"] == {}
+        assert set(config["venues"]) == {"moved", "new"}
+        assert config["groups"]["group"]["lastEventSync"] == "2025-02-01T19:00:00-05:00"
@@ -266,3 +266,85 @@ class TestTokenManagerExpiration:
         # If refresh was attempted, this would fail
         result = token_manager.get_access_token()
         assert result == "valid_token"
+
+
+class TestTokenManagerCredentialsCache:
+    """Test caching of the parsed credentials file."""
+
+    def test_unchanged_file_read_once(
+        self, token_manager: TokenManager, config_manager: ConfigManager
+    ) -> None:
+        """Test that repeated queries parse credentials.json only once."""
+        config_manager.save_credentials({"access_token": "test"})
+        with patch.object(
+            config_manager, "load_credentials", wraps=config_manager.load_credentials
+        ) as mock_load:
+            assert token_manager.has_tokens is True
+            assert token_manager.is_authenticated is True
+            assert token_manager.get_access_token() == "test"
+        assert mock_load.call_count == 1
+
+    def test_external_change_detected(
+        self, token_manager: TokenManager, config_manager: ConfigManager
+    ) -> None:
+        """Test that a credentials file changed by another process is reread."""
+        import os
+
+        config_manager.save_credentials({"access_token": "old"})
+        assert token_manager.get_access_token() == "old"
+
+        config_manager.credentials_path.write_text('{"access_token": "newer"}')
+        st = config_manager.credentials_path.stat()
+        os.utime(config_manager.credentials_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+        assert token_manager.get_access_token() == "newer"
+
+    def test_clear_tokens_invalidates(
+        self, token_manager: TokenManager, config_manager: ConfigManager
+    ) -> None:
+        """Test that clearing tokens isn't hidden by the cache."""
+        config_manager.save_credentials({"access_token": "test"})
+        assert token_manager.has_tokens is True
+        token_manager.clear_tokens()
+        assert token_manager.has_tokens is False
+
+    def test_save_tokens_invalidates(self, token_manager: TokenManager) -> None:
+        """Test that saved tokens are visible immediately."""
+        assert token_manager.has_tokens is False
+        token_manager.save_tokens({"access_token": "saved", "expires_in": 3600})
+        assert token_manager.get_access_token() == "saved"
+
+
+class TestAuthPackageExports:
+    """Test the lazily imported exports of meetup_scheduler.auth."""
+
+    def test_exports_resolve(self) -> None:
+        """Test that the package exports resolve to the submodule classes."""
+        import meetup_scheduler.auth as auth
+        from meetup_scheduler.auth.oauth import OAuthFlow
+        from meetup_scheduler.auth.server import CallbackServer
+
+        assert auth.OAuthFlow is OAuthFlow
+        assert auth.CallbackServer is CallbackServer
+        assert auth.TokenManager is TokenManager
+
+    def test_unknown_attribute(self) -> None:
+        """Test that unknown names raise AttributeError."""
+        import meetup_scheduler.auth as auth
+
+        with pytest.raises(AttributeError):
+            _ = auth.NoSuchThing
+
+    def test_tokens_import_is_light(self) -> None:
+        """Test that importing tokens doesn't load the OAuth client or server."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, meetup_scheduler.auth.tokens; "
+            "print('meetup_scheduler.auth.oauth' in sys.modules, "
+            "'meetup_scheduler.auth.server' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.split() == ["False", "False"]